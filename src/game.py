@@ -18,7 +18,8 @@ from ui.help_scene import HelpScene
 from game_state import GameState
 from utils.logging_config import configure_logging, log_error
 from models.game_session import GameSession
-from models.ai_player import AIPlayer
+from models.ai_player import (AIPlayer, shutdown_worker_pool,
+                              warm_process_pool)
 from network.connection import NetworkConnection
 from network.message import encode_message
 from utils.settings_manager import settings_manager
@@ -82,6 +83,7 @@ class Game:
             self._theme_debug_overlay = None
             settings_manager.subscribe("DEBUG", self._on_debug_changed)
             self._init_theme_debug_overlay()
+            warm_process_pool()
 
             logger.debug("Game initialized successfully")
 
@@ -124,6 +126,7 @@ class Game:
         """
         try:
             self._cleanup_previous_game()
+            shutdown_worker_pool()
             pygame.quit()
             logger.debug("Game quit successfully")
             exit()
@@ -148,6 +151,7 @@ class Game:
 
             if self._game_session:
                 logger.debug("Clearing game session...")
+                self._cancel_ai_work("game ended")
                 self._game_session.on_turn_ended = None
                 self._game_session = None
             self._conn_player_index = {}
@@ -392,6 +396,7 @@ class Game:
             data: Serialized game state data
         """
         try:
+            self._cancel_ai_work("session replaced")
             self._game_session = GameSession.deserialize(data)
             self._game_session.on_turn_ended = self._on_turn_ended
             self._game_session.on_show_notification = self._on_show_notification
@@ -478,6 +483,7 @@ class Game:
                     }
                     for player in self._game_session.get_players()
                 }
+            self._cancel_ai_work("session replaced")
             self._game_session = GameSession.deserialize(data)
             self._game_session.on_turn_ended = self._on_turn_ended
             self._game_session.on_show_notification = self._on_show_notification
@@ -520,6 +526,7 @@ class Game:
             data: Serialized game state from client
         """
         try:
+            self._cancel_ai_work("session replaced")
             self._game_session = GameSession.deserialize(data)
             self._game_session.on_turn_ended = self._on_turn_ended
             self._game_session.on_show_notification = self._on_show_notification
@@ -554,6 +561,7 @@ class Game:
         try:
             logger.debug("Client received start game message from host")
             if "game_session" in data:
+                self._cancel_ai_work("session replaced")
                 self._game_session = GameSession.deserialize(
                     data["game_session"])
                 self._game_session.on_turn_ended = self._on_turn_ended
@@ -573,6 +581,7 @@ class Game:
             data: Serialized game state data
         """
         try:
+            self._cancel_ai_work("session replaced")
             self._game_session = GameSession.deserialize(data)
             self._game_session.on_turn_ended = self._on_turn_ended
             self._game_session.on_show_notification = self._on_show_notification
@@ -727,6 +736,22 @@ class Game:
         """
         return self._game_session
 
+    def _cancel_ai_work(self, reason: str) -> None:
+        """
+        Cancel the background work of the AI players of the current session.
+        
+        Called before the session is replaced, so searches and ponder
+        passes on the old session stop instead of running to their end.
+        
+        Args:
+            reason: Cancellation reason for the AI worker metrics
+        """
+        if not self._game_session:
+            return
+        for player in self._game_session.get_players():
+            if isinstance(player, AIPlayer):
+                player.cancel_work(reason)
+
     def _on_client_disconnected(self, conn) -> None:
         """
         Handle client disconnection (host mode).
@@ -768,6 +793,8 @@ class Game:
                 difficulty = "HARD"
             elif ai_name.startswith("AI_EXPERT_"):
                 difficulty = "EXPERT"
+            elif ai_name.startswith("AI_MCTS_"):
+                difficulty = "MCTS"
             elif ai_name.startswith("AI_NORMAL_"):
                 difficulty = "NORMAL"
 
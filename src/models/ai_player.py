@@ -1,18 +1,386 @@
+import atexit
+import json
 import logging
+import multiprocessing
+import os
 import random
 import threading
 import typing
 import time
-from typing import List, Tuple, Optional, Dict, Any
+import weakref
+from concurrent.futures import (FIRST_COMPLETED, Future, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
+from typing import List, Optional, Dict, Any
 
 from models.player import Player
 from models.figure import Figure
 from models.card import Card
+from models.endgame import EndgameSolver
+from models.mcts import MCTSSearch, is_legal_move, unfinished_value
+from models.move import Move, Placement
+from models.placement_scoring import (joined_structures, meeple_score_bound,
+                                      score_meeple_spots, score_placements)
+from models.structure_stats import StructureStats
+from models.transposition_cache import (TranspositionCache,
+                                        structure_dependencies)
 
 from utils.settings_manager import settings_manager
 
 logger = logging.getLogger(__name__)
 
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+_PROCESS_POOL_WORKERS = 0
+_PROCESS_POOL_LOCK = threading.Lock()
+# Session deserialized by a pool process, reused by later shards of a turn.
+_PROCESS_SNAPSHOT: Dict[str, Any] = {"key": None, "session": None}
+# Seconds between cancellation checks while waiting for pool shards.
+PROCESS_POLL_SECONDS = 0.01
+
+# Threads shared by the searches and ponder passes of every AI player.
+WORKER_THREADS = 8
+_WORKER_POOL: Optional[ThreadPoolExecutor] = None
+_WORKER_POOL_LOCK = threading.Lock()
+_WORKER_TOKENS: "weakref.WeakSet[CancellationToken]" = weakref.WeakSet()
+_WORKER_METRICS: Dict[str, Any] = {}
+# Directory that relative AI_TUNED_PRESETS paths are resolved against.
+TUNED_PRESETS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Presets of the AI_TUNED_PRESETS file by resolved path, read once per process.
+_TUNED_PRESETS: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+
+def get_process_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Return the shared process pool, creating or resizing it on demand.
+
+    Processes are started with the ``spawn`` method so that they do not
+    inherit the pygame window or the threads of the running game.
+
+    Args:
+        workers: Number of worker processes
+
+    Returns:
+        Shared ProcessPoolExecutor
+    """
+    global _PROCESS_POOL, _PROCESS_POOL_WORKERS
+    with _PROCESS_POOL_LOCK:
+        if _PROCESS_POOL is None or _PROCESS_POOL_WORKERS != workers:
+            if _PROCESS_POOL is not None:
+                _PROCESS_POOL.shutdown(wait=False, cancel_futures=True)
+            _PROCESS_POOL = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"))
+            _PROCESS_POOL_WORKERS = workers
+        return _PROCESS_POOL
+
+
+def process_worker_count() -> int:
+    """
+    Get the number of pool processes from AI_PROCESS_WORKERS.
+
+    0 keeps evaluation in the worker thread and -1 uses every core but
+    one, which is left to the render loop.
+    """
+    configured_workers = settings_manager.get("AI_PROCESS_WORKERS", 0)
+    try:
+        workers = int(configured_workers)
+    except (TypeError, ValueError):
+        logger.warning(
+            f"Invalid AI_PROCESS_WORKERS value '{configured_workers}', falling back to 0"
+        )
+        return 0
+    if workers < 0:
+        workers = (os.cpu_count() or 1) - 1
+    return max(workers, 0)
+
+
+def _warm_up_process() -> None:
+    """Import the modules a pool process scores placements with."""
+    import models.game_session  # noqa: F401
+
+
+def warm_process_pool() -> None:
+    """
+    Start the processes of AI_PROCESS_WORKERS ahead of the first AI turn.
+
+    Spawning the pool takes about a second, which would otherwise be spent
+    inside the budget of the first turn scored in processes. The processes
+    start in the background; this call does not wait for them.
+    """
+    workers = process_worker_count()
+    if workers <= 1:
+        return
+    pool = get_process_pool(workers)
+    for _ in range(workers):
+        pool.submit(_warm_up_process)
+
+
+settings_manager.subscribe("AI_PROCESS_WORKERS",
+                           lambda key, old_value, new_value: warm_process_pool())
+
+
+def shutdown_process_pool() -> None:
+    """Stop the shared process pool if it was started."""
+    global _PROCESS_POOL, _PROCESS_POOL_WORKERS
+    with _PROCESS_POOL_LOCK:
+        if _PROCESS_POOL is not None:
+            _PROCESS_POOL.shutdown(wait=False, cancel_futures=True)
+            _PROCESS_POOL = None
+            _PROCESS_POOL_WORKERS = 0
+
+
+atexit.register(shutdown_process_pool)
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation of background AI work.
+
+    Workers check ``is_cancelled`` between candidates and return early; the
+    reason and the time of the cancellation end up in ``get_worker_metrics``.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+        self.cancelled_at: Optional[float] = None
+
+    def cancel(self, reason: str = "stopped") -> None:
+        """Ask the work to stop; only the first reason is kept."""
+        if not self._event.is_set():
+            self.reason = reason
+            self.cancelled_at = time.perf_counter()
+            self._event.set()
+
+    def is_cancelled(self) -> bool:
+        """Check whether the work should stop."""
+        return self._event.is_set()
+
+
+def _reset_worker_metrics() -> None:
+    _WORKER_METRICS.update(submitted=0,
+                           completed=0,
+                           cancelled=0,
+                           skipped=0,
+                           failed=0,
+                           cancelled_ms=0.0,
+                           cancel_latency_ms=0.0,
+                           max_cancel_latency_ms=0.0,
+                           reasons={})
+
+
+_reset_worker_metrics()
+
+
+def get_worker_pool() -> ThreadPoolExecutor:
+    """Return the shared thread pool of AI workers, creating it on demand."""
+    global _WORKER_POOL
+    with _WORKER_POOL_LOCK:
+        if _WORKER_POOL is None:
+            _WORKER_POOL = ThreadPoolExecutor(max_workers=WORKER_THREADS,
+                                              thread_name_prefix="ai-worker")
+        return _WORKER_POOL
+
+
+def submit_worker(token: CancellationToken, target: typing.Callable,
+                  *args: Any) -> Future:
+    """
+    Run AI work in the shared thread pool under a cancellation token.
+
+    Work cancelled while queued is skipped. Work that returns after its
+    token was cancelled counts as cancelled, with its wall time and the
+    delay between the cancellation and the return.
+
+    Args:
+        token: Token the work checks
+        target: Worker function
+        *args: Arguments of the worker function
+
+    Returns:
+        Future of the work
+    """
+    with _WORKER_POOL_LOCK:
+        _WORKER_METRICS["submitted"] += 1
+        _WORKER_TOKENS.add(token)
+    return get_worker_pool().submit(_run_worker, token, target, args)
+
+
+def _run_worker(token: CancellationToken, target: typing.Callable,
+                args: tuple) -> None:
+    """Run one job of ``submit_worker`` and record its outcome."""
+    started = time.perf_counter()
+    if token.is_cancelled():
+        with _WORKER_POOL_LOCK:
+            _WORKER_METRICS["skipped"] += 1
+            _count_cancel_reason(token)
+        return
+    failed = False
+    try:
+        target(*args)
+    except Exception:
+        # Nothing reads the future, so an exception left in it is lost.
+        failed = True
+        logger.exception(
+            f"AI worker {getattr(target, '__name__', target)} failed")
+    finally:
+        finished = time.perf_counter()
+        with _WORKER_POOL_LOCK:
+            if failed:
+                _WORKER_METRICS["failed"] += 1
+            elif token.is_cancelled():
+                latency = max(finished - token.cancelled_at, 0.0) * 1000.0
+                _WORKER_METRICS["cancelled"] += 1
+                _WORKER_METRICS["cancelled_ms"] += (finished -
+                                                    started) * 1000.0
+                _WORKER_METRICS["cancel_latency_ms"] += latency
+                _WORKER_METRICS["max_cancel_latency_ms"] = max(
+                    _WORKER_METRICS["max_cancel_latency_ms"], latency)
+                _count_cancel_reason(token)
+            else:
+                _WORKER_METRICS["completed"] += 1
+
+
+def _count_cancel_reason(token: CancellationToken) -> None:
+    reasons = _WORKER_METRICS["reasons"]
+    reasons[token.reason] = reasons.get(token.reason, 0) + 1
+
+
+def get_worker_metrics() -> Dict[str, Any]:
+    """
+    Get counters of the AI work run through ``submit_worker``.
+
+    Returns:
+        Dictionary with the submitted, completed, cancelled, skipped and
+        failed jobs, the wall time spent in cancelled jobs, the summed and maximum
+        delay between a cancellation and the job returning (all in ms) and
+        the cancellations per reason
+    """
+    with _WORKER_POOL_LOCK:
+        metrics = dict(_WORKER_METRICS)
+        metrics["reasons"] = dict(_WORKER_METRICS["reasons"])
+        return metrics
+
+
+def shutdown_worker_pool(reason: str = "shutdown") -> None:
+    """Cancel all AI work and stop the shared thread pool."""
+    global _WORKER_POOL
+    with _WORKER_POOL_LOCK:
+        tokens = list(_WORKER_TOKENS)
+        pool = _WORKER_POOL
+        _WORKER_POOL = None
+    for token in tokens:
+        token.cancel(reason)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _score_placement_shard(snapshot_key: tuple, snapshot: Dict[str, Any],
+                           player_index: int, preset: Dict[str, Any],
+                           game_phase: str, shard: list) -> list:
+    """
+    Score a shard of placements in a pool process.
+
+    Args:
+        snapshot_key: Identifies the snapshot so a process deserializes it once
+        snapshot: Serialized game session
+        player_index: Index of the AI player to score for
+        preset: Preset of the AI player, which may differ from the
+            difficulty default after ``set_preset``
+        game_phase: Game phase of the AI player
+        shard: List of (index, x, y, rotation) placements
+
+    Returns:
+        List of (index, strategic score) pairs
+    """
+    from models.game_session import GameSession
+
+    if _PROCESS_SNAPSHOT["key"] != snapshot_key:
+        _PROCESS_SNAPSHOT["session"] = GameSession.deserialize(snapshot)
+        _PROCESS_SNAPSHOT["key"] = snapshot_key
+    game_session = _PROCESS_SNAPSHOT["session"]
+    ai_player = next(player for player in game_session.get_players()
+                     if player.get_index() == player_index)
+    ai_player._game_phase = game_phase
+    definition = game_session.get_current_card().get_definition()
+
+    scores = score_placements(game_session, ai_player, preset, game_phase,
+                              [(x, y, rotation, definition)
+                               for _, x, y, rotation in shard])
+    return [(entry[0], score) for entry, score in zip(shard, scores)]
+
+
+def load_tuned_presets(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the presets of a JSON file written by ``tuning.write_preset_file``.
+
+    A relative path is resolved against ``TUNED_PRESETS_DIR``, not the
+    working directory. Every file is read once per process. Presets that
+    do not have the keys of the built-in preset of their difficulty are
+    skipped.
+
+    Args:
+        path: Path of the file, "" for none
+
+    Returns:
+        Preset dictionaries by difficulty name, empty when the file does
+        not exist or cannot be loaded
+    """
+    if not path:
+        return {}
+    path = os.path.join(TUNED_PRESETS_DIR, path)
+    if path in _TUNED_PRESETS:
+        return _TUNED_PRESETS[path]
+
+    presets = {}
+    try:
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        for difficulty, preset in data.get("presets", {}).items():
+            builtin = getattr(AIPreset, str(difficulty).upper(), None)
+            if (not isinstance(builtin, dict) or not isinstance(preset, dict)
+                    or sorted(preset) != sorted(builtin)):
+                logger.warning(
+                    f"Ignoring tuned preset {difficulty!r} in {path}: keys do not match AIPreset"
+                )
+                continue
+            presets[str(difficulty).upper()] = preset
+        logger.info(f"Loaded tuned AI presets {sorted(presets)} from {path}")
+    except Exception as e:
+        logger.warning(f"Failed to load tuned AI presets from {path}: {e}")
+    _TUNED_PRESETS[path] = presets
+    return presets
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the anytime search when it must give up a depth."""
+
+
+class _TurnSnapshot:
+    """
+    Copy of the session shared by the search stages of one turn.
+
+    The copy is deserialized when a stage first needs it. Every stage
+    restores it with ``undo``, so the next stage finds the same position.
+    """
+
+    def __init__(self, game_session: 'GameSession') -> None:
+        self._source = game_session
+        self._session: Optional['GameSession'] = None
+
+    def get(self) -> 'GameSession':
+        """Get the copy, deserializing it on the first call."""
+        if self._session is None:
+            self._session = type(self._source).deserialize(
+                self._source.serialize())
+        return self._session
+
+
+class _PonderedPlacement(typing.NamedTuple):
+    """Evaluation of a placement computed while other players moved."""
+    strategic_score: float
+    simulated_score: float
+    area_hash: int  # tiles around the cell when pondered
+    dependencies: tuple  # structure map keys of the joined structures
+
 
 class AIPreset:
     """Configuration presets for different AI difficulty levels."""
@@ -33,7 +401,8 @@ class AIPreset:
         "field_bonuses": [10, 20, 30],
         "city_bonuses": [30, 50, 70],
         "road_bonuses": [25, 40, 55],
-        "monastery_bonuses": [60, 90, 120]
+        "monastery_bonuses": [60, 90, 120],
+        "search_depth": 1
     }
 
     NORMAL = {
@@ -52,7 +421,8 @@ class AIPreset:
         "field_bonuses": [15, 25, 35],
         "city_bonuses": [40, 60, 80],
         "road_bonuses": [30, 45, 60],
-        "monastery_bonuses": [80, 120, 160]
+        "monastery_bonuses": [80, 120, 160],
+        "search_depth": 1
     }
 
     HARD = {
@@ -71,7 +441,8 @@ class AIPreset:
         "field_bonuses": [20, 30, 40],
         "city_bonuses": [50, 70, 90],
         "road_bonuses": [35, 50, 65],
-        "monastery_bonuses": [100, 150, 200]
+        "monastery_bonuses": [100, 150, 200],
+        "search_depth": 2
     }
 
     EXPERT = {
@@ -90,7 +461,8 @@ class AIPreset:
         "field_bonuses": [25, 35, 45],
         "city_bonuses": [60, 80, 100],
         "road_bonuses": [40, 55, 70],
-        "monastery_bonuses": [120, 180, 240]
+        "monastery_bonuses": [120, 180, 240],
+        "search_depth": 3
     }
 
 
@@ -107,6 +479,8 @@ class AIPlayer(Player):
     - NORMAL: Balanced approach, good mix of completion and expansion
     - HARD: Aggressive play, prioritizes quick completions and meeple liberation
     - EXPERT: Advanced strategies, sophisticated evaluation with multi-turn planning
+    - MCTS: Monte Carlo Tree Search over whole turns within AI_MCTS_BUDGET_MS,
+      scoring heuristics fall back to the NORMAL preset
     
     Key Preset Parameters:
     - completion_bonus: Points awarded for completing structures (higher = more completion-focused)
@@ -129,11 +503,27 @@ class AIPlayer(Player):
     Advanced Parameters:
     - size_penalties: Penalties for structures that tie up meeples [small, medium, large]
     - completion_ratio_bonuses: Bonuses based on completion percentage [25%, 50%, 75%, 100%]
+    - search_depth: Plies searched by the anytime search within AI_TURN_BUDGET_MS
+      (1 = heuristic only, 2 = also the expected reply of the next player, ...)
     
     The AI adapts its strategy based on game phase (early/mid/late) and uses these
     preset values to evaluate card placements, meeple placements, and overall game strategy.
     """
 
+    # Tiles averaged over at each chance node of the anytime search.
+    SEARCH_CHANCE_BRANCHES = 4
+    # Heuristic points worth one point of expected score margin.
+    SEARCH_MARGIN_WEIGHT = 10.0
+    # Factor on the projected time of the next search depth; the board
+    # grows during the search, so each depth branches more than the last.
+    SEARCH_DEPTH_SAFETY = 2.0
+    # Most frequent remaining tiles evaluated while pondering.
+    PONDER_TILES = 4
+    # Weight of the meeple spot score in the value of a joint action.
+    JOINT_MEEPLE_WEIGHT = 1.0
+    # Seconds play_turn waits per frame for a stopped worker to return.
+    WORKER_STOP_WAIT_S = 0.05
+
     def __init__(self,
                  name: str,
                  index: int,
@@ -146,7 +536,7 @@ class AIPlayer(Player):
             name: The player's name
             index: The player's index in the game
             color: The player's color
-            difficulty: AI difficulty level (EASY, NORMAL, HARD, EXPERT)
+            difficulty: AI difficulty level (EASY, NORMAL, HARD, EXPERT, MCTS)
         """
         super().__init__(name, color, index, is_ai=True)
         self._game_phase = "early"
@@ -167,36 +557,69 @@ class AIPlayer(Player):
         self._figure_cache_valid = False
         self._cache_lock = threading.Lock()
         self._worker_cache_context = threading.local()
+        self._structure_stats: Optional[StructureStats] = None
+        self._transpositions = TranspositionCache(
+            self._get_evaluation_cache_size())
 
-        self._worker_thread = None
+        self._worker_future: Optional[Future] = None
         self._worker_lock = threading.Lock()
         self._worker_result = None
         self._worker_progress = 0.0
         self._worker_running = False
         self._worker_turn_token = 0
+        self._search_token = CancellationToken()
+        self._search_turn_state = None
+        self._search_started = 0.0
+        self._search_deadline = 0.0
+
+        self._ponder_token = CancellationToken()
+        self._ponder_turn_id = None
+        self._ponder_cache: Optional[Dict[str, Any]] = None
+
+        self._nodes_evaluated = 0
 
     def _get_preset(self) -> Dict[str, Any]:
-        """Get the AI preset configuration for the current difficulty."""
-        if self._difficulty == "EASY":
-            return AIPreset.EASY
-        elif self._difficulty == "HARD":
-            return AIPreset.HARD
-        elif self._difficulty == "EXPERT":
-            return AIPreset.EXPERT
+        """
+        Get the AI preset configuration for the current difficulty.
+
+        A preset of the AI_TUNED_PRESETS file replaces the built-in one.
+        """
+        if self._difficulty in ("EASY", "HARD", "EXPERT"):
+            name = self._difficulty
         else:
-            return AIPreset.NORMAL
+            name = "NORMAL"
+        tuned = load_tuned_presets(
+            settings_manager.get("AI_TUNED_PRESETS", ""))
+        if name in tuned:
+            return dict(tuned[name])
+        return getattr(AIPreset, name)
+
+    def set_preset(self, preset: Dict[str, Any]) -> None:
+        """
+        Replace the difficulty preset, e.g. with tuned weights.
+
+        Args:
+            preset: AIPreset dictionary with the keys of ``AIPreset.NORMAL``
+        """
+        self._preset = dict(preset)
+        self._invalidate_evaluation_cache()
+        self._invalidate_figure_cache()
+        self._transpositions.clear()
 
     def play_turn(self, game_session: 'GameSession') -> None:
         """
         Perform the AI's turn logic with configurable strategy.
         
         The AI will either use simple placement logic or advanced simulation
-        based on the AI_USE_SIMULATION setting.
+        based on the AI_USE_SIMULATION setting. The MCTS difficulty always
+        searches in the background worker.
         
         Args:
             game_session: The current game session
         """
-        if not settings_manager.get("AI_USE_SIMULATION", False):
+        use_mcts = self._difficulty == "MCTS"
+        if not use_mcts and not settings_manager.get("AI_USE_SIMULATION",
+                                                     False):
             if self._ai_thinking_state is not None:
                 self._continue_thinking(game_session)
                 return
@@ -208,9 +631,35 @@ class AIPlayer(Player):
             worker_result = self._worker_result
             worker_token = self._worker_turn_token
             current_turn_state = game_session.get_turn_state_token()
+            search_turn_state = self._search_turn_state
+
+        if worker_running and search_turn_state != current_turn_state:
+            # The turn moved on under the search: preempt it right away
+            # instead of letting it run into its deadline.
+            self.cancel_work("turn state changed")
+            worker_running = False
+            worker_result = None
 
         if worker_running:
-            return
+            if time.perf_counter() < self._search_deadline:
+                return
+            # Hard deadline: play the deepest completed search result.
+            worker_result = self.best_so_far()
+            if worker_result is None and use_mcts:
+                # MCTS keeps to its own budget and publishes once at the end.
+                return
+            self.stop("deadline")
+            if worker_result is None:
+                # Not even the heuristic ranking finished in time; the failed
+                # search fallback below plays the cheap heuristic move.
+                worker_result = {
+                    "turn_token": worker_token,
+                    "turn_state": current_turn_state,
+                    "is_valid": False,
+                    "best_move": None
+                }
+                with self._worker_lock:
+                    self._worker_result = worker_result
 
         if worker_result and worker_result["turn_token"] == worker_token:
             if worker_result.get("turn_state") != current_turn_state:
@@ -221,38 +670,335 @@ class AIPlayer(Player):
                 )
                 self._clear_worker_state()
             elif worker_result.get("is_valid"):
-                self._ai_thinking_data = {"best_move": worker_result["best_move"]}
-                self._execute_best_move(game_session)
+                if not self._wait_for_worker():
+                    return
+                if use_mcts:
+                    self._execute_move(game_session,
+                                       worker_result["best_move"])
+                else:
+                    self._ai_thinking_data = {
+                        "best_move": worker_result["best_move"]
+                    }
+                    self._execute_best_move(game_session)
                 self._clear_worker_state()
                 return
             else:
+                # The search failed before finding a move; starting it again
+                # would fail the same way every frame.
+                if not self._wait_for_worker():
+                    return
+                logger.warning(
+                    f"Player {self.name} has no search result and plays a simple move"
+                )
                 self._clear_worker_state()
+                self._play_turn_simple(game_session)
                 return
 
         logger.info(f"Player {self.name} is thinking...")
         self._update_game_phase(game_session)
         self._invalidate_evaluation_cache()
         self._invalidate_figure_cache()
+        self.start(
+            game_session,
+            self._get_mcts_budget_ms() if use_mcts else self._get_turn_budget_ms())
+
+    def play_turn_blocking(self, game_session: 'GameSession') -> None:
+        """
+        Play a whole turn, waiting for the worker instead of returning.
+
+        ``play_turn`` is polled once per frame by the game scene; headless
+        callers such as the tournament runner use this instead. Returns when
+        the turn has passed to the next player or the game is over.
+
+        Args:
+            game_session: The current game session
+        """
+        turn_id = game_session.turn_id
+        while (game_session.turn_id == turn_id
+               and not game_session.get_game_over()):
+            self.play_turn(game_session)
+            future = self._worker_future
+            if future is not None and not future.done():
+                wait([future],
+                     max(self._search_deadline - time.perf_counter(), 0.001))
+
+    def get_nodes_evaluated(self) -> int:
+        """
+        Get the number of positions this player's searches evaluated.
+
+        Counts scored and simulated placements, positions of the deeper
+        search and MCTS iterations over the whole game.
+        """
+        with self._worker_lock:
+            return self._nodes_evaluated
+
+    def _count_nodes(self, count: int) -> None:
+        """Add evaluated positions to ``get_nodes_evaluated``."""
+        with self._worker_lock:
+            self._nodes_evaluated += count
+
+    def start(self, game_session: 'GameSession', budget_ms: float) -> None:
+        """
+        Start an anytime search for the current turn in the worker pool.
 
+        The search deepens one ply at a time and publishes every completed
+        depth, so ``best_so_far`` has an answer as soon as the heuristic
+        ranking is done. ``play_turn`` stops the search at the deadline and
+        plays the deepest completed result, or a simple move when not even
+        the ranking completed.
+
+        A search still running for an earlier turn is cancelled first.
+
+        Args:
+            game_session: The current game session
+            budget_ms: Wall-clock budget of the turn in milliseconds
+        """
         turn_state = game_session.get_turn_state_token()
+        started = time.perf_counter()
+        deadline = started + budget_ms / 1000.0
 
         with self._worker_lock:
+            self._search_token.cancel("superseded")
             self._worker_turn_token += 1
             turn_token = self._worker_turn_token
+            token = CancellationToken()
             self._worker_running = True
             self._worker_progress = 0.0
             self._worker_result = None
-            self._worker_thread = threading.Thread(
-                target=self._compute_best_move_worker,
-                args=(game_session, turn_token, turn_state),
-                daemon=True)
-            self._worker_thread.start()
-        return
+            self._search_token = token
+            self._search_turn_state = turn_state
+            self._search_started = started
+            self._search_deadline = deadline
+            if self._difficulty == "MCTS":
+                target = self._compute_mcts_move_worker
+                # Drawn here rather than in the worker, so a seeded game
+                # hands every search the same seed.
+                args = (game_session, turn_token, turn_state, budget_ms,
+                        token, random.getrandbits(64))
+            else:
+                target = self._compute_best_move_worker
+                args = (game_session, turn_token, turn_state, token,
+                        deadline)
+            self._worker_future = submit_worker(token, target, *args)
+
+    def best_so_far(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the result of the deepest search depth completed so far.
+
+        Returns:
+            Worker result with "best_move" and "depth", or None while no
+            depth has completed
+        """
+        with self._worker_lock:
+            if self._worker_result is None:
+                return None
+            return dict(self._worker_result)
+
+    def stop(self, reason: str = "stopped") -> None:
+        """
+        Stop the running search.
+
+        The worker abandons the depth it is searching and the result of the
+        last completed depth stays available through ``best_so_far``.
+
+        Args:
+            reason: Cancellation reason reported by ``get_worker_metrics``
+        """
+        self._search_token.cancel(reason)
+        with self._worker_lock:
+            self._worker_running = False
+            self._worker_progress = 1.0
+
+    def _wait_for_worker(self) -> bool:
+        """
+        Wait briefly for a stopped worker to return before the session is
+        changed. Depth 1 of the search reads the live session, so a move
+        must not be played while the worker is still inside an evaluation.
+
+        Returns:
+            Whether no worker is running any more; when False, the caller
+            should try again on the next frame
+        """
+        future = self._worker_future
+        if future is None or future.done():
+            return True
+        done, _ = wait([future], self.WORKER_STOP_WAIT_S)
+        return bool(done)
+
+    def cancel_work(self, reason: str) -> None:
+        """
+        Cancel the search and the ponder pass of this player and drop their
+        results, e.g. when the session they run on is replaced.
+
+        Args:
+            reason: Cancellation reason reported by ``get_worker_metrics``
+        """
+        self._search_token.cancel(reason)
+        self._ponder_token.cancel(reason)
+        self._ponder_turn_id = None
+        with self._worker_lock:
+            self._ponder_cache = None
+        self._clear_worker_state()
+
+    def ponder(self,
+               game_session: 'GameSession',
+               snapshot: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Evaluate likely next tiles in the background while others move.
+
+        Opt-in with AI_PONDER. Called by the game loop for AI players that
+        are not on turn; a new pass starts once per turn. The pass runs on a
+        snapshot and evaluates every placement of the most frequent remaining
+        tiles. At the start of the turn, evaluations whose surroundings and
+        joined structures did not change are reused.
+
+        Args:
+            game_session: The current game session
+            snapshot: ``game_session.serialize()`` of this turn, shared by
+                every pondering player; serialized here when omitted
+        """
+        if (not settings_manager.get("AI_PONDER", False)
+                or self._difficulty == "MCTS"
+                or not settings_manager.get("AI_USE_SIMULATION", False)):
+            return
+        if (game_session.get_game_over()
+                or game_session.get_current_player() is self):
+            return
+        if game_session.turn_id == self._ponder_turn_id:
+            return
+
+        self._ponder_token.cancel("board changed")
+        self._ponder_token = CancellationToken()
+        self._ponder_turn_id = game_session.turn_id
+        versions = {
+            id(structure): (structure, structure.get_version())
+            for structure in game_session.structures
+        }
+        if snapshot is None:
+            snapshot = game_session.serialize()
+        submit_worker(self._ponder_token, self._ponder_worker,
+                      type(game_session), snapshot, versions,
+                      self._ponder_token)
+
+    def _ponder_worker(self, session_class: type, snapshot: Dict[str, Any],
+                       versions: dict,
+                       cancel_token: CancellationToken) -> None:
+        """
+        Evaluate placements of likely tiles on a session snapshot.
+
+        The evaluations are made by this player's copy in the snapshot, so
+        ownership checks see the snapshot's players. Results are published
+        after every tile.
+        """
+        try:
+            session = session_class.deserialize(snapshot)
+            me = next((player for player in session.get_players()
+                       if player.get_index() == self.get_index()), None)
+            if not isinstance(me, AIPlayer):
+                return
+            # The snapshot's copy has the difficulty default, not a preset
+            # set through set_preset.
+            me._preset = self._preset
+            me._game_phase = self._game_phase
+            structure_stats = me._get_structure_stats(session)
+            board = session.get_game_board()
+
+            entries = {}
+            chances = self._search_chances(session)[:self.PONDER_TILES]
+            me._worker_cache_context.evaluation_cache = {}
+            me._worker_cache_context.figure_cache = {}
+            for definition, _ in chances:
+                placements = [
+                    Placement(x, y, rotation, definition)
+                    for x, y, rotation in sorted(
+                        board.get_matching_placements(
+                            Card.from_definition(definition)))
+                ]
+                strategic_scores = score_placements(
+                    session, me, me._preset, me._game_phase, placements,
+                    structure_stats)
+                for strategic_score, placement in zip(strategic_scores,
+                                                      placements):
+                    if cancel_token.is_cancelled():
+                        return
+                    x, y, rotation, _ = placement
+                    joined, _ = joined_structures(session, x, y, definition,
+                                                  placement.rotation_index)
+                    entries[(definition.definition_id, x, y,
+                             rotation)] = _PonderedPlacement(
+                                 strategic_score,
+                                 me._simulate_placement_advanced(
+                                     session, placement),
+                                 board.get_area_hash(x, y), tuple(joined))
+                with self._worker_lock:
+                    if not cancel_token.is_cancelled():
+                        self._ponder_cache = {
+                            "versions": versions,
+                            "game_phase": me._game_phase,
+                            "has_figures": bool(me.figures),
+                            "entries": dict(entries),
+                        }
+        except Exception as e:
+            logger.warning(f"Pondering failed for {self.name}: {e}")
+
+    def _take_pondered(self, game_session: 'GameSession',
+                       card: Card) -> Dict[tuple, _PonderedPlacement]:
+        """
+        Collect the pondered evaluations still valid for the current card.
+
+        An evaluation is valid while the tiles around its cell and every
+        structure it joins are unchanged since it was pondered.
+
+        Returns:
+            {(x, y, rotation): pondered placement}
+        """
+        self._ponder_token.cancel("turn started")
+        self._ponder_turn_id = None
+        with self._worker_lock:
+            cache = self._ponder_cache
+            self._ponder_cache = None
+        if (cache is None or cache["game_phase"] != self._game_phase
+                or cache["has_figures"] != bool(self.figures)):
+            return {}
+
+        board = game_session.get_game_board()
+        structure_map = game_session.structure_map
+        versions = cache["versions"]
+        definition_id = card.get_definition().definition_id
+
+        def unchanged(key: tuple) -> bool:
+            structure = structure_map.get(key)
+            entry = versions.get(id(structure))
+            return (entry is not None and entry[0] is structure
+                    and entry[1] == structure.get_version())
+
+        valid = {}
+        for (pondered_id, x, y,
+             rotation), pondered in cache["entries"].items():
+            if (pondered_id == definition_id
+                    and board.get_area_hash(x, y) == pondered.area_hash
+                    and all(unchanged(key) for key in pondered.dependencies)):
+                valid[(x, y, rotation)] = pondered
+        logger.debug(
+            f"Player {self.name} reuses {len(valid)} pondered placements")
+        return valid
+
+    def _get_turn_budget_ms(self) -> float:
+        """Get the hard deadline of a searching turn from settings."""
+        configured_budget = settings_manager.get("AI_TURN_BUDGET_MS", 2000)
+        try:
+            budget = float(configured_budget)
+        except (TypeError, ValueError):
+            logger.warning(
+                f"Invalid AI_TURN_BUDGET_MS value '{configured_budget}', falling back to 2000"
+            )
+            return 2000.0
+        return max(budget, 1.0)
 
     def _clear_worker_state(self) -> None:
         """Reset worker state after completing or consuming a result."""
         with self._worker_lock:
-            self._worker_thread = None
+            self._worker_future = None
             self._worker_result = None
             self._worker_progress = 0.0
             self._worker_running = False
@@ -262,43 +1008,74 @@ class AIPlayer(Player):
         game_session: 'GameSession',
         turn_token: int,
         turn_state: tuple[int, int, Optional[int]],
+        cancel_token: Optional[CancellationToken] = None,
+        deadline: Optional[float] = None,
     ) -> None:
-        """Compute the best move in a background worker thread."""
+        """
+        Compute the best move in a background worker thread.
+
+        Depth 1 ranks the placements with the strategic heuristic,
+        simulates the top candidates and pairs them with their best meeple
+        spot (see ``_search_joint_actions``). Deeper searches, up to the preset's
+        ``search_depth``, add the expected replies of the following players
+        (see ``_search_candidates``), unless the last tiles are solved
+        exactly (see ``_solve_endgame``). Each completed depth replaces the
+        published result; a depth interrupted by ``stop`` or the deadline
+        is discarded, and a cancelled search publishes nothing more.
+        """
+        if cancel_token is None:
+            cancel_token = CancellationToken()
         result = {
             "turn_token": turn_token,
             "turn_state": turn_state,
             "is_valid": False,
-            "best_move": None
+            "best_move": None,
+            "depth": 0
         }
 
         try:
             self._worker_cache_context.evaluation_cache = {}
             self._worker_cache_context.figure_cache = {}
+            self._worker_cache_context.cancel_token = cancel_token
+            self._get_structure_stats(game_session)
 
             current_card = game_session.get_current_card()
             possible_placements = self._get_multiple_valid_placements(
                 game_session, current_card)
+            pondered = self._take_pondered(game_session, current_card)
 
             if possible_placements:
-                strategic_scores = []
-                total_placements = len(possible_placements)
-                for idx, placement in enumerate(possible_placements, start=1):
-                    x, y, rotations_needed, card_copy = placement
-
-                    strategic_score = self._evaluate_card_placement_advanced(
-                        game_session, x, y, card_copy)
-                    strategic_score += self._evaluate_figure_opportunity_advanced(
-                        game_session, x, y, card_copy)
-                    strategic_score += self._evaluate_opponent_blocking(
-                        game_session, x, y, card_copy)
-                    strategic_score += self._evaluate_multi_turn_potential(
-                        game_session, x, y, card_copy)
-                    strategic_scores.append((strategic_score, placement))
-
-                    with self._worker_lock:
-                        self._worker_progress = (idx / total_placements) * 0.5
+                missing = [
+                    placement for placement in possible_placements
+                    if placement[:3] not in pondered
+                ]
+                scored = None
+                workers = process_worker_count()
+                if workers > 1 and len(missing) > 1:
+                    scored = self._score_placements_in_processes(
+                        game_session, missing, workers, cancel_token,
+                        deadline)
+                if cancel_token.is_cancelled():
+                    return
+                if scored is None:
+                    scored = self._score_placements(game_session, missing)
+                self._count_nodes(len(missing))
+                fresh_scores = {
+                    placement[:3]: score
+                    for score, placement in scored
+                }
+                strategic_scores = [
+                    (pondered[placement[:3]].strategic_score
+                     if placement[:3] in pondered else
+                     fresh_scores[placement[:3]], placement)
+                    for placement in possible_placements
+                ]
 
                 strategic_scores.sort(reverse=True, key=lambda x: x[0])
+                result["is_valid"] = True
+                result["best_move"] = strategic_scores[0][1]
+                self._publish_search_result(turn_token, cancel_token, result)
+
                 max_candidates = settings_manager.get(
                     "AI_STRATEGIC_CANDIDATES", 5)
                 top_candidates = strategic_scores if max_candidates == -1 else strategic_scores[
@@ -306,11 +1083,18 @@ class AIPlayer(Player):
 
                 best_move = None
                 best_score = float("-inf")
+                simulated = []
                 total_candidates = max(1, len(top_candidates))
                 for idx, (_, placement) in enumerate(top_candidates, start=1):
-                    x, y, rotations_needed, card_copy = placement
-                    card_score = self._simulate_card_copy_placement_advanced(
-                        game_session, x, y, card_copy)
+                    if self._search_expired(cancel_token, deadline):
+                        break
+                    if placement[:3] in pondered:
+                        card_score = pondered[placement[:3]].simulated_score
+                    else:
+                        card_score = self._simulate_placement_advanced(
+                            game_session, placement)
+                        self._count_nodes(1)
+                    simulated.append((card_score, placement))
                     if card_score > best_score:
                         best_score = card_score
                         best_move = placement
@@ -319,21 +1103,556 @@ class AIPlayer(Player):
                         self._worker_progress = 0.5 + (
                             idx / total_candidates) * 0.5
 
-                result["is_valid"] = True
-                result["best_move"] = best_move
+                if best_move is not None:
+                    result["best_move"] = best_move
+                    result["depth"] = 1
+                    snapshot = _TurnSnapshot(game_session)
+                    actions = self._search_joint_actions(
+                        game_session, snapshot, simulated, cancel_token,
+                        deadline)
+                    if actions:
+                        result["best_move"] = actions[0][1]
+                    self._publish_search_result(turn_token, cancel_token,
+                                                result)
+                    if actions and not self._solve_endgame(
+                            game_session, snapshot, turn_token, cancel_token,
+                            deadline, result):
+                        self._deepen_search(snapshot, turn_token,
+                                            cancel_token, deadline, actions,
+                                            result)
             else:
                 result["is_valid"] = True
+        except Exception as e:
+            logger.exception(f"AI search failed for {self.name}: {e}")
         finally:
             self._worker_cache_context.evaluation_cache = None
             self._worker_cache_context.figure_cache = None
+            self._worker_cache_context.cancel_token = None
 
             with self._worker_lock:
-                if turn_token == self._worker_turn_token:
+                if (turn_token == self._worker_turn_token
+                        and not cancel_token.is_cancelled()):
                     self._worker_progress = 1.0
                     self._worker_result = result
                     self._worker_running = False
         return
 
+    def _publish_search_result(self, turn_token: int,
+                               cancel_token: CancellationToken,
+                               result: Dict[str, Any]) -> None:
+        """Make a completed search depth available to ``best_so_far``."""
+        with self._worker_lock:
+            if (turn_token == self._worker_turn_token
+                    and not cancel_token.is_cancelled()):
+                self._worker_result = dict(result)
+
+    @staticmethod
+    def _search_expired(cancel_token: CancellationToken,
+                        deadline: Optional[float]) -> bool:
+        """Check whether the search was stopped or ran out of time."""
+        return cancel_token.is_cancelled() or (deadline is not None
+                                       and time.perf_counter() >= deadline)
+
+    def _search_joint_actions(self, game_session: 'GameSession',
+                              snapshot: _TurnSnapshot,
+                              candidates: list,
+                              cancel_token: CancellationToken,
+                              deadline: Optional[float]) -> Optional[list]:
+        """
+        Rate the simulated placements together with their best meeple spot.
+
+        Every placement is applied once to the snapshot to list its unclaimed
+        structures, one spot per structure however many sides touch it, and
+        the spots of all placements are scored in one batch with
+        ``score_meeple_spots``. Placements that could not beat the best
+        placement even with the highest possible meeple score are never
+        applied, and only the best spot of a placement is kept. A spot has
+        to pass the same thresholds as ``_handle_figure_placement_advanced``.
+
+        Args:
+            game_session: The current game session
+            snapshot: Snapshot of the turn to apply placements to
+            candidates: List of (simulated score, placement)
+            cancel_token: Cancelled when the search should stop
+            deadline: perf_counter deadline, or None
+
+        Returns:
+            List of (value, Move) sorted best first, each Move holding its
+            meeple side or None, or None when the search ran out of time
+        """
+        definition = game_session.get_current_card().get_definition()
+        actions = sorted(((score, Move(x, y, rotation, definition))
+                          for score, (x, y, rotation, _) in candidates),
+                         key=lambda action: -action[0])
+        if not actions or not self.figures:
+            return actions
+        if self._search_expired(cancel_token, deadline):
+            return None
+
+        snapshot = snapshot.get()
+        me = next(player for player in snapshot.get_players()
+                  if player.get_index() == self.get_index())
+        structure_stats = StructureStats.from_session(snapshot)
+        # A placement completes at most one city per side.
+        completed_cities = sum(
+            1 for structure in snapshot.structures
+            if structure.get_structure_type() == "City"
+            and structure.get_is_completed()) + 4
+        bound = self.JOINT_MEEPLE_WEIGHT * meeple_score_bound(
+            self._preset, completed_cities)
+        conserve = self._should_conserve_figure(game_session)
+        threshold = self._preset["placement_threshold"] if conserve else 0.0
+
+        spots = []
+        for index, (score, move) in enumerate(actions):
+            if score + bound <= actions[0][0]:
+                break
+            if self._search_expired(cancel_token, deadline):
+                return None
+            terrains = definition.get_rotation(move.rotation // 90).terrains
+            found = []
+            token = snapshot.apply_move(move, me)
+            try:
+                seen = set()
+                for side, terrain in terrains.items():
+                    structure = snapshot.structure_map.get(
+                        (move.x, move.y, side))
+                    if (not terrain or structure is None
+                            or structure.get_figures()
+                            or id(structure) in seen):
+                        continue
+                    seen.add(id(structure))
+                    found.append((side, structure_stats.get(structure)))
+            finally:
+                snapshot.undo(token)
+            for side, stat in found:
+                if stat.completed and not is_legal_move(
+                        snapshot, move._replace(meeple=side), me):
+                    continue
+                spots.append((index, side, stat))
+
+        spot_scores = score_meeple_spots(self._preset,
+                                         [stat for _, _, stat in spots],
+                                         conserve)
+        self._count_nodes(len(spots))
+        best_spots = {}
+        for (index, side, _), spot_score in zip(spots, spot_scores):
+            if spot_score <= 0 or spot_score < threshold:
+                continue
+            if index not in best_spots or spot_score > best_spots[index][0]:
+                best_spots[index] = (spot_score, side)
+
+        joint = []
+        for index, (score, move) in enumerate(actions):
+            if index in best_spots:
+                spot_score, side = best_spots[index]
+                score += self.JOINT_MEEPLE_WEIGHT * spot_score
+                move = move._replace(meeple=side)
+            joint.append((score, move))
+        joint.sort(key=lambda action: -action[0])
+        return joint
+
+    def _deepen_search(self, snapshot: _TurnSnapshot, turn_token: int,
+                       cancel_token: CancellationToken,
+                       deadline: Optional[float], candidates: list,
+                       result: Dict[str, Any]) -> None:
+        """
+        Search the joint actions one ply deeper at a time.
+
+        Runs on the snapshot of the turn, so the board the UI draws is
+        never mutated. Stops after the preset's ``search_depth``, when a
+        depth does not complete in time, or before a depth that is not
+        expected to: its time is estimated from the previous depth, scaled
+        by how many more positions it searched than the depth before it and
+        by ``SEARCH_DEPTH_SAFETY``.
+        """
+        max_depth = self._preset.get("search_depth", 1)
+        if max_depth < 2 or len(candidates) < 2:
+            return
+        if self._search_expired(cancel_token, deadline):
+            return
+        snapshot = snapshot.get()
+        previous_nodes = len(candidates)
+        for depth in range(2, max_depth + 1):
+            started = time.perf_counter()
+            nodes_before = self.get_nodes_evaluated()
+            try:
+                best_move = self._search_candidates(snapshot, candidates,
+                                                    depth, cancel_token,
+                                                    deadline)
+            except _SearchTimeout:
+                logger.debug(
+                    f"Player {self.name} completed search depth {depth - 1}")
+                return
+            result["best_move"] = best_move
+            result["depth"] = depth
+            self._publish_search_result(turn_token, cancel_token, result)
+            if depth == max_depth or deadline is None:
+                continue
+            finished = time.perf_counter()
+            nodes = max(self.get_nodes_evaluated() - nodes_before, 1)
+            projected = ((finished - started) * nodes / previous_nodes *
+                         self.SEARCH_DEPTH_SAFETY)
+            if finished + projected > deadline:
+                logger.debug(
+                    f"Player {self.name} completed search depth {depth}, "
+                    f"depth {depth + 1} would take {projected * 1000.0:.0f}ms")
+                return
+            previous_nodes = nodes
+
+    def _solve_endgame(self, game_session: 'GameSession',
+                       snapshot: _TurnSnapshot, turn_token: int,
+                       cancel_token: CancellationToken,
+                       deadline: Optional[float],
+                       result: Dict[str, Any]) -> bool:
+        """
+        Search the rest of the game exactly once the deck is nearly empty.
+
+        Runs ``EndgameSolver`` on the snapshot of the turn, which it
+        restores, when at most AI_ENDGAME_TILES tiles are left in the deck
+        (-1 never does). A solved endgame
+        publishes the optimal move with ``"exact"`` set and the expected
+        final score of every player by name; an endgame that does not
+        finish before the deadline leaves the result untouched.
+
+        Returns:
+            Whether the endgame was solved
+        """
+        tiles_left = len(game_session.get_cards_deck())
+        if tiles_left > settings_manager.get("AI_ENDGAME_TILES", 1):
+            return False
+        if self._search_expired(cancel_token, deadline):
+            return False
+        snapshot = snapshot.get()
+        me = next(player for player in snapshot.get_players()
+                  if player.get_index() == self.get_index())
+        budget_ms = (float("inf") if deadline is None else
+                     (deadline - time.perf_counter()) * 1000.0)
+        solver = EndgameSolver(snapshot, me)
+        solution = solver.solve(budget_ms, cancel_token.is_cancelled)
+        self._count_nodes(solver.nodes)
+        if solution is None or solution.move is None:
+            return False
+        logger.debug(
+            f"Player {self.name} solved the last {tiles_left + 1} tiles, "
+            f"expected margin {solution.margin:.2f}")
+        result["best_move"] = solution.move
+        result["depth"] = tiles_left + 1
+        result["exact"] = True
+        result["expected_scores"] = {
+            player.get_name(): score
+            for player, score in zip(snapshot.get_players(),
+                                     solution.expected_scores)
+        }
+        self._publish_search_result(turn_token, cancel_token, result)
+        return True
+
+    def _search_candidates(self, snapshot: 'GameSession', candidates: list,
+                           depth: int, cancel_token: CancellationToken,
+                           deadline: Optional[float]) -> tuple:
+        """
+        Rate joint actions by their heuristic value and the expected point
+        margin ``depth - 1`` plies later.
+
+        The following players answer with the placement that hurts this
+        player most, averaged over the most frequent tiles left in the deck.
+
+        Args:
+            snapshot: Session to search, restored before returning
+            candidates: List of (value, Move) of ``_search_joint_actions``
+            depth: Plies to search, counting this player's move
+            cancel_token: Cancelled when the search should stop
+            deadline: perf_counter deadline, or None
+
+        Returns:
+            Best Move
+
+        Raises:
+            _SearchTimeout: If the search was stopped or ran out of time
+        """
+        me = next(player for player in snapshot.get_players()
+                  if player.get_index() == self.get_index())
+        chances = self._search_chances(snapshot)
+
+        best_move = None
+        best_value = float("-inf")
+        for heuristic_score, move in candidates:
+            token = snapshot.apply_move(move, me)
+            try:
+                margin = self._search_margin(snapshot, me, depth - 1,
+                                             chances, cancel_token, deadline)
+            finally:
+                snapshot.undo(token)
+            value = heuristic_score + self.SEARCH_MARGIN_WEIGHT * margin
+            if value > best_value:
+                best_value = value
+                best_move = move
+            if deadline is not None:
+                budget = max(deadline - self._search_started, 1e-6)
+                self._set_worker_progress(
+                    min(1.0, (time.perf_counter() - self._search_started) /
+                        budget))
+        return best_move
+
+    def _search_margin(self, session: 'GameSession', me: Player, plies: int,
+                       chances: list, cancel_token: CancellationToken,
+                       deadline: Optional[float]) -> float:
+        """Expected point margin of ``me`` after ``plies`` more moves."""
+        if self._search_expired(cancel_token, deadline):
+            raise _SearchTimeout()
+        if plies <= 0 or not chances:
+            return self._point_margin(session, me)
+
+        maximize = session.get_current_player() is me
+        board = session.get_game_board()
+        expected = 0.0
+        for definition, probability in chances:
+            placements = board.get_matching_placements(
+                Card.from_definition(definition))
+            if not placements:
+                expected += probability * self._point_margin(session, me)
+                continue
+            values = []
+            self._count_nodes(len(placements))
+            for x, y, rotation in placements:
+                token = session.apply_move(Move(x, y, rotation, definition))
+                try:
+                    values.append(
+                        self._search_margin(session, me, plies - 1, chances,
+                                            cancel_token, deadline))
+                finally:
+                    session.undo(token)
+            expected += probability * (max(values)
+                                       if maximize else min(values))
+        return expected
+
+    def _search_chances(self, game_session: 'GameSession') -> list:
+        """
+        Get the most frequent tiles left in the deck with their probability.
+
+        Returns:
+            List of (definition, probability) for at most
+            ``SEARCH_CHANCE_BRANCHES`` tiles, probabilities summing to 1
+        """
+        counts = {}
+        definitions = {}
+        for card in game_session.get_cards_deck():
+            definition = card.get_definition()
+            counts[definition.definition_id] = counts.get(
+                definition.definition_id, 0) + 1
+            definitions[definition.definition_id] = definition
+        frequent = sorted(counts.items(),
+                          key=lambda item: (-item[1], item[0]))[:self.SEARCH_CHANCE_BRANCHES]
+        total = sum(count for _, count in frequent)
+        return [(definitions[definition_id], count / total)
+                for definition_id, count in frequent]
+
+    @staticmethod
+    def _point_margin(game_session: 'GameSession', me: Player) -> float:
+        """
+        Get the point lead of ``me`` over the best opponent, counting what
+        unfinished structures would score for their majority owners.
+        """
+        values = {
+            id(player): float(player.get_score())
+            for player in game_session.get_players()
+        }
+        for structure in game_session.structures:
+            if structure.get_is_completed() or not structure.get_figures():
+                continue
+            value = unfinished_value(structure)
+            for owner in structure.get_majority_owners():
+                if id(owner) in values:
+                    values[id(owner)] += value
+        mine = values.pop(id(me), 0.0)
+        return mine - max(values.values(), default=0.0)
+
+    def _score_placements(self, game_session: 'GameSession',
+                          possible_placements: list) -> list:
+        """
+        Score placements in the worker thread.
+
+        All placements are scored in one batch, see
+        ``models.placement_scoring``.
+        """
+        scores = score_placements(
+            game_session, self, self._preset, self._game_phase,
+            possible_placements, self._get_structure_stats(game_session))
+        with self._worker_lock:
+            self._worker_progress = 0.5
+        return list(zip(scores, possible_placements))
+
+    def _score_placements_in_processes(
+            self,
+            game_session: 'GameSession',
+            possible_placements: list,
+            workers: int,
+            cancel_token: Optional[CancellationToken] = None,
+            deadline: Optional[float] = None
+    ) -> Optional[list]:
+        """
+        Score placements in the shared process pool.
+
+        The session is serialized once per turn, without the deck, and the
+        placements are split into one shard per process so each process
+        receives the snapshot once. The token is checked while the shards
+        run; when it is cancelled or the ``time.perf_counter`` deadline
+        passes, shards that did not start are dropped and None is returned.
+
+        Returns:
+            Scores in the order of ``possible_placements``, or None when the
+            pool is unavailable and the caller should score in the thread
+        """
+        try:
+            snapshot = game_session.serialize()
+            snapshot["deck"] = []
+            snapshot_key = (id(self), game_session.get_turn_state_token(),
+                            game_session.get_state_hash())
+            indexed = [(index, x, y, rotation)
+                       for index, (x, y, rotation, _) in enumerate(
+                           possible_placements)]
+            shard_count = min(workers, len(indexed))
+            shards = [indexed[i::shard_count] for i in range(shard_count)]
+            pool = get_process_pool(workers)
+            futures = [
+                pool.submit(_score_placement_shard, snapshot_key, snapshot,
+                            self.get_index(), self._preset,
+                            self._game_phase, shard)
+                for shard in shards
+            ]
+
+            scores = [0.0] * len(possible_placements)
+            pending = set(futures)
+            while pending:
+                timeout = PROCESS_POLL_SECONDS
+                if deadline is not None:
+                    timeout = min(timeout, deadline - time.perf_counter())
+                if timeout <= 0 or (cancel_token is not None
+                                    and cancel_token.is_cancelled()):
+                    for future in futures:
+                        future.cancel()
+                    return None
+                done, pending = wait(pending, timeout=timeout,
+                                     return_when=FIRST_COMPLETED)
+                for future in done:
+                    for index, score in future.result():
+                        scores[index] = score
+                with self._worker_lock:
+                    self._worker_progress = (
+                        (shard_count - len(pending)) / shard_count) * 0.5
+        except Exception as e:
+            logger.warning(
+                f"Process pool evaluation failed, scoring in the worker thread: {e}"
+            )
+            return None
+        return list(zip(scores, possible_placements))
+
+    def _compute_mcts_move_worker(
+        self,
+        game_session: 'GameSession',
+        turn_token: int,
+        turn_state: tuple[int, int, Optional[int]],
+        budget_ms: Optional[float] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Search for a move with MCTS in a background worker thread.
+
+        The search runs on a deserialized snapshot of the session, so the
+        live board the UI draws is never mutated. A cancelled search stops
+        iterating and publishes nothing. ``seed`` seeds the random
+        generator of the tree; it is drawn from the global generator when
+        omitted.
+        """
+        if cancel_token is None:
+            cancel_token = CancellationToken()
+        result = {
+            "turn_token": turn_token,
+            "turn_state": turn_state,
+            "is_valid": False,
+            "best_move": None
+        }
+
+        try:
+            snapshot = type(game_session).deserialize(game_session.serialize())
+            search = MCTSSearch(
+                snapshot,
+                random.Random(seed if seed is not None else
+                              random.getrandbits(64)))
+            result["best_move"] = search.search(
+                budget_ms if budget_ms is not None else
+                self._get_mcts_budget_ms(),
+                on_progress=self._set_worker_progress,
+                should_stop=cancel_token.is_cancelled)
+            result["is_valid"] = True
+            self._count_nodes(search.iterations)
+            logger.debug(
+                f"Player {self.name} searched {search.iterations} MCTS iterations"
+            )
+        except Exception as e:
+            logger.exception(f"MCTS search failed for {self.name}: {e}")
+        finally:
+            with self._worker_lock:
+                if (turn_token == self._worker_turn_token
+                        and not cancel_token.is_cancelled()):
+                    self._worker_progress = 1.0
+                    self._worker_result = result
+                    self._worker_running = False
+
+    def _set_worker_progress(self, progress: float) -> None:
+        """Report background search progress between 0.0 and 1.0."""
+        with self._worker_lock:
+            self._worker_progress = progress
+
+    def _get_mcts_budget_ms(self) -> float:
+        """Get the MCTS search budget in milliseconds from settings."""
+        configured_budget = settings_manager.get("AI_MCTS_BUDGET_MS", 1000)
+        try:
+            budget = float(configured_budget)
+        except (TypeError, ValueError):
+            logger.warning(
+                f"Invalid AI_MCTS_BUDGET_MS value '{configured_budget}', falling back to 1000"
+            )
+            return 1000.0
+        return max(budget, 1.0)
+
+    def _execute_move(self, game_session: 'GameSession',
+                      move: Optional[Move]) -> None:
+        """
+        Play the card and meeple of a move.
+
+        Used for the moves of MCTS and of the joint action search; a move
+        without meeple ends the turn without placing one.
+        """
+        if move is None:
+            logger.info(
+                f"Player {self.name} couldn't find any valid placements and will discard the card"
+            )
+            game_session.skip_current_action()
+            return
+
+        current_card = game_session.get_current_card()
+        original_rotation = current_card.rotation
+        current_card.set_rotation(move.rotation)
+        if not game_session.play_card(move.x, move.y):
+            logger.error(
+                f"Player {self.name} failed to place card at validated position [{move.x},{move.y}]"
+            )
+            current_card.set_rotation(original_rotation)
+            game_session.skip_current_action()
+            return
+
+        game_session.set_turn_phase(2)
+        if move.meeple is not None and game_session.play_figure(
+                self, move.x, move.y, move.meeple):
+            logger.debug(f"Player {self.name} placed meeple on {move.meeple}")
+            self._check_and_score_completed_structures(game_session)
+            game_session.next_turn()
+            return
+
+        game_session.skip_current_action()
+
     def _update_game_phase(self, game_session: 'GameSession') -> None:
         """Update the current game phase based on cards played."""
         total_cards = len(game_session.get_cards_deck()) + 1
@@ -365,8 +1684,7 @@ class AIPlayer(Player):
             return
 
         x, y, rotations_needed = placement
-        for _ in range(rotations_needed):
-            current_card.rotate()
+        current_card.set_rotation(rotations_needed)
 
         if game_session.play_card(x, y):
             game_session.set_turn_phase(2)
@@ -385,6 +1703,7 @@ class AIPlayer(Player):
 
         self._invalidate_evaluation_cache()
         self._invalidate_figure_cache()
+        self._get_structure_stats(game_session)
         self._ai_thinking_data = {
             'game_session': game_session,
             'current_card': game_session.get_current_card(),
@@ -472,20 +1791,14 @@ class AIPlayer(Player):
         end_idx = min(start_idx + placements_per_step,
                       len(possible_placements))
 
-        for i in range(start_idx, end_idx):
-            placement = possible_placements[i]
-            x, y, rotations_needed, card_copy = placement
-
-            strategic_score = self._evaluate_card_placement_advanced(
-                data['game_session'], x, y, card_copy)
-            strategic_score += self._evaluate_figure_opportunity_advanced(
-                data['game_session'], x, y, card_copy)
-            strategic_score += self._evaluate_opponent_blocking(
-                data['game_session'], x, y, card_copy)
-            strategic_score += self._evaluate_multi_turn_potential(
-                data['game_session'], x, y, card_copy)
-
-            strategic_scores.append((strategic_score, placement))
+        step_placements = possible_placements[start_idx:end_idx]
+        strategic_scores.extend(
+            zip(
+                score_placements(
+                    data['game_session'], self, self._preset,
+                    self._game_phase, step_placements,
+                    self._get_structure_stats(data['game_session'])),
+                step_placements))
 
         self._ai_thinking_progress = end_idx
 
@@ -508,10 +1821,9 @@ class AIPlayer(Player):
         if self._ai_thinking_progress < len(top_candidates):
             strategic_score, placement = top_candidates[
                 self._ai_thinking_progress]
-            x, y, rotations_needed, card_copy = placement
 
-            card_score = self._simulate_card_placement_advanced(
-                data['game_session'], x, y, rotations_needed)
+            card_score = self._simulate_placement_advanced(
+                data['game_session'], placement)
 
             if card_score > data['best_score']:
                 data['best_score'] = card_score
@@ -526,13 +1838,14 @@ class AIPlayer(Player):
         data = self._ai_thinking_data
         best_move = data['best_move']
 
-        if best_move:
-            x, y, rotations_needed, card_copy = best_move
+        if isinstance(best_move, Move):
+            self._execute_move(game_session, best_move)
+        elif best_move:
+            x, y, rotations_needed, _ = best_move
             current_card = game_session.get_current_card()
 
             original_rotation = current_card.rotation
-            while current_card.rotation != rotations_needed:
-                current_card.rotate()
+            current_card.set_rotation(rotations_needed)
 
             if game_session.play_card(x, y):
                 game_session.set_turn_phase(2)
@@ -541,8 +1854,7 @@ class AIPlayer(Player):
                 logger.error(
                     f"Player {self.name} failed to place card at validated position [{x},{y}]"
                 )
-                while current_card.rotation != original_rotation:
-                    current_card.rotate()
+                current_card.set_rotation(original_rotation)
                 game_session.skip_current_action()
         else:
             logger.info(
@@ -584,13 +1896,19 @@ class AIPlayer(Player):
         else:
             return 1.0
 
-    def _get_evaluation_cache_key(self, card: Card, x: int, y: int,
+    def _get_evaluation_cache_key(self, placement: Placement,
                                   evaluation_type: str) -> tuple:
         """Get a cache key for AI evaluation."""
-        return (id(card), x, y, card.rotation, evaluation_type)
+        return (placement.definition.definition_id, placement.x, placement.y,
+                placement.rotation, evaluation_type)
 
     def _invalidate_evaluation_cache(self) -> None:
-        """Invalidate the AI evaluation cache."""
+        """
+        Invalidate the AI evaluation cache of the current board.
+
+        Entries of the cross-turn transposition cache stay; they are checked
+        against the board when they are read.
+        """
         with self._cache_lock:
             self._evaluation_cache.clear()
             self._evaluation_cache_valid = False
@@ -600,6 +1918,35 @@ class AIPlayer(Player):
         """Public method to invalidate the AI evaluation cache."""
         self._invalidate_evaluation_cache()
 
+    def get_evaluation_cache_stats(self) -> Dict[str, int]:
+        """Get the counters of the cross-turn transposition cache."""
+        return self._transpositions.get_stats()
+
+    def _get_evaluation_cache_size(self) -> int:
+        """Get the transposition cache size from AI_EVALUATION_CACHE_SIZE."""
+        configured_size = settings_manager.get("AI_EVALUATION_CACHE_SIZE",
+                                               20000)
+        try:
+            return max(int(configured_size), 0)
+        except (TypeError, ValueError):
+            logger.warning(
+                f"Invalid AI_EVALUATION_CACHE_SIZE value '{configured_size}', falling back to 20000"
+            )
+            return 20000
+
+    def _store_transposition(self, game_session: 'GameSession', key: tuple,
+                             value: float, dependencies: tuple) -> None:
+        """
+        Keep an evaluation across turns unless the worker computing it was
+        cancelled, since a cancelled worker may have read a board that was
+        already changing.
+        """
+        cancel_token = getattr(self._worker_cache_context, "cancel_token",
+                               None)
+        if cancel_token is not None and cancel_token.is_cancelled():
+            return
+        self._transpositions.put(game_session, key, value, dependencies)
+
     def _get_figure_cache_key(self, x: int, y: int, direction: str,
                               figure_type: str) -> tuple:
         """Get a cache key for figure placement evaluation."""
@@ -615,10 +1962,27 @@ class AIPlayer(Player):
         """Public method to invalidate the figure placement cache."""
         self._invalidate_figure_cache()
 
-    def _evaluate_cached(self, card: Card, x: int, y: int,
-                         evaluation_type: str, evaluation_func) -> float:
+    def _get_structure_stats(self,
+                             game_session: 'GameSession') -> StructureStats:
+        """
+        Get the structure statistics of the current board state.
+
+        The table is computed once per board state, normally when the turn
+        starts and again after the card is placed, and is shared read-only
+        by every evaluator, including those running in the worker thread.
+        """
+        state_key = (id(game_session), game_session.get_board_hash())
+        structure_stats = self._structure_stats
+        if structure_stats is None or structure_stats.state_key != state_key:
+            structure_stats = StructureStats.from_session(
+                game_session, state_key, structure_stats)
+            self._structure_stats = structure_stats
+        return structure_stats
+
+    def _evaluate_cached(self, placement: Placement, evaluation_type: str,
+                         evaluation_func) -> float:
         """Evaluate with caching support."""
-        cache_key = self._get_evaluation_cache_key(card, x, y, evaluation_type)
+        cache_key = self._get_evaluation_cache_key(placement, evaluation_type)
         local_cache = getattr(self._worker_cache_context, "evaluation_cache", None)
 
         if local_cache is not None:
@@ -665,159 +2029,96 @@ class AIPlayer(Player):
 
         return result
 
-    def _get_multiple_valid_placements(
-            self, game_session: 'GameSession',
-            card: Card) -> List[Tuple[int, int, int, Card]]:
+    def _get_multiple_valid_placements(self, game_session: 'GameSession',
+                                       card: Card) -> List[Placement]:
         """
         Get all valid card placements using the game's existing validation.
-        
+
+        Placements are immutable records referencing the card's shared tile
+        definition, so no card is copied per candidate.
+
         Args:
             game_session: The current game session
             card: The card to find placements for
-            
+
         Returns:
-            list of tuples containing (x, y, rotation, card_copy) for each valid placement
+            List of Placement records, one per valid (x, y, rotation)
         """
-        placements = []
-
-        valid_placements = game_session.get_valid_placements(card)
-        logger.debug(
-            f"AI {self.name} found {len(valid_placements)} valid placements")
-
-        for x, y, card_rotation in valid_placements:
-            card_copy = self._create_card_copy(card)
-            while card_copy.rotation != card_rotation:
-                card_copy.rotate()
-            placements.append((x, y, card_rotation, card_copy))
-            logger.debug(
-                f"AI {self.name} found valid placement at ({x},{y}) with rotation {card_rotation * 90}"
-            )
-
+        definition = card.get_definition()
+        placements = [
+            Placement(x, y, rotation, definition)
+            for x, y, rotation in game_session.get_valid_placements(card)
+        ]
         logger.debug(
             f"AI {self.name} found {len(placements)} valid placements")
         return placements
 
-    def _create_card_copy(self, card: Card) -> Card:
-        """
-        Create a copy of a card for simulation.
-        
-        Args:
-            card: The card to copy
-            
-        Returns:
-            A new Card instance with the same properties
-        """
-        card_copy = Card(
-            image_path=card.image_path,
-            terrains=card.terrains.copy(),
-            connections=card.connections.copy() if card.connections else None,
-            features=card.features.copy() if card.features else None,
-            is_starting_card=card.get_is_starting_card())
-        card_copy.rotation = card.rotation
-        return card_copy
-
-    def _simulate_card_placement_advanced(self, game_session: 'GameSession',
-                                          x: int, y: int,
-                                          rotations_needed: int) -> float:
-        """
-        Simulate card placement using advanced strategic evaluation.
-        
-        Evaluates the potential score of placing a card at the given position
-        considering structure completion, field potential, meeple opportunities,
-        opponent blocking, and multi-turn potential.
-        
-        Args:
-            game_session: The current game session
-            x: X coordinate for placement
-            y: Y coordinate for placement
-            rotations_needed: Number of rotations needed for the card
-            
-        Returns:
-            A score representing the desirability of this placement
+    def _simulate_placement_advanced(self, game_session: 'GameSession',
+                                     placement: Placement) -> float:
         """
-        current_card = game_session.get_current_card()
-        original_rotation = current_card.rotation
-
-        for _ in range(rotations_needed):
-            current_card.rotate()
-
-        score = self._evaluate_cached(
-            current_card, x, y, "placement",
-            lambda: self._evaluate_card_placement_advanced(
-                game_session, x, y, current_card))
-        score += self._evaluate_cached(
-            current_card, x, y, "figure",
-            lambda: self._evaluate_figure_opportunity_advanced(
-                game_session, x, y, current_card))
-        score += self._evaluate_cached(
-            current_card, x, y, "structure",
-            lambda: self._evaluate_structure_completion_potential(
-                game_session, x, y, current_card))
-        score += self._evaluate_cached(
-            current_card, x, y,
-            "field", lambda: self._evaluate_field_potential(
-                game_session, x, y, current_card))
-        score += self._evaluate_cached(
-            current_card, x, y,
-            "blocking", lambda: self._evaluate_opponent_blocking(
-                game_session, x, y, current_card))
-        score += self._evaluate_cached(
-            current_card, x, y, "multiturn",
-            lambda: self._evaluate_multi_turn_potential(
-                game_session, x, y, current_card))
-
-        while current_card.rotation != original_rotation:
-            current_card.rotate()
+        Simulate a placement using advanced strategic evaluation.
 
-        return score
+        Evaluates the potential score of the placement considering structure
+        completion, field potential, meeple opportunities, opponent blocking
+        and multi-turn potential of the structures the tile would join (see
+        ``placement_scoring.joined_structures``). Only reads the session, so
+        it is safe in the worker thread.
 
-    def _simulate_card_copy_placement_advanced(self, game_session: 'GameSession',
-                                               x: int, y: int,
-                                               card_copy: Card) -> float:
-        """
-        Simulate card placement using an already-rotated card copy.
-
-        This helper is safe for threaded worker evaluation because it avoids
-        mutating or reading the current live card from ``game_session``.
+        The result is kept in the transposition cache across turns, keyed
+        by the tiles around the cell and validated against the versions of
+        the structures the placement touches.
 
         Args:
             game_session: The current game session
-            x: X coordinate for placement
-            y: Y coordinate for placement
-            card_copy: Pre-rotated card copy for this candidate
+            placement: Candidate placement
 
         Returns:
             A score representing the desirability of this placement
         """
+        x, y = placement.x, placement.y
+        transposition_key = (placement.definition.definition_id, x, y,
+                             placement.rotation, "simulated",
+                             game_session.get_game_board().get_area_hash(
+                                 x, y), self._game_phase, bool(self.figures))
+        cached = self._transpositions.get(game_session, transposition_key)
+        if cached is not None:
+            return cached
+
+        joined, open_sides = joined_structures(game_session, x, y,
+                                               placement.definition,
+                                               placement.rotation_index)
         score = self._evaluate_cached(
-            card_copy, x, y, "placement",
+            placement, "placement",
             lambda: self._evaluate_card_placement_advanced(
-                game_session, x, y, card_copy))
+                game_session, x, y, placement, joined, open_sides))
         score += self._evaluate_cached(
-            card_copy, x, y, "figure",
+            placement, "figure",
             lambda: self._evaluate_figure_opportunity_advanced(
-                game_session, x, y, card_copy))
+                game_session, x, y, placement, joined))
         score += self._evaluate_cached(
-            card_copy, x, y, "structure",
+            placement, "structure",
             lambda: self._evaluate_structure_completion_potential(
-                game_session, x, y, card_copy))
+                game_session, x, y, placement, joined))
         score += self._evaluate_cached(
-            card_copy, x, y,
-            "field", lambda: self._evaluate_field_potential(
-                game_session, x, y, card_copy))
+            placement, "field", lambda: self._evaluate_field_potential(
+                game_session, x, y, placement, joined))
         score += self._evaluate_cached(
-            card_copy, x, y,
-            "blocking", lambda: self._evaluate_opponent_blocking(
-                game_session, x, y, card_copy))
+            placement, "blocking", lambda: self._evaluate_opponent_blocking(
+                game_session, x, y, placement, joined))
         score += self._evaluate_cached(
-            card_copy, x, y, "multiturn",
+            placement, "multiturn",
             lambda: self._evaluate_multi_turn_potential(
-                game_session, x, y, card_copy))
+                game_session, x, y, placement, joined))
+        self._store_transposition(
+            game_session, transposition_key, score,
+            structure_dependencies(game_session.structure_map, joined))
         return score
 
     def _evaluate_card_placement_advanced(self, game_session: 'GameSession',
                                           x: int, y: int,
-                                          card_copy: Card) -> float:
+                                          placement: Placement,
+                                          joined: dict,
+                                          open_sides: int) -> float:
         """
         Evaluate the score of a card placement position using preset configuration.
         
@@ -825,71 +2126,62 @@ class AIPlayer(Player):
             game_session: The current game session
             x: X coordinate for placement
             y: Y coordinate for placement
-            card_copy: A copy of the card being evaluated
+            placement: Candidate placement being evaluated
+            joined: Structures the tile would join, by structure map key
+            open_sides: Tile sides that continue no structure
             
         Returns:
             A score representing the desirability of this placement
         """
         score = 0.0
-        terrains = card_copy.get_terrains()
+        structure_stats = self._get_structure_stats(game_session)
 
-        for direction, terrain_type in terrains.items():
-            if direction == "C":
-                continue
+        for structure in joined.values():
+            score += self._preset["structure_connection"]
 
-            structure = game_session.structure_map.get((x, y, direction))
-            if structure:
-                score += self._preset["structure_connection"]
+            if structure.get_is_completed():
+                score += self._preset["completion_bonus"]
 
-                if structure.get_is_completed():
-                    score += self._preset["completion_bonus"]
-
-                if not structure.get_figures():
-                    score += self._preset["unoccupied_bonus"]
-
-                total_sides = len(structure.card_sides)
-                completed_sides = sum(1 for card, _ in structure.card_sides
-                                      if card.get_position())
-                completion_ratio = completed_sides / total_sides if total_sides > 0 else 0
-
-                # Apply completion ratio bonuses
-                if completion_ratio > 0.9:
-                    score += self._preset["completion_ratio_bonuses"][3]
-                elif completion_ratio > 0.7:
-                    score += self._preset["completion_ratio_bonuses"][2]
-                elif completion_ratio > 0.5:
-                    score += self._preset["completion_ratio_bonuses"][1]
-                elif completion_ratio > 0.3:
-                    score += self._preset["completion_ratio_bonuses"][0]
-
-                # Apply size penalties
-                if total_sides > 8:
-                    score += self._preset["size_penalties"][2]
-                elif total_sides > 6:
-                    score += self._preset["size_penalties"][1]
-                elif total_sides > 4:
-                    score += self._preset["size_penalties"][0]
+            if not structure.get_figures():
+                score += self._preset["unoccupied_bonus"]
+
+            structure_stat = structure_stats.get(structure)
+            total_sides = structure_stat.size
+            completion_ratio = structure_stat.completion_ratio
+
+            # Apply completion ratio bonuses
+            if completion_ratio > 0.9:
+                score += self._preset["completion_ratio_bonuses"][3]
+            elif completion_ratio > 0.7:
+                score += self._preset["completion_ratio_bonuses"][2]
+            elif completion_ratio > 0.5:
+                score += self._preset["completion_ratio_bonuses"][1]
+            elif completion_ratio > 0.3:
+                score += self._preset["completion_ratio_bonuses"][0]
+
+            # Apply size penalties
+            if total_sides > 8:
+                score += self._preset["size_penalties"][2]
+            elif total_sides > 6:
+                score += self._preset["size_penalties"][1]
+            elif total_sides > 4:
+                score += self._preset["size_penalties"][0]
 
-                structure_type = structure.get_structure_type()
-                if structure_type == "City":
-                    score += self._evaluate_city_specific(
-                        game_session, structure, completion_ratio)
-                elif structure_type == "Road":
-                    score += self._evaluate_road_specific(
-                        game_session, structure, completion_ratio)
-                elif structure_type == "Monastery":
-                    score += self._evaluate_monastery_specific(
-                        game_session, structure, completion_ratio)
+            structure_type = structure.get_structure_type()
+            if structure_type == "City":
+                score += self._evaluate_city_specific(
+                    game_session, structure, completion_ratio)
+            elif structure_type == "Road":
+                score += self._evaluate_road_specific(
+                    game_session, structure, completion_ratio)
+            elif structure_type == "Monastery":
+                score += self._evaluate_monastery_specific(
+                    game_session, structure, completion_ratio)
 
         center = game_session.get_game_board().get_center()
         distance_from_center = abs(x - center) + abs(y - center)
         score -= distance_from_center * self._preset["center_penalty"]
-
-        for direction, terrain_type in terrains.items():
-            if direction == "C":
-                continue
-            if not game_session.structure_map.get((x, y, direction)):
-                score += 10.0
+        score += open_sides * 10.0
 
         return score
 
@@ -946,6 +2238,7 @@ class AIPlayer(Player):
                                      completion_ratio: float) -> float:
         """Evaluate monastery-specific scoring potential using preset configuration."""
         score = 0.0
+        completion_ratio = structure.get_neighborhood_count() / 9
 
         if completion_ratio > 0.8:
             score += self._preset["monastery_bonuses"][2]
@@ -959,7 +2252,8 @@ class AIPlayer(Player):
     def _evaluate_figure_opportunity_advanced(self,
                                               game_session: 'GameSession',
                                               x: int, y: int,
-                                              card_copy: Card) -> float:
+                                              placement: Placement,
+                                              joined: dict) -> float:
         """
         Evaluate potential meeple placement opportunities using preset configuration.
         
@@ -967,27 +2261,22 @@ class AIPlayer(Player):
             game_session: The current game session
             x: X coordinate for placement
             y: Y coordinate for placement
-            card_copy: A copy of the card being evaluated
+            placement: Candidate placement being evaluated
+            joined: Structures the tile would join, by structure map key
             
         Returns:
             A score representing the potential for meeple placement
         """
         score = 0.0
-        terrains = card_copy.get_terrains()
-
-        for direction, terrain_type in terrains.items():
-            if direction == "C":
-                continue
+        structure_stats = self._get_structure_stats(game_session)
 
-            structure = game_session.structure_map.get((x, y, direction))
-            if structure and not structure.get_figures():
+        for structure in joined.values():
+            if not structure.get_figures():
                 if structure.get_is_completed():
                     score += self._preset["completion_bonus"] * 1.5
                 else:
-                    total_sides = len(structure.card_sides)
-                    completed_sides = sum(1 for card, _ in structure.card_sides
-                                          if card.get_position())
-                    completion_ratio = completed_sides / total_sides if total_sides > 0 else 0
+                    completion_ratio = structure_stats.get(
+                        structure).completion_ratio
                     score += completion_ratio * self._preset[
                         "figure_opportunity"]
 
@@ -1008,23 +2297,7 @@ class AIPlayer(Player):
         """Evaluate field meeple placement opportunities using preset configuration."""
         score = 0.0
 
-        completed_cities = [
-            s for s in game_session.structures
-            if s.get_structure_type() == "City" and s.get_is_completed()
-        ]
-
-        touched_cities = set()
-        for card, _ in structure.card_sides:
-            neighbors = card.get_neighbors().values()
-            touched_cards = set([card])
-            touched_cards.update([n for n in neighbors if n])
-
-            for city_structure in completed_cities:
-                for city_card, _ in city_structure.card_sides:
-                    if city_card in touched_cards:
-                        touched_cities.add(city_structure)
-                        break
-
+        touched_cities = structure.get_adjacent_completed_cities()
         score += len(touched_cities) * 8.0
 
         field_size = len(structure.card_sides)
@@ -1038,7 +2311,8 @@ class AIPlayer(Player):
         return score
 
     def _evaluate_opponent_blocking(self, game_session: 'GameSession', x: int,
-                                    y: int, card_copy: Card) -> float:
+                                    y: int, placement: Placement,
+                                    joined: dict) -> float:
         """
         Evaluate the potential to block opponents or prevent them from scoring.
         
@@ -1046,47 +2320,38 @@ class AIPlayer(Player):
             game_session: The current game session
             x: X coordinate for placement
             y: Y coordinate for placement
-            card_copy: A copy of the card being evaluated
+            placement: Candidate placement being evaluated
+            joined: Structures the tile would join, by structure map key
             
         Returns:
             A score representing blocking potential
         """
         score = 0.0
-        terrains = card_copy.get_terrains()
+        structure_stats = self._get_structure_stats(game_session)
 
-        for direction, terrain_type in terrains.items():
-            if direction == "C":
-                continue
+        for structure in joined.values():
+            structure_stat = structure_stats.get(structure)
+            if structure_stat.has_opponent(self):
+                completion_ratio = structure_stat.completion_ratio
 
-            structure = game_session.structure_map.get((x, y, direction))
-            if structure:
-                opponent_figures = [
-                    fig for fig in structure.get_figures()
-                    if fig.player != self
-                ]
-                if opponent_figures:
-                    total_sides = len(structure.card_sides)
-                    completed_sides = sum(1 for card, _ in structure.card_sides
-                                          if card.get_position())
-                    completion_ratio = completed_sides / total_sides if total_sides > 0 else 0
-
-                    blocking_score = 0
-                    if completion_ratio > 0.8:
-                        blocking_score = 120.0
-                    elif completion_ratio > 0.6:
-                        blocking_score = 80.0
-                    elif completion_ratio > 0.4:
-                        blocking_score = 50.0
-                    else:
-                        blocking_score = 25.0
+                blocking_score = 0
+                if completion_ratio > 0.8:
+                    blocking_score = 120.0
+                elif completion_ratio > 0.6:
+                    blocking_score = 80.0
+                elif completion_ratio > 0.4:
+                    blocking_score = 50.0
+                else:
+                    blocking_score = 25.0
 
-                    score += blocking_score * self._preset["opponent_blocking"]
+                score += blocking_score * self._preset["opponent_blocking"]
 
         return score
 
     def _evaluate_multi_turn_potential(self, game_session: 'GameSession',
                                        x: int, y: int,
-                                       card_copy: Card) -> float:
+                                       placement: Placement,
+                                       joined: dict) -> float:
         """
         Evaluate the potential for future turns and strategic positioning.
         
@@ -1094,7 +2359,8 @@ class AIPlayer(Player):
             game_session: The current game session
             x: X coordinate for placement
             y: Y coordinate for placement
-            card_copy: A copy of the card being evaluated
+            placement: Candidate placement being evaluated
+            joined: Structures the tile would join, by structure map key
             
         Returns:
             A score representing multi-turn potential
@@ -1103,19 +2369,19 @@ class AIPlayer(Player):
 
         if self._game_phase == "early":
             score += self._evaluate_early_game_positioning(
-                game_session, x, y, card_copy)
+                game_session, x, y, placement)
         elif self._game_phase == "mid":
             score += self._evaluate_mid_game_positioning(
-                game_session, x, y, card_copy)
+                game_session, x, y, placement, joined)
         else:
             score += self._evaluate_late_game_positioning(
-                game_session, x, y, card_copy)
+                game_session, x, y, placement, joined)
 
         return score
 
     def _evaluate_early_game_positioning(self, game_session: 'GameSession',
                                          x: int, y: int,
-                                         card_copy: Card) -> float:
+                                         placement: Placement) -> float:
         """Evaluate positioning for early game strategy."""
         score = 0.0
 
@@ -1132,51 +2398,40 @@ class AIPlayer(Player):
         return score
 
     def _evaluate_mid_game_positioning(self, game_session: 'GameSession',
-                                       x: int, y: int,
-                                       card_copy: Card) -> float:
+                                       x: int, y: int, placement: Placement,
+                                       joined: dict) -> float:
         """Evaluate positioning for mid game strategy."""
         score = 0.0
 
-        terrains = card_copy.get_terrains()
-        for direction, terrain_type in terrains.items():
-            if direction == "C":
-                continue
-
-            structure = game_session.structure_map.get((x, y, direction))
-            if structure and len(structure.card_sides) > 2:
+        for structure in joined.values():
+            if len(structure.card_sides) > 2:
                 score += 25.0
 
         return score
 
     def _evaluate_late_game_positioning(self, game_session: 'GameSession',
-                                        x: int, y: int,
-                                        card_copy: Card) -> float:
+                                        x: int, y: int, placement: Placement,
+                                        joined: dict) -> float:
         """Evaluate positioning for late game strategy."""
         score = 0.0
+        structure_stats = self._get_structure_stats(game_session)
 
-        terrains = card_copy.get_terrains()
-        for direction, terrain_type in terrains.items():
-            if direction == "C":
-                continue
-
-            structure = game_session.structure_map.get((x, y, direction))
-            if structure:
-                total_sides = len(structure.card_sides)
-                completed_sides = sum(1 for card, _ in structure.card_sides
-                                      if card.get_position())
-                completion_ratio = completed_sides / total_sides if total_sides > 0 else 0
+        for structure in joined.values():
+            completion_ratio = structure_stats.get(
+                structure).completion_ratio
 
-                if completion_ratio > 0.8:
-                    score += 70.0
-                elif completion_ratio > 0.6:
-                    score += 40.0
+            if completion_ratio > 0.8:
+                score += 70.0
+            elif completion_ratio > 0.6:
+                score += 40.0
 
         return score
 
     def _evaluate_structure_completion_potential(self,
                                                  game_session: 'GameSession',
                                                  x: int, y: int,
-                                                 card: Card) -> float:
+                                                 placement: Placement,
+                                                 joined: dict) -> float:
         """
         Evaluate potential score gains from structure completion.
         
@@ -1184,41 +2439,36 @@ class AIPlayer(Player):
             game_session: The current game session
             x: X coordinate for placement
             y: Y coordinate for placement
-            card: The card being evaluated
+            placement: Candidate placement being evaluated
+            joined: Structures the tile would join, by structure map key
             
         Returns:
             A score representing the potential for structure completion
         """
         score = 0.0
-        terrains = card.get_terrains()
-
-        for direction, terrain_type in terrains.items():
-            if direction == "C":
-                continue
-
-            structure = game_session.structure_map.get((x, y, direction))
-            if structure:
-                total_sides = len(structure.card_sides)
-                completed_sides = sum(1 for card, _ in structure.card_sides
-                                      if card.get_position())
-                completion_ratio = completed_sides / total_sides if total_sides > 0 else 0
-
-                if completion_ratio > 0.8:
-                    score += 100.0
-                elif completion_ratio > 0.6:
-                    score += 70.0
-                elif completion_ratio > 0.4:
-                    score += 45.0
-                elif completion_ratio > 0.2:
-                    score += 25.0
+        structure_stats = self._get_structure_stats(game_session)
+
+        for structure in joined.values():
+            completion_ratio = structure_stats.get(
+                structure).completion_ratio
+
+            if completion_ratio > 0.8:
+                score += 100.0
+            elif completion_ratio > 0.6:
+                score += 70.0
+            elif completion_ratio > 0.4:
+                score += 45.0
+            elif completion_ratio > 0.2:
+                score += 25.0
 
-                if not structure.get_figures():
-                    score += 20.0
+            if not structure.get_figures():
+                score += 20.0
 
         return score
 
     def _evaluate_field_potential(self, game_session: 'GameSession', x: int,
-                                  y: int, card: Card) -> float:
+                                  y: int, placement: Placement,
+                                  joined: dict) -> float:
         """
         Evaluate potential score gains from field placement.
         
@@ -1226,51 +2476,31 @@ class AIPlayer(Player):
             game_session: The current game session
             x: X coordinate for placement
             y: Y coordinate for placement
-            card: The card being evaluated
+            placement: Candidate placement being evaluated
+            joined: Structures the tile would join, by structure map key
             
         Returns:
             A score representing the potential for field scoring
         """
         score = 0.0
-        terrains = card.get_terrains()
 
-        for direction, terrain_type in terrains.items():
-            if direction == "C":
+        for structure in joined.values():
+            if structure.get_structure_type() != "Field":
                 continue
 
-            if terrain_type == "field":
-                structure = game_session.structure_map.get((x, y, direction))
-                if structure:
-                    completed_cities = [
-                        s for s in game_session.structures
-                        if s.get_structure_type() == "City"
-                        and s.get_is_completed()
-                    ]
-
-                    touched_cities = set()
-                    for card, _ in structure.card_sides:
-                        neighbors = card.get_neighbors().values()
-                        touched_cards = set([card])
-                        touched_cards.update([n for n in neighbors if n])
-
-                        for city_structure in completed_cities:
-                            for city_card, _ in city_structure.card_sides:
-                                if city_card in touched_cards:
-                                    touched_cities.add(city_structure)
-                                    break
-
-                    field_score = len(touched_cities) * 6
-                    score += field_score * self._preset["field_multiplier"]
-
-                    field_size = len(structure.card_sides)
-                    if field_size > 8:
-                        score += 35.0
-                    elif field_size > 6:
-                        score += 25.0
-                    elif field_size > 4:
-                        score += 15.0
-                    elif field_size > 2:
-                        score += 10.0
+            touched_cities = structure.get_adjacent_completed_cities()
+            field_score = len(touched_cities) * 6
+            score += field_score * self._preset["field_multiplier"]
+
+            field_size = len(structure.card_sides)
+            if field_size > 8:
+                score += 35.0
+            elif field_size > 6:
+                score += 25.0
+            elif field_size > 4:
+                score += 15.0
+            elif field_size > 2:
+                score += 10.0
 
         return score
 
@@ -1301,6 +2531,7 @@ class AIPlayer(Player):
         terrains = card.get_terrains()
         best_direction = None
         best_score = float('-inf')
+        structure_stats = self._get_structure_stats(game_session)
 
         should_conserve = self._should_conserve_figure(game_session)
 
@@ -1318,10 +2549,8 @@ class AIPlayer(Player):
                 if structure.get_is_completed():
                     score += self._preset["completion_bonus"] * 1.5
 
-                total_sides = len(structure.card_sides)
-                completed_sides = sum(1 for card, _ in structure.card_sides
-                                      if card.get_position())
-                completion_ratio = completed_sides / total_sides if total_sides > 0 else 0
+                completion_ratio = structure_stats.get(
+                    structure).completion_ratio
 
                 if completion_ratio > 0.8:
                     score += 120.0
@@ -1387,6 +2616,7 @@ class AIPlayer(Player):
         def evaluate_figure_placement():
             score = 0.0
             structure = game_session.structure_map.get((x, y, direction))
+            structure_stats = self._get_structure_stats(game_session)
 
             if not structure:
                 return 0.0
@@ -1394,10 +2624,8 @@ class AIPlayer(Player):
             if structure.get_is_completed():
                 score += self._preset["completion_bonus"] * 1.5
             else:
-                total_sides = len(structure.card_sides)
-                completed_sides = sum(1 for card, _ in structure.card_sides
-                                      if card.get_position())
-                completion_ratio = completed_sides / total_sides if total_sides > 0 else 0
+                completion_ratio = structure_stats.get(
+                    structure).completion_ratio
                 score += completion_ratio * self._preset["figure_opportunity"]
 
             if not structure.get_figures():
@@ -1416,8 +2644,17 @@ class AIPlayer(Player):
 
             return score
 
-        return self._evaluate_figure_cached(x, y, direction, "advanced",
-                                            evaluate_figure_placement)
+        transposition_key = (x, y, direction, "figure",
+                             game_session.get_game_board().get_area_hash(x, y))
+        score = self._transpositions.get(game_session, transposition_key)
+        if score is None:
+            score = self._evaluate_figure_cached(x, y, direction, "advanced",
+                                                 evaluate_figure_placement)
+            self._store_transposition(
+                game_session, transposition_key, score,
+                structure_dependencies(game_session.structure_map,
+                                       [(x, y, direction)]))
+        return score
 
     def _evaluate_city_figure_placement(self, structure: 'Structure') -> float:
         """Evaluate city figure placement scoring."""
@@ -1453,11 +2690,7 @@ class AIPlayer(Player):
                                              structure: 'Structure') -> float:
         """Evaluate monastery meeple placement scoring."""
         score = 0.0
-
-        total_sides = len(structure.card_sides)
-        completed_sides = sum(1 for card, _ in structure.card_sides
-                              if card.get_position())
-        completion_ratio = completed_sides / total_sides if total_sides > 0 else 0
+        completion_ratio = structure.get_neighborhood_count() / 9
 
         if completion_ratio > 0.6:
             score += 60.0
@@ -1473,23 +2706,7 @@ class AIPlayer(Player):
         """Evaluate field meeple placement scoring."""
         score = 0.0
 
-        completed_cities = [
-            s for s in game_session.structures
-            if s.get_structure_type() == "City" and s.get_is_completed()
-        ]
-
-        touched_cities = set()
-        for card, _ in structure.card_sides:
-            neighbors = card.get_neighbors().values()
-            touched_cards = set([card])
-            touched_cards.update([n for n in neighbors if n])
-
-            for city_structure in completed_cities:
-                for city_card, _ in city_structure.card_sides:
-                    if city_card in touched_cards:
-                        touched_cities.add(city_structure)
-                        break
-
+        touched_cities = structure.get_adjacent_completed_cities()
         score += len(touched_cities) * 8.0
 
         if len(structure.card_sides) > 8:
@@ -1547,13 +2764,7 @@ class AIPlayer(Player):
     def _check_and_score_completed_structures(
             self, game_session: 'GameSession') -> None:
         """Check for completed structures and score them immediately."""
-        logger.debug("Checking completed structures...")
-        for structure in game_session.structures:
-            structure.check_completion()
-            if structure.get_is_completed():
-                logger.debug(
-                    f"Structure {structure.structure_type} is completed!")
-                game_session.score_structure(structure)
+        game_session.score_completed_structures()
 
     def _evaluate_figure_placement(self, game_session: 'GameSession', x: int,
                                    y: int, direction: str) -> float:
@@ -1571,6 +2782,7 @@ class AIPlayer(Player):
         """
         score = 0.0
         structure = game_session.structure_map.get((x, y, direction))
+        structure_stats = self._get_structure_stats(game_session)
 
         if not structure:
             return 0.0
@@ -1578,10 +2790,8 @@ class AIPlayer(Player):
         if structure.get_is_completed():
             score += 100.0
         else:
-            total_sides = len(structure.card_sides)
-            completed_sides = sum(1 for card, _ in structure.card_sides
-                                  if card.get_position())
-            completion_ratio = completed_sides / total_sides if total_sides > 0 else 0
+            completion_ratio = structure_stats.get(
+                structure).completion_ratio
             score += completion_ratio * 50.0
 
         if not structure.get_figures():
@@ -1,43 +1,118 @@
-import pygame
 import logging
-import settings
 import typing
+from models.tile_definition import TileDefinition, rotate_layout
 
 logger = logging.getLogger(__name__)
 
 
 class Card:
-    """Represents a tile (card) in the game with an image and terrain properties."""
+    """
+    Represents a tile (card) in the game with terrain properties.
+
+    Cards are pure rules objects and never touch pygame; the UI resolves
+    ``image_path`` to surfaces through ``ui.assets`` when drawing. The tile
+    layout lives in a shared ``TileDefinition``; a card only adds its
+    rotation, position and board links.
+    """
 
     def __init__(self, image_path: str, terrains: dict,
                  connections: typing.Optional[dict],
                  features: typing.Any,
                  is_starting_card: bool = False) -> None:
         """
-        Initialize a tile with an image and terrain data.
-        
+        Initialize a tile with terrain data.
+
         Args:
-            image_path: Path to the tile image
+            image_path: Path to the tile image, resolved lazily by the UI
             terrains: Dictionary defining terrain types for each side
             connections: Dictionary defining connections within the card
             features: List of features on the card
             is_starting_card: True when this card can be used as game
                 starting card
         """
-        self.image_path = image_path
-        original_image = pygame.image.load(image_path)
-        self.image = pygame.transform.scale(
-            original_image, (settings.TILE_SIZE, settings.TILE_SIZE))
-        self.terrains = terrains
-        self.connections = connections
+        self._init_from_definition(
+            TileDefinition.get(image_path, terrains, connections, features,
+                               is_starting_card))
+
+    def _init_from_definition(self, definition: TileDefinition) -> None:
+        """Reset the per-card state on top of a shared tile definition."""
+        self.definition = definition
+        self._rotation_index = 0
+        self._layout = definition.rotations[0]
         self.occupied = {}
-        self.features = features
-        self.is_starting_card = is_starting_card
         self.neighbors = {"N": None, "E": None, "S": None, "W": None}
         self.position = {"X": None, "Y": None}
-        self.rotation = 0
 
-        self._rotation_cache = {}
+    @classmethod
+    def from_definition(cls, definition: TileDefinition) -> 'Card':
+        """
+        Create an unrotated card for an already registered tile definition.
+
+        Args:
+            definition: Shared tile definition
+            
+        Returns:
+            New Card instance referencing the definition
+        """
+        card = cls.__new__(cls)
+        card._init_from_definition(definition)
+        return card
+
+    @property
+    def image_path(self) -> str:
+        """Path of the tile image shared by all copies of this tile."""
+        return self.definition.image_path
+
+    @property
+    def features(self) -> typing.Any:
+        """Features shared by all copies of this tile."""
+        return self.definition.features
+
+    @property
+    def is_starting_card(self) -> bool:
+        """Whether this tile type can start the game."""
+        return self.definition.is_starting_card
+
+    @property
+    def terrains(self) -> typing.Mapping[str, typing.Optional[str]]:
+        """Read-only terrains of the card in its current orientation."""
+        return self._layout.terrains
+
+    @property
+    def connections(self) -> typing.Optional[typing.Mapping[str, tuple]]:
+        """Read-only connections of the card in its current orientation."""
+        return self._layout.connections
+
+    @property
+    def rotation(self) -> int:
+        """Clockwise rotation of the card in degrees (0, 90, 180 or 270)."""
+        return self._rotation_index * 90
+
+    @rotation.setter
+    def rotation(self, degrees: int) -> None:
+        self.set_rotation(degrees)
+
+    def get_rotation_index(self) -> int:
+        """Get the number of 90° clockwise turns applied to the card."""
+        return self._rotation_index
+
+    def set_rotation(self, degrees: int) -> None:
+        """
+        Turn the card directly to an orientation.
+
+        Args:
+            degrees: Clockwise rotation in degrees, a multiple of 90
+        """
+        self._rotation_index = (int(degrees) // 90) % 4
+        self._layout = self.definition.rotations[self._rotation_index]
+
+    def get_edge_signature(self) -> int:
+        """Get the packed N/E/S/W terrains of the card's current orientation."""
+        return self._layout.edge_signature
+
+    def get_definition(self) -> TileDefinition:
+        """Get the shared tile definition of the card."""
+        return self.definition
 
     def get_position(self) -> dict:
         """Get the card's position on the board."""
@@ -46,28 +121,16 @@ class Card:
     def set_position(self, x: int, y: int) -> None:
         """
         Set the card's position on the board.
-        
+
         Args:
             x: X coordinate of the card
             y: Y coordinate of the card
         """
         self.position = {"X": x, "Y": y}
 
-    def get_image(self) -> pygame.Surface:
-        """Get the card's image."""
-        return self.image
-
-    def get_rotated_image(self) -> pygame.Surface:
-        """Get the card's image rotated to current rotation with caching."""
-        if self.rotation == 0:
-            return self.image
-
-        if self.rotation in self._rotation_cache:
-            return self._rotation_cache[self.rotation]
-
-        rotated_image = pygame.transform.rotate(self.image, -self.rotation)
-        self._rotation_cache[self.rotation] = rotated_image
-        return rotated_image
+    def get_image_path(self) -> str:
+        """Get the path of the card's image asset."""
+        return self.image_path
 
     def get_terrains(self) -> dict:
         """Get the card's terrain information."""
@@ -80,7 +143,7 @@ class Card:
     def get_neighbor(self, direction: str) -> typing.Any:
         """
         Get a specific neighbor card.
-        
+
         Args:
             direction: Direction to get neighbor from
             
@@ -92,7 +155,7 @@ class Card:
     def set_neighbor(self, direction: str, neighbor: typing.Any) -> None:
         """
         Set a neighbor card.
-        
+
         Args:
             direction: Direction to set neighbor for
             neighbor: Neighbor card to set
@@ -113,43 +176,20 @@ class Card:
 
     def rotate(self) -> None:
         """Rotate the card 90 degrees clockwise."""
-        self.rotation = (self.rotation + 90) % 360
+        self._rotation_index = (self._rotation_index + 1) % 4
+        self._layout = self.definition.rotations[self._rotation_index]
 
         logger.debug(f"Card rotation - {self.rotation}")
 
-        direction_map = {
-            "N": "E",
-            "E": "S",
-            "S": "W",
-            "W": "N",
-            "NW": "NE",
-            "NE": "SE",
-            "SE": "SW",
-            "SW": "NW",
-            "C": "C",
-        }
-        new_terrains = {}
-        for dir, terrain in self.terrains.items():
-            new_dir = direction_map.get(dir, dir)
-            new_terrains[new_dir] = terrain
-        self.terrains = new_terrains
-
-        if self.connections:
-            new_connections = {}
-            for dir, connectedList in self.connections.items():
-                new_dir = direction_map.get(dir, dir)
-                new_connections[new_dir] = [
-                    direction_map.get(conn, conn) for conn in connectedList
-                ]
-
-            self.connections = new_connections
-
     def serialize(self) -> dict:
         """Serialize the card to a dictionary."""
         return {
             "image_path": self.image_path,
-            "terrains": self.terrains,
-            "connections": self.connections,
+            "terrains": dict(self.terrains),
+            "connections": {
+                direction: list(connected)
+                for direction, connected in self.connections.items()
+            } if self.connections is not None else None,
             "features": self.features,
             "is_starting_card": self.is_starting_card,
             "occupied": self.occupied,
@@ -165,7 +205,7 @@ class Card:
     def deserialize(data: dict) -> 'Card':
         """
         Create a Card instance from serialized data.
-        
+
         Args:
             data: Serialized card data
             
@@ -186,12 +226,24 @@ class Card:
             logger.error(f"Failed to parse required card fields: {data} - {e}")
             raise
 
+        raw_rotation = data.get("rotation", 0)
         try:
+            rotation_steps = int(raw_rotation or 0) // 90
+        except (ValueError, TypeError) as e:
+            logger.warning(
+                f"Invalid rotation value: {raw_rotation}, defaulting to 0 - {e}"
+            )
+            rotation_steps = 0
+
+        try:
+            base_terrains, base_connections = rotate_layout(
+                terrains, connections, -rotation_steps)
             card = Card(image_path=image_path,
-                        terrains=terrains,
-                        connections=connections,
+                        terrains=base_terrains,
+                        connections=base_connections,
                         features=features,
                         is_starting_card=is_starting_card)
+            card.set_rotation(rotation_steps * 90)
         except Exception as e:
             logger.error(f"Failed to initialize Card from data: {data} - {e}")
             raise
@@ -219,15 +271,6 @@ class Card:
                     f"Invalid 'position' format: {pos}, defaulting to None")
                 card.position = {"X": None, "Y": None}
 
-            raw_rotation = data.get("rotation", 0)
-            try:
-                card.rotation = int(raw_rotation)
-            except Exception as e:
-                logger.warning(
-                    f"Invalid rotation value: {raw_rotation}, defaulting to 0 - {e}"
-                )
-                card.rotation = 0
-
         except Exception as e:
             logger.error(f"Failed to parse optional card fields: {data} - {e}")
             raise
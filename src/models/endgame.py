@@ -0,0 +1,258 @@
+"""Exact search of the last tiles of a game.
+
+With only a few tiles left in the deck, every ordering of the remaining
+tiles and every turn can be searched. ``EndgameSolver`` runs an expectimax
+over the exact multiset of the remaining tiles: decision nodes try every
+legal move (see ``mcts.legal_moves``), and after each move a chance node
+weighs every distinct remaining tile by its count. The value of a finished
+game is the final point margin of the searching player over the best
+opponent, with incomplete structures scored as at the end of the game.
+
+Opponents are assumed to minimize that margin, which is what they do in a
+two-player game; with more players it is a pessimistic model. Positions
+are memoized on their board hash, tile to place, remaining tiles, scores
+and figures in hand. Decision nodes prune with alpha-beta, and chance
+nodes pass a narrowed window to their last outcome, whose share of the
+expectation is then the only one left open. The search checks its
+deadline at every node and gives up as a whole when it runs out of time.
+"""
+
+import logging
+import time
+import typing
+from collections import Counter
+
+from models.mcts import legal_moves, unfinished_value
+from models.move import Move
+from models.tile_definition import TileDefinition
+
+logger = logging.getLogger(__name__)
+
+# Flags of memoized values relative to the window they were searched with.
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class EndgameResult(typing.NamedTuple):
+    """Optimal move of an endgame and the game outcome it leads to."""
+    move: typing.Optional[Move]  # None when the tile cannot be placed
+    margin: float  # expected final margin over the best opponent
+    expected_scores: tuple  # expected final score per player, in seat order
+    nodes: int  # decision nodes visited
+
+
+class _EndgameTimeout(Exception):
+    """Raised inside the search when the deadline passes."""
+
+
+class EndgameSolver:
+    """
+    Expectimax over the remaining tiles of a game.
+
+    The session is mutated during ``solve`` and restored afterwards; pass
+    a snapshot rather than the session the UI is drawing.
+    """
+
+    def __init__(self, game_session: typing.Any, player: typing.Any) -> None:
+        """
+        Initialize a solver.
+
+        Args:
+            game_session: Session to solve; ``player`` must be its current
+                player and hold the current card
+            player: Player of the session to find the best move for
+        """
+        self._session = game_session
+        self._player = player
+        self._players = list(game_session.get_players())
+        self._positions = {
+            id(seat): position
+            for position, seat in enumerate(self._players)
+        }
+        self._position = self._positions[id(player)]
+        self._remaining = Counter()
+        self._definitions: dict[int, TileDefinition] = {}
+        for card in game_session.get_cards_deck():
+            definition = card.get_definition()
+            self._remaining[definition.definition_id] += 1
+            self._definitions[definition.definition_id] = definition
+        self._remaining_total = sum(self._remaining.values())
+        self._table: dict[tuple, tuple] = {}
+        self._deadline = float("inf")
+        self._should_stop: typing.Optional[typing.Callable[[], bool]] = None
+        self.nodes = 0
+        self.cutoffs = 0
+
+    def solve(
+        self,
+        budget_ms: float,
+        should_stop: typing.Optional[typing.Callable[[], bool]] = None
+    ) -> typing.Optional[EndgameResult]:
+        """
+        Search the rest of the game.
+
+        Args:
+            budget_ms: Time budget in milliseconds
+            should_stop: Polled at every node; the search gives up once it
+                returns True
+
+        Returns:
+            EndgameResult of the current player's best move, or None when
+            the search did not complete in time
+        """
+        self._deadline = time.perf_counter() + budget_ms / 1000.0
+        self._should_stop = should_stop
+        started = time.perf_counter()
+        definition = self._session.get_current_card().get_definition()
+        try:
+            margin, scores, move = self._decide(definition, float("-inf"),
+                                                float("inf"))
+        except _EndgameTimeout:
+            logger.debug(
+                f"Endgame search gave up after {self.nodes} nodes")
+            return None
+        logger.debug(
+            f"Endgame search solved {self._remaining_total + 1} tiles in "
+            f"{(time.perf_counter() - started) * 1000.0:.1f}ms, "
+            f"{self.nodes} nodes, {self.cutoffs} cutoffs")
+        return EndgameResult(move, margin, scores, self.nodes)
+
+    def _decide(self, definition: TileDefinition, alpha: float,
+                beta: float) -> tuple[float, tuple, typing.Optional[Move]]:
+        """
+        Search the turn of the current player with a tile in hand.
+
+        Returns:
+            (margin, expected scores, best move); the margin is an upper
+            bound when at most ``alpha`` and a lower bound when at least
+            ``beta``
+        """
+        self.nodes += 1
+        if time.perf_counter() >= self._deadline or (
+                self._should_stop is not None and self._should_stop()):
+            raise _EndgameTimeout()
+
+        session = self._session
+        player = session.get_current_player()
+        key = self._position_key(definition, player)
+        entry = self._table.get(key)
+        if entry is not None:
+            margin, scores, move, flag = entry
+            if (flag == EXACT or (flag == LOWER_BOUND and margin >= beta)
+                    or (flag == UPPER_BOUND and margin <= alpha)):
+                return margin, scores, move
+
+        moves = legal_moves(session, definition, player)
+        if not moves:
+            # A tile that fits nowhere is discarded and the player draws again.
+            margin, scores = self._draw(alpha, beta)
+            best_move = None
+        else:
+            # Claiming a structure changes the outcome most, so try those
+            # moves first for earlier cutoffs.
+            moves.sort(key=lambda move: move.meeple is None)
+            maximizing = player is self._player
+            margin = float("-inf") if maximizing else float("inf")
+            scores = ()
+            best_move = None
+            low, high = alpha, beta
+            for move in moves:
+                token = session.apply_move(move, player)
+                try:
+                    value, value_scores = self._draw(low, high)
+                finally:
+                    session.undo(token)
+                if maximizing and value > margin:
+                    margin, scores, best_move = value, value_scores, move
+                    low = max(low, margin)
+                elif not maximizing and value < margin:
+                    margin, scores, best_move = value, value_scores, move
+                    high = min(high, margin)
+                if low >= high:
+                    self.cutoffs += 1
+                    break
+
+        if margin <= alpha:
+            flag = UPPER_BOUND
+        elif margin >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self._table[key] = (margin, scores, best_move, flag)
+        return margin, scores, best_move
+
+    def _draw(self, alpha: float, beta: float) -> tuple[float, tuple]:
+        """
+        Average the turns that follow over the next tile of the deck.
+
+        Outcomes before the last one are searched exactly. The last outcome
+        is searched with the window that decides whether the expectation
+        falls outside (alpha, beta), so its value may be a bound.
+
+        Returns:
+            (expected margin, expected scores)
+        """
+        total = self._remaining_total
+        if total == 0:
+            return self._final()
+        outcomes = [(definition_id, count)
+                    for definition_id, count in sorted(self._remaining.items())
+                    if count]
+        margin = 0.0
+        scores = [0.0] * len(self._players)
+        for index, (definition_id, count) in enumerate(outcomes):
+            probability = count / total
+            if index == len(outcomes) - 1:
+                low = (alpha - margin) / probability
+                high = (beta - margin) / probability
+            else:
+                low, high = float("-inf"), float("inf")
+            self._remaining[definition_id] -= 1
+            self._remaining_total -= 1
+            try:
+                value, value_scores, _ = self._decide(
+                    self._definitions[definition_id], low, high)
+            finally:
+                self._remaining[definition_id] += 1
+                self._remaining_total += 1
+            margin += probability * value
+            for position, score in enumerate(value_scores):
+                scores[position] += probability * score
+        return margin, tuple(scores)
+
+    def _final(self) -> tuple[float, tuple]:
+        """Score the finished game, including incomplete structures."""
+        session = self._session
+        values = [float(player.get_score()) for player in self._players]
+        # Only structures holding a figure score, so start from the figures
+        # rather than from every structure of the board.
+        claimed = {}
+        for figure in session.get_placed_figures():
+            position = figure.card.get_position()
+            structure = session.structure_map.get(
+                (position["X"], position["Y"], figure.position_on_card))
+            if structure is not None:
+                claimed[id(structure)] = structure
+        for structure in claimed.values():
+            if structure.get_is_completed():
+                continue
+            value = unfinished_value(structure)
+            for owner in structure.get_majority_owners():
+                position = self._positions.get(id(owner))
+                if position is not None:
+                    values[position] += value
+        best_other = max((value for position, value in enumerate(values)
+                          if position != self._position),
+                         default=0.0)
+        return values[self._position] - best_other, tuple(values)
+
+    def _position_key(self, definition: TileDefinition,
+                      player: typing.Any) -> tuple:
+        """Key everything the rest of the game depends on."""
+        return (self._session.get_board_hash(), self._positions[id(player)],
+                definition.definition_id,
+                tuple(sorted(item for item in self._remaining.items()
+                             if item[1])),
+                tuple(seat.get_score() for seat in self._players),
+                tuple(len(seat.figures) for seat in self._players))
@@ -1,8 +1,6 @@
-import pygame
 import logging
 import typing
 from models.game_board import GameBoard
-import settings
 
 logger = logging.getLogger(__name__)
 
@@ -10,33 +8,17 @@ logger = logging.getLogger(__name__)
 class Figure:
     """Represents a figure (meeple) belonging to a player."""
 
-    def __init__(self,
-                 owner: 'Player',
-                 image_path: str = settings.FIGURE_IMAGES_PATH) -> None:
+    def __init__(self, owner: 'Player') -> None:
         """
         Initialize a figure for a specific player.
         
+        The meeple image is not loaded here; the UI resolves it from the
+        owner's color through ``ui.assets`` when the figure is drawn.
+        
         Args:
             owner: Player who owns the figure
-            image_path: Path to the meeple image
         """
         self.owner = owner
-        image_file = image_path + f"{owner.get_color()}.png"
-        try:
-            original_image = pygame.image.load(image_file)
-        except Exception as exc:
-            logger.error(
-                "Failed to load figure image from %s for owner %s: %s",
-                image_file,
-                owner.get_name(),
-                exc,
-            )
-            original_image = pygame.Surface(
-                (settings.FIGURE_SIZE, settings.FIGURE_SIZE),
-                pygame.SRCALPHA,
-            )
-        self.image = pygame.transform.scale(
-            original_image, (settings.FIGURE_SIZE, settings.FIGURE_SIZE))
         self.card = None
         self.position_on_card = None
 
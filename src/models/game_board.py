@@ -1,6 +1,9 @@
 import logging
 import typing
 from models.card import Card
+from models.tile_definition import (EDGE_SIGNATURE_SHIFTS,
+                                    EDGE_SIGNATURE_SIDE_MASK, TileDefinition)
+from models.zobrist import tile_key
 import settings
 
 logger = logging.getLogger(__name__)
@@ -20,6 +23,17 @@ class GameBoard:
         self.grid = [[None for _ in range(grid_size)]
                      for _ in range(grid_size)]
         self._card_positions_by_id: dict[int, tuple[int, int]] = {}
+        # Empty cells next to placed cards, mapped to the (required, mask)
+        # edge signature that a card must match to be placed there.
+        self._frontier: dict[tuple[int, int], tuple[int, int]] = {}
+        self._rotation_match_cache: dict[tuple[int, int, int],
+                                         tuple[int, ...]] = {}
+        self._placed_count = 0
+        # Occupied cells in the 3x3 neighborhood of every monastery tile,
+        # including the monastery itself.
+        self._monastery_counts: dict[tuple[int, int], int] = {}
+        # XOR of the Zobrist keys of all placed tiles.
+        self._zobrist_hash = 0
         self.center = grid_size // 2
 
     def get_grid_size(self) -> int:
@@ -38,6 +52,8 @@ class GameBoard:
         """
         Place a card on the board at the given coordinates without validation.
         
+        A card already at the coordinates is removed first.
+        
         Args:
             card: Card to place
             x: X coordinate
@@ -50,10 +66,276 @@ class GameBoard:
             raise ValueError(
                 f"y must be between 1 and {self.grid_size - 1}, got {y}")
         if 0 <= x < self.grid_size and 0 <= y < self.grid_size:
+            if self.grid[y][x] is not None:
+                self.remove_card(x, y)
             card.set_position(x, y)
+            self._placed_count += 1
             self.grid[y][x] = card
+            self._zobrist_hash ^= self._tile_key(card, x, y)
             self._card_positions_by_id[id(card)] = (x, y)
             self._update_neighbors(x, y)
+            self._update_frontier(x, y)
+            self._update_monastery_counts(card, x, y)
+
+    def remove_card(self, x: int, y: int) -> typing.Optional['Card']:
+        """
+        Remove the card at the given coordinates, reversing ``place_card``.
+        
+        Neighbor links, the frontier and monastery counts around the space
+        are restored locally, so the cost does not depend on the board size.
+        
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            
+        Returns:
+            The removed card or None if the space was empty
+        """
+        card = self.get_card(x, y)
+        if card is None:
+            return None
+        self.grid[y][x] = None
+        self._placed_count -= 1
+        self._zobrist_hash ^= self._tile_key(card, x, y)
+        self._card_positions_by_id.pop(id(card), None)
+        card.set_position(None, None)
+        for direction, neighbor in card.neighbors.items():
+            if neighbor is not None:
+                neighbor.neighbors[self.get_opposite_direction(
+                    direction)] = None
+            card.neighbors[direction] = None
+
+        self._monastery_counts.pop((x, y), None)
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                if (x + dx, y + dy) in self._monastery_counts:
+                    self._monastery_counts[(x + dx, y + dy)] -= 1
+
+        for cx, cy in ((x, y), (x, y - 1), (x + 1, y), (x, y + 1),
+                       (x - 1, y)):
+            if (0 <= cx < self.grid_size and 0 <= cy < self.grid_size
+                    and self.grid[cy][cx] is None):
+                self._refresh_frontier_cell(cx, cy)
+        return card
+
+    def _refresh_frontier_cell(self, x: int, y: int) -> None:
+        """Recompute the frontier requirement of an empty space from its neighbors."""
+        required = mask = 0
+        directions = {
+            "N": (x, y - 1),
+            "E": (x + 1, y),
+            "S": (x, y + 1),
+            "W": (x - 1, y)
+        }
+        for direction, (nx, ny) in directions.items():
+            neighbor = self.get_card(nx, ny)
+            if neighbor is None:
+                continue
+            side = self.get_opposite_direction(direction)
+            shift = EDGE_SIGNATURE_SHIFTS[direction]
+            edge = ((neighbor.get_edge_signature() >>
+                     EDGE_SIGNATURE_SHIFTS[side]) & EDGE_SIGNATURE_SIDE_MASK)
+            required |= edge << shift
+            mask |= EDGE_SIGNATURE_SIDE_MASK << shift
+        if mask:
+            self._frontier[(x, y)] = (required, mask)
+        else:
+            self._frontier.pop((x, y), None)
+
+    def _update_monastery_counts(self, card: 'Card', x: int, y: int) -> None:
+        """
+        Count the newly occupied space for every monastery around it.
+        
+        Args:
+            card: Card placed at (x, y)
+            x: X coordinate of the newly occupied space
+            y: Y coordinate of the newly occupied space
+        """
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                if (dx or dy) and (x + dx, y + dy) in self._monastery_counts:
+                    self._monastery_counts[(x + dx, y + dy)] += 1
+        if card.get_terrains().get("C") == "monastery":
+            self._monastery_counts[(x, y)] = sum(
+                1 for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+                if self.get_card(x + dx, y + dy) is not None)
+
+    def get_monastery_neighborhood_count(self, x: int,
+                                         y: int) -> typing.Optional[int]:
+        """
+        Get the number of occupied spaces around a monastery.
+        
+        Args:
+            x: X coordinate of the monastery
+            y: Y coordinate of the monastery
+            
+        Returns:
+            Count between 1 and 9 including the monastery itself, or None if
+            there is no monastery at (x, y)
+        """
+        return self._monastery_counts.get((x, y))
+
+    def _update_frontier(self, x: int, y: int) -> None:
+        """
+        Move (x, y) out of the frontier and record the edge it exposes to
+        each empty neighbor.
+        
+        Args:
+            x: X coordinate of the newly occupied space
+            y: Y coordinate of the newly occupied space
+        """
+        self._frontier.pop((x, y), None)
+        signature = self.grid[y][x].get_edge_signature()
+        directions = {
+            "N": (x, y - 1),
+            "E": (x + 1, y),
+            "S": (x, y + 1),
+            "W": (x - 1, y)
+        }
+        for direction, (nx, ny) in directions.items():
+            if not (0 <= nx < self.grid_size and 0 <= ny < self.grid_size):
+                continue
+            if self.grid[ny][nx] is not None:
+                continue
+            side = self.get_opposite_direction(direction)
+            shift = EDGE_SIGNATURE_SHIFTS[side]
+            edge = ((signature >> EDGE_SIGNATURE_SHIFTS[direction])
+                    & EDGE_SIGNATURE_SIDE_MASK)
+            required, mask = self._frontier.get((nx, ny), (0, 0))
+            self._frontier[(nx, ny)] = (
+                required | (edge << shift),
+                mask | (EDGE_SIGNATURE_SIDE_MASK << shift))
+
+    def get_frontier(self) -> frozenset[tuple[int, int]]:
+        """
+        Get the empty spaces adjacent to at least one placed card.
+        
+        The set is maintained by ``place_card``, so reading it does not
+        depend on the size of the grid. This returns a copy that stays valid
+        while the board changes; hot paths use ``iter_frontier`` instead.
+        
+        Returns:
+            Frozen set of (x, y) coordinates
+        """
+        return frozenset(self._frontier)
+
+    def iter_frontier(self) -> typing.Iterator[tuple[int, int]]:
+        """
+        Iterate the frontier cells without copying them.
+
+        The board must not change while the iterator is in use.
+        """
+        return iter(self._frontier)
+
+    def is_frontier(self, x: int, y: int) -> bool:
+        """Check if (x, y) is an empty space next to a placed card."""
+        return (x, y) in self._frontier
+
+    def get_frontier_requirement(
+            self, x: int, y: int) -> typing.Optional[tuple[int, int]]:
+        """
+        Get the edge signature a card must match at a frontier cell.
+        
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            
+        Returns:
+            Tuple of (required, mask) or None if (x, y) is not on the frontier
+        """
+        return self._frontier.get((x, y))
+
+    def get_matching_placements(self, card: 'Card') -> set:
+        """
+        Get every frontier cell and rotation where the card's edges fit.
+        
+        Matching is a bitwise comparison of the card's precomputed edge
+        signatures with each cell's requirement, memoized per tile
+        definition and requirement.
+        
+        Args:
+            card: Card to find placements for
+            
+        Returns:
+            Set of (x, y, rotation) tuples with rotation in degrees
+        """
+        definition = card.get_definition()
+        placements = set()
+        for (x, y), (required, mask) in self._frontier.items():
+            for rotation in self._matching_rotations(definition, required,
+                                                     mask):
+                placements.add((x, y, rotation))
+        return placements
+
+    def has_matching_placement(self, card: 'Card') -> bool:
+        """
+        Check whether the card fits anywhere, stopping at the first match.
+        
+        Args:
+            card: Card to find a placement for
+            
+        Returns:
+            True if ``get_matching_placements`` would not be empty
+        """
+        definition = card.get_definition()
+        return any(
+            self._matching_rotations(definition, required, mask)
+            for required, mask in self._frontier.values())
+
+    def _matching_rotations(self, definition: TileDefinition,
+                            required: int, mask: int) -> tuple:
+        """Get the rotations in degrees whose edges match a requirement."""
+        cache_key = (definition.definition_id, required, mask)
+        rotations = self._rotation_match_cache.get(cache_key)
+        if rotations is None:
+            rotations = tuple(
+                index * 90
+                for index, signature in enumerate(definition.edge_signatures)
+                if signature & mask == required)
+            self._rotation_match_cache[cache_key] = rotations
+        return rotations
+
+    @staticmethod
+    def _tile_key(card: 'Card', x: int, y: int) -> int:
+        """Get the Zobrist key of a card in a cell."""
+        return tile_key(x, y, card.get_definition(),
+                        card.get_rotation_index())
+
+    def get_zobrist_hash(self) -> int:
+        """
+        Get the Zobrist hash of the placed tiles.
+        
+        The hash is updated with every placement and removal, so two boards
+        holding the same tiles in the same cells and rotations hash equally
+        regardless of the order the tiles were placed in.
+        
+        Returns:
+            64-bit hash of the board
+        """
+        return self._zobrist_hash
+
+    def get_area_hash(self, x: int, y: int) -> int:
+        """
+        Get the Zobrist hash of the tiles in the 3x3 area around a cell.
+
+        Args:
+            x: X coordinate of the center cell
+            y: Y coordinate of the center cell
+
+        Returns:
+            64-bit hash, equal on every board holding the same tiles there
+        """
+        area_hash = 0
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                card = self.get_card(x + dx, y + dy)
+                if card is not None:
+                    area_hash ^= self._tile_key(card, x + dx, y + dy)
+        return area_hash
+
+    def get_placed_card_count(self) -> int:
+        """Get the number of cards placed on the board."""
+        return self._placed_count
 
     def get_card(self, x: int, y: int) -> typing.Optional['Card']:
         """
@@ -139,28 +421,17 @@ class GameBoard:
             logger.debug(
                 f"Cannot place card at ({x}, {y}) - position already occupied")
             return False
-        if not self.has_neighbor(x, y):
+        requirement = self._frontier.get((x, y))
+        if requirement is None:
             logger.debug(
                 f"Cannot place card at ({x}, {y}) - no adjacent cards found")
             return False
-        neighbors = {
-            "N": (x, y - 1),
-            "E": (x + 1, y),
-            "S": (x, y + 1),
-            "W": (x - 1, y)
-        }
-        for direction, (nx, ny) in neighbors.items():
-            if 0 <= nx < self.grid_size and 0 <= ny < self.grid_size:
-                neighbor = self.get_card(nx, ny)
-                if neighbor:
-                    card_terrain = card.get_terrains()[direction]
-                    neighbor_terrain = neighbor.get_terrains()[
-                        self.get_opposite_direction(direction)]
-                    if card_terrain != neighbor_terrain:
-                        logger.debug(
-                            f"Cannot place card at ({x}, {y}) - {card_terrain} doesn't match neighbor's {neighbor_terrain}"
-                        )
-                        return False
+        required, mask = requirement
+        if card.get_edge_signature() & mask != required:
+            logger.debug(
+                f"Cannot place card at ({x}, {y}) - terrain doesn't match adjacent cards"
+            )
+            return False
         return True
 
     def get_opposite_direction(self, direction: str) -> str:
@@ -5,10 +5,14 @@ import utils.logging_config
 
 from models.game_board import GameBoard
 from models.card import Card
+from models.tile_definition import TileDefinition
 from models.player import Player
 from models.structure import Structure
+from models.structure_tracker import StructureTracker
 from models.ai_player import AIPlayer
 from models.figure import Figure
+from models.move import Move, UndoToken
+from models.zobrist import figure_key, hand_key, player_key
 import settings
 from utils.settings_manager import settings_manager
 from models.card_sets.set_loader import load_all_card_sets, load_card_set
@@ -35,8 +39,7 @@ class GameSession:
         self.game_over = False
         self.turn_phase = 1
         self.placed_figures = []
-        self.structures = []
-        self.structure_map = {}
+        self._structure_tracker = StructureTracker()
         self.network_mode = network_mode
         self.lobby_completed = lobby_completed
         self.game_mode = None
@@ -45,22 +48,15 @@ class GameSession:
         self.on_command_executed = None
         self.turn_id = 0
         self.board_version = 0
+        # XOR of the Zobrist keys of all placed figures; tile keys are kept
+        # by the board.
+        self._meeple_hash = 0
 
         self._executed_command_ids = set()
 
-        self._candidate_positions = set()
-        self._last_board_state = None
-
-        self._structure_cache = {}
-        self._structure_cache_valid = False
-        self._last_board_hash = None
-
         self._validation_cache = {}
         self._validation_cache_valid = False
 
-        self._neighbor_cache = {}
-        self._neighbor_cache_valid = False
-
         if not no_init:
             self._generate_player_list(player_names)
             self.cards_deck = self._generate_cards_deck()
@@ -112,10 +108,52 @@ class GameSession:
         """Increment board visuals version after a visual-affecting mutation."""
         self.board_version += 1
 
+    def get_board_hash(self) -> int:
+        """Return the Zobrist hash of the placed tiles and meeples."""
+        return self.game_board.get_zobrist_hash() ^ self._meeple_hash
+
+    def get_state_hash(self) -> int:
+        """
+        Return the Zobrist hash of the position.
+
+        Combines the placed tiles and meeples with the tile in hand, its
+        rotation and the player to move. Scores and the order of the deck
+        are not part of the hash.
+        """
+        state_hash = self.get_board_hash()
+        card = self.current_card
+        if card is not None:
+            state_hash ^= hand_key(card.get_definition(),
+                                   card.get_rotation_index())
+        player_index = self.get_current_player_index()
+        if player_index is not None:
+            state_hash ^= player_key(player_index)
+        return state_hash
+
+    def _recompute_meeple_hash(self) -> None:
+        """Rebuild the meeple hash from the placed figures."""
+        self._meeple_hash = 0
+        for figure in self.placed_figures:
+            self._meeple_hash ^= figure_key(figure)
+
     def get_placed_figures(self) -> list:
         """Return the list of figures placed on the board."""
         return self.placed_figures
 
+    @property
+    def structures(self) -> list:
+        """Detected structures, maintained by the structure tracker."""
+        return self._structure_tracker.get_structures()
+
+    @structures.setter
+    def structures(self, structures: list) -> None:
+        self._structure_tracker.rebuild(list(structures), self.game_board)
+
+    @property
+    def structure_map(self) -> typing.Mapping:
+        """Read-only mapping of (x, y, side) to its structure."""
+        return self._structure_tracker.structure_map
+
     def get_structures(self) -> list:
         """Return the list of detected structures."""
         return self.structures
@@ -147,6 +185,8 @@ class GameSession:
                         difficulty = "HARD"
                     elif player.startswith("AI_EXPERT_"):
                         difficulty = "EXPERT"
+                    elif player.startswith("AI_MCTS_"):
+                        difficulty = "MCTS"
                     elif player.startswith("AI_NORMAL_"):
                         difficulty = "NORMAL"
 
@@ -181,15 +221,13 @@ class GameSession:
         cards = []
         for card in card_definitions:
             image = card["image"]
-            terrains = card["terrains"]
-            connections = card["connections"]
-            features = card["features"]
-            is_starting_card = bool(card.get("is_starting_card", False))
+            definition = TileDefinition.get(
+                settings.TILE_IMAGES_PATH + image, card["terrains"],
+                card["connections"], card["features"],
+                bool(card.get("is_starting_card", False)))
             count = card_distributions.get(image, 1)
-            cards.extend([
-                Card(settings.TILE_IMAGES_PATH + image, terrains, connections,
-                     features, is_starting_card) for _ in range(count)
-            ])
+            cards.extend(
+                [Card.from_definition(definition) for _ in range(count)])
 
         logger.debug(
             f"Deck generated with {len(cards)} cards from {len(card_definitions)} card definitions"
@@ -305,10 +343,7 @@ class GameSession:
                 f"Player {self.current_player.get_name()} placed a card at [{x - self.game_board.get_center()},{self.game_board.get_center() - y}]"
             )
         logger.debug(f"Last played card set to card {card} at {x};{y}")
-        self._invalidate_candidate_cache()
-        self._invalidate_structure_cache()
         self._invalidate_validation_cache()
-        self._invalidate_neighbor_cache()
 
         for player in self.players:
             if hasattr(player, 'invalidate_evaluation_cache'):
@@ -363,14 +398,7 @@ class GameSession:
             figure_placed = self.play_figure(player, x, y, position)
             if figure_placed:
                 logger.debug("Figure placed.")
-                logger.debug("Checking completed structures...")
-                for structure in self.structures:
-                    structure.check_completion()
-                    if structure.get_is_completed():
-                        logger.debug(
-                            f"Structure {structure.structure_type} is completed!"
-                        )
-                        self.score_structure(structure)
+                self.score_completed_structures()
                 self.next_turn()
             else:
                 logger.debug("Figure not placed or skipped.")
@@ -398,8 +426,7 @@ class GameSession:
             success = False
             if command.command_type == "place_card":
                 if self.current_card:
-                    while self.current_card.rotation != command.card_rotation:
-                        self.current_card.rotate()
+                    self.current_card.set_rotation(command.card_rotation)
                 success = self.play_card(command.x, command.y)
                 if success:
                     self.turn_phase = 2
@@ -411,10 +438,7 @@ class GameSession:
                 success = self.play_figure(self.current_player, command.x,
                                            command.y, command.position)
                 if success:
-                    for structure in self.structures:
-                        structure.check_completion()
-                        if structure.get_is_completed():
-                            self.score_structure(structure)
+                    self.score_completed_structures()
                     self.next_turn()
             elif command.command_type == "skip_action":
                 if command.action_type == "card" and self.turn_phase == 1:
@@ -479,10 +503,7 @@ class GameSession:
                 f"Player {self.current_player.get_name()} skipped meeple placement"
             )
             logger.debug("Finalizing turn...")
-            for structure in self.structures:
-                structure.check_completion()
-                if structure.get_is_completed():
-                    self.score_structure(structure)
+            self.score_completed_structures()
             self.next_turn()
             self.turn_phase = 1
 
@@ -531,6 +552,7 @@ class GameSession:
             )
             if figure.place(card, position):
                 self.placed_figures.append(figure)
+                self._meeple_hash ^= figure_key(figure)
                 self._increment_board_version()
                 logger.info(
                     f"Player {player.get_name()} placed a figure on {position} position at [{x - self.game_board.get_center()},{self.game_board.get_center() - y}]"
@@ -561,159 +583,28 @@ class GameSession:
             logger.debug("No card was placed. Skipping structure detection.")
             return
 
-        current_board_hash = self._get_board_state_hash()
-        if (self._structure_cache_valid
-                and self._last_board_hash == current_board_hash
-                and self._structure_cache):
-            logger.debug("Using cached structure detection results")
-            return
-
-        position = self.game_board.get_card_position(self.last_placed_card)
-        if not position:
+        x, y = self.game_board.get_card_position(self.last_placed_card)
+        if x is None or y is None:
             logger.debug("Last placed card position not found.")
             return
 
-        x, y = position
-        self.visited = set()
-
-        for direction in self.last_placed_card.get_terrains().keys():
-            cache_key = self._get_structure_cache_key(x, y, direction, "")
-            if cache_key in self._structure_cache:
-                del self._structure_cache[cache_key]
-
-        for direction, terrain_type in self.last_placed_card.get_terrains(
-        ).items():
-            key = (x, y, direction)
-            if not terrain_type or key in self.structure_map:
-                continue
-
-            cache_key = self._get_structure_cache_key(x, y, direction,
-                                                      terrain_type)
-            if cache_key in self._structure_cache:
-                logger.debug(f"Using cached structure for {cache_key}")
-                cached_structure = self._structure_cache[cache_key]
-                if cached_structure:
-                    self.structure_map[key] = cached_structure
-                    cached_structure.add_card_side(self.last_placed_card,
-                                                   direction)
-                continue
+        self._structure_tracker.add_card(self.game_board,
+                                         self.last_placed_card, x, y)
 
-            connected_sides = self.scan_connected_sides(
-                x, y, direction, terrain_type)
-            connected_structures = {
-                self.structure_map.get(side)
-                for side in connected_sides if self.structure_map.get(side)
-            }
-            connected_structures.discard(None)
-
-            if connected_structures:
-                main_structure = connected_structures.pop()
-                for s in connected_structures:
-                    main_structure.merge(s)
-                    self.structures.remove(s)
-            else:
-                main_structure = Structure(terrain_type.capitalize())
-                self.structures.append(main_structure)
-
-            self._structure_cache[cache_key] = main_structure
-
-            for cx, cy, cdir in connected_sides:
-                self.structure_map[(cx, cy, cdir)] = main_structure
-                main_structure.add_card_side(self.game_board.get_card(cx, cy),
-                                             cdir)
-
-        self._structure_cache_valid = True
-        self._last_board_hash = current_board_hash
-
-    def find_connected_structures(self, x: int, y: int, direction: str,
-                                  terrain_type: str,
-                                  structure_map: dict) -> list:
-        """Find existing structures connected to the given card side."""
-        neighbors = {
-            "N": (x, y - 1, "S"),
-            "S": (x, y + 1, "N"),
-            "E": (x + 1, y, "W"),
-            "W": (x - 1, y, "E")
-        }
-        connected = []
-        for dir, (nx, ny, ndir) in neighbors.items():
-            if direction == dir:
-                s = structure_map.get((nx, ny, ndir))
-                if s and s.get_structure_type().lower() == terrain_type:
-                    logger.debug(
-                        f"Existing structure detected at ({nx}, {ny}) {ndir}")
-                    connected.append(s)
-        return list(set(connected))
-
-    def scan_connected_sides(self, x: int, y: int, direction: str,
-                             terrain_type: str) -> set:
-        """Collect all connected sides forming a continuous structure."""
-        visited = set()
-        stack = [(x, y, direction)]
-        while stack:
-            cx, cy, cdir = stack.pop()
-            if (cx, cy, cdir) in visited:
-                continue
-            card = self.game_board.get_card(cx, cy)
-            if not card:
+    def score_completed_structures(self) -> None:
+        """Check the structures touched by the last placement and score completed ones."""
+        logger.debug("Checking completed structures...")
+        for structure in self._structure_tracker.get_touched_structures():
+            if structure.get_is_completed():
                 continue
-            if card.get_terrains().get(cdir) != terrain_type:
-                continue
-            visited.add((cx, cy, cdir))
-            connected_dirs = card.get_connections().get(
-                cdir, []) if card.get_connections() else []
-            for dir2 in connected_dirs:
-                if (cx, cy, dir2) not in visited:
-                    stack.append((cx, cy, dir2))
-            neighbors = {
-                "N": (cx, cy - 1, "S"),
-                "S": (cx, cy + 1, "N"),
-                "E": (cx + 1, cy, "W"),
-                "W": (cx - 1, cy, "E"),
-                "NW": (cx - 1, cy - 1, "SE"),
-                "NE": (cx + 1, cy - 1, "SW"),
-                "SW": (cx - 1, cy + 1, "NE"),
-                "SE": (cx + 1, cy + 1, "NW"),
-            }
-            corner_side_adjacents = {
-                "NW": [((cx - 1, cy), "NE"), ((cx, cy - 1), "SW")],
-                "NE": [((cx + 1, cy), "NW"), ((cx, cy - 1), "SE")],
-                "SW": [((cx - 1, cy), "SE"), ((cx, cy + 1), "NW")],
-                "SE": [((cx + 1, cy), "SW"), ((cx, cy + 1), "NE")],
-            }
-            """
-            if terrain_type == "field":
-                edge_line_adjacents = {
-                    "N": [((cx - 1, cy), "N"), ((cx + 1, cy), "N")],
-                    "S": [((cx - 1, cy), "S"), ((cx + 1, cy), "S")],
-                    "E": [((cx, cy - 1), "E"), ((cx, cy + 1), "E")],
-                    "W": [((cx, cy - 1), "W"), ((cx, cy + 1), "W")],
-                    "NW": [((cx, cy - 1), "SW"), ((cx - 1, cy), "NE")],
-                    "NE": [((cx, cy - 1), "SE"), ((cx + 1, cy), "NW")],
-                    "SW": [((cx, cy + 1), "NW"), ((cx - 1, cy), "SE")],
-                    "SE": [((cx, cy + 1), "NE"), ((cx + 1, cy), "SW")],
-                }
-                if cdir in edge_line_adjacents:
-                    for (nx, ny), ndir in edge_line_adjacents[cdir]:
-                        neighbor = self.game_board.get_card(nx, ny)
-                        if neighbor and neighbor.get_terrains().get(
-                                ndir) == terrain_type:
-                            if (nx, ny, ndir) not in visited:
-                                stack.append((nx, ny, ndir))
-            """
-            if cdir in neighbors:
-                nx, ny, ndir = neighbors[cdir]
-                neighbor = self.game_board.get_card(nx, ny)
-                if neighbor and neighbor.get_terrains().get(
-                        ndir) == terrain_type:
-                    stack.append((nx, ny, ndir))
-            if cdir in corner_side_adjacents:
-                for (nx, ny), ndir in corner_side_adjacents[cdir]:
-                    neighbor = self.game_board.get_card(nx, ny)
-                    if neighbor and neighbor.get_terrains().get(
-                            ndir) == terrain_type:
-                        stack.append((nx, ny, ndir))
-        return visited
+            structure.check_completion()
+            if structure.get_is_completed():
+                logger.debug(
+                    f"Structure {structure.structure_type} is completed!")
+                if structure.get_structure_type() == "City":
+                    self._structure_tracker.register_completed_city(
+                        structure, self.game_board)
+                self.score_structure(structure)
 
     def score_structure(self, structure: typing.Any) -> None:
         """Score a completed structure by awarding points to the majority owner(s)."""
@@ -741,7 +632,9 @@ class GameSession:
 
         structure.set_color(owners[0].get_color_with_alpha())
         for figure in structure.get_figures()[:]:
+            self._meeple_hash ^= figure_key(figure)
             structure.remove_figure(figure)
+            self._forget_placed_figure(figure)
             figure.owner.add_figure(figure)
             self._increment_board_version()
             logger.info(f"{figure.owner.get_name()}'s figure was returned")
@@ -764,12 +657,10 @@ class GameSession:
                 self.score_structure(structure)
         logger.debug("All meeples have been returned to players")
         self.placed_figures.clear()
+        self._recompute_meeple_hash()
         self._increment_board_version()
 
-        self._invalidate_candidate_cache()
-        self._invalidate_structure_cache()
         self._invalidate_validation_cache()
-        self._invalidate_neighbor_cache()
 
         for player in self.players:
             if hasattr(player, 'invalidate_evaluation_cache'):
@@ -807,66 +698,16 @@ class GameSession:
                 logger.scoring(
                     f"{player.get_name()}: {player.get_score()} points")
 
-    def _get_board_state_hash(self) -> int:
-        """Get a hash of the current board state for caching."""
-        return len([(x, y) for y in range(self.game_board.get_grid_size())
-                    for x in range(self.game_board.get_grid_size())
-                    if self.game_board.get_card(x, y)])
-
-    def _get_structure_cache_key(self, x: int, y: int, direction: str,
-                                 terrain_type: str) -> tuple:
-        """Get a cache key for structure detection."""
-        return (x, y, direction, terrain_type)
-
     def _get_validation_cache_key(self, card: typing.Any, x: int,
                                   y: int) -> tuple:
         """Get a cache key for card validation."""
-        return (id(card), x, y, card.rotation)
-
-    def _update_candidate_positions(self) -> None:
-        """Update the cached candidate positions based on current board state."""
-        current_state = self._get_board_state_hash()
-        if self._last_board_state == current_state:
-            return
-
-        self._last_board_state = current_state
-        self._candidate_positions.clear()
-
-        occupied_positions = set()
-        for y in range(self.game_board.get_grid_size()):
-            for x in range(self.game_board.get_grid_size()):
-                if self.game_board.get_card(x, y):
-                    occupied_positions.add((x, y))
-
-        for x, y in occupied_positions:
-            neighbors = self._get_neighbors_cached(x, y)
-            for nx, ny in neighbors:
-                if not self.game_board.get_card(nx, ny):
-                    self._candidate_positions.add((nx, ny))
+        return (self.game_board.get_zobrist_hash(),
+                card.get_definition().definition_id,
+                card.get_rotation_index(), x, y)
 
     def get_candidate_positions(self) -> set:
         """Get all candidate positions where a card could potentially be placed."""
-        self._update_candidate_positions()
-        return self._candidate_positions.copy()
-
-    def _invalidate_candidate_cache(self) -> None:
-        """Invalidate the candidate positions cache."""
-        self._last_board_state = None
-        self._candidate_positions.clear()
-
-    def invalidate_candidate_cache(self) -> None:
-        """Public method to invalidate the candidate positions cache."""
-        self._invalidate_candidate_cache()
-
-    def _invalidate_structure_cache(self) -> None:
-        """Invalidate the structure detection cache."""
-        self._structure_cache.clear()
-        self._structure_cache_valid = False
-        self._last_board_hash = None
-
-    def invalidate_structure_cache(self) -> None:
-        """Public method to invalidate the structure detection cache."""
-        self._invalidate_structure_cache()
+        return set(self.game_board.iter_frontier())
 
     def _invalidate_validation_cache(self) -> None:
         """Invalidate the card validation cache."""
@@ -877,30 +718,6 @@ class GameSession:
         """Public method to invalidate the card validation cache."""
         self._invalidate_validation_cache()
 
-    def _get_neighbors_cached(self, x: int, y: int) -> set:
-        """Get neighbor positions with caching."""
-        if (x, y) in self._neighbor_cache:
-            return self._neighbor_cache[(x, y)]
-
-        neighbors = set()
-        for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-            nx, ny = x + dx, y + dy
-            if (0 <= nx < self.game_board.get_grid_size()
-                    and 0 <= ny < self.game_board.get_grid_size()):
-                neighbors.add((nx, ny))
-
-        self._neighbor_cache[(x, y)] = neighbors
-        return neighbors
-
-    def _invalidate_neighbor_cache(self) -> None:
-        """Invalidate the neighbor lookup cache."""
-        self._neighbor_cache.clear()
-        self._neighbor_cache_valid = False
-
-    def invalidate_neighbor_cache(self) -> None:
-        """Public method to invalidate the neighbor lookup cache."""
-        self._invalidate_neighbor_cache()
-
     def validate_card_placement_cached(self, card: typing.Any, x: int,
                                        y: int) -> bool:
         """Validate card placement with caching."""
@@ -921,21 +738,7 @@ class GameSession:
         if not card:
             return set()
 
-        candidates = self.get_candidate_positions()
-        valid = set()
-
-        original_rotation = card.rotation
-        try:
-            for x, y in candidates:
-                for rotation in range(4):
-                    if self.validate_card_placement_cached(card, x, y):
-                        valid.add((x, y, card.rotation))
-                    card.rotate()
-        finally:
-            while card.rotation != original_rotation:
-                card.rotate()
-
-        return valid
+        return self.game_board.get_matching_placements(card)
 
     def can_place_card_anywhere(self, card: typing.Any) -> bool:
         """Check if card can be placed anywhere on the board."""
@@ -946,10 +749,7 @@ class GameSession:
             logger.debug("First round - card can always be placed")
             return True
 
-        valid_placements = self.get_valid_placements(card)
-        logger.debug(f"Found {len(valid_placements)} valid placements")
-
-        return len(valid_placements) > 0
+        return self.game_board.has_matching_placement(card)
 
     def get_random_valid_placement(self,
                                    card: typing.Any) -> typing.Optional[tuple]:
@@ -962,13 +762,166 @@ class GameSession:
             return None
 
         x, y, rotation = random.choice(valid_placements)
-
-        original_rotation = card.rotation
-        while card.rotation != rotation:
-            card.rotate()
+        card.set_rotation(rotation)
 
         return (x, y, rotation)
 
+    def apply_move(self,
+                   move: Move,
+                   player: typing.Any = None) -> UndoToken:
+        """
+        Apply a move for search without callbacks, logging or side effects
+        outside the game state.
+
+        Places a new card of the move's tile definition, updates structures,
+        places the meeple, scores structures the placement completed and
+        passes the turn to the next player. The deck and the current card
+        are left untouched; the caller decides which tile comes next.
+
+        Args:
+            move: Move to apply
+            player: Player making the move, defaults to the current player
+
+        Returns:
+            Token for ``undo``
+
+        Raises:
+            ValueError: If the placement or the meeple position is illegal
+        """
+        if player is None:
+            player = self.current_player
+        card = Card.from_definition(move.definition)
+        card.set_rotation(move.rotation)
+        board = self.game_board
+        if board.get_placed_card_count() and not board.validate_card_placement(
+                card, move.x, move.y):
+            raise ValueError(f"Illegal placement {move}")
+
+        entries = []
+        board.place_card(card, move.x, move.y)
+        entries.append((board.remove_card, (move.x, move.y)))
+        tracker = self._structure_tracker
+        tracker.begin_journal(entries)
+        try:
+            tracker.add_card(board, card, move.x, move.y)
+            if move.meeple is not None:
+                self._apply_meeple(player, card, move, entries)
+            for structure in tracker.get_touched_structures():
+                if structure.get_is_completed():
+                    continue
+                structure.check_completion()
+                if structure.get_is_completed():
+                    entries.append((setattr, (structure, "is_completed",
+                                              False)))
+                    if structure.get_structure_type() == "City":
+                        tracker.register_completed_city(structure, board)
+                    self._award_structure_quietly(structure, entries)
+        except Exception:
+            tracker.end_journal()
+            self._replay_undo(entries)
+            raise
+        tracker.end_journal()
+
+        entries.append((setattr, (self, "last_placed_card",
+                                  self.last_placed_card)))
+        entries.append((setattr, (self, "current_player",
+                                  self.current_player)))
+        entries.append((setattr, (self, "turn_id", self.turn_id)))
+        self.last_placed_card = card
+        self.current_player = self._get_next_player(player)
+        self.turn_id += 1
+        return UndoToken(move, entries)
+
+    def undo(self, token: UndoToken) -> None:
+        """
+        Revert a move applied with ``apply_move``.
+
+        Moves must be undone in the reverse order they were applied.
+
+        Args:
+            token: Token returned by ``apply_move``
+        """
+        self._replay_undo(token.entries)
+
+    @staticmethod
+    def _replay_undo(entries: list) -> None:
+        """Run recorded inverse operations newest first."""
+        for function, args in reversed(entries):
+            function(*args)
+
+    def _apply_meeple(self, player: typing.Any, card: typing.Any, move: Move,
+                      entries: list) -> None:
+        """Place the move's meeple on the freshly placed card."""
+        structure = self._structure_tracker.get_structure(
+            (move.x, move.y, move.meeple))
+        if structure is None or structure.get_figures():
+            raise ValueError(f"Illegal meeple position {move}")
+        if not player.figures:
+            raise ValueError(f"Player {player.get_name()} has no meeples left")
+        figure = player.figures.pop()
+        entries.append((player.figures.append, (figure, )))
+        figure.place(card, move.meeple)
+        entries.append((figure.remove, ()))
+        entries.append((setattr, (self, "_meeple_hash", self._meeple_hash)))
+        self._meeple_hash ^= figure_key(figure)
+        self.placed_figures.append(figure)
+        entries.append((self.placed_figures.pop, ()))
+        structure.add_figure(figure)
+        entries.append((structure.remove_figure, (figure, )))
+
+    def _award_structure_quietly(self, structure: typing.Any,
+                                 entries: list) -> None:
+        """Mirror ``score_structure`` for a completed structure, recording undo entries."""
+        score = structure.get_score(game_session=self)
+        owners = structure.get_majority_owners()
+        if not owners:
+            return
+        for owner in owners:
+            owner.add_score(score)
+            entries.append((owner.add_score, (-score, )))
+        entries.append((structure.set_color, (structure.get_color(), )))
+        structure.set_color(owners[0].get_color_with_alpha())
+        entries.append((setattr, (self, "_meeple_hash", self._meeple_hash)))
+        for index in range(len(structure.get_figures()) - 1, -1, -1):
+            figure = structure.get_figures()[index]
+            card, position = figure.card, figure.position_on_card
+            self._meeple_hash ^= figure_key(figure)
+            structure.remove_figure(figure)
+            placed_index = self._forget_placed_figure(figure)
+            if placed_index is not None:
+                entries.append((self.placed_figures.insert,
+                                (placed_index, figure)))
+            figure.owner.add_figure(figure)
+            entries.append((self._unreturn_figure,
+                            (structure, figure, index, card, position)))
+
+    def _forget_placed_figure(self,
+                              figure: typing.Any) -> typing.Optional[int]:
+        """Drop a returned figure from the placed figures and return its index."""
+        for index, placed in enumerate(self.placed_figures):
+            if placed is figure:
+                del self.placed_figures[index]
+                return index
+        return None
+
+    @staticmethod
+    def _unreturn_figure(structure: typing.Any, figure: typing.Any,
+                         index: int, card: typing.Any, position: str) -> None:
+        """Take a scored figure back from its owner and put it on the board again."""
+        figure.owner.figures.pop()
+        figure.place(card, position)
+        structure.restore_figure(figure, index)
+
+    def _get_next_player(self, player: typing.Any) -> typing.Any:
+        """Return the player seated after ``player``."""
+        if player is None or not self.players:
+            return player
+        next_index = (player.get_index() + 1) % len(self.players)
+        for candidate in self.players:
+            if candidate.get_index() == next_index:
+                return candidate
+        return player
+
     def serialize(self) -> dict:
         """Serialize the game session to a dictionary."""
         logger.debug("Serializing game state")
@@ -1009,7 +962,9 @@ class GameSession:
             "lobby_completed":
             self.lobby_completed,
             "network_mode":
-            self.network_mode
+            self.network_mode,
+            "state_hash":
+            self.get_state_hash()
         }
 
     @classmethod
@@ -1089,29 +1044,17 @@ class GameSession:
                     session.placed_figures.append(figure)
             except Exception as e:
                 logger.warning(f"Skipping malformed figure: {fdata} - {e}")
-        session.structures = []
+        structures = []
         for s in data.get("structures", []):
             try:
                 structure = Structure.deserialize(s, session.game_board,
                                                   player_map,
                                                   session.placed_figures)
                 if structure:
-                    session.structures.append(structure)
+                    structures.append(structure)
             except Exception as e:
                 logger.warning(f"Skipping malformed structure: {s} - {e}")
-        session.structure_map = {}
-        seen_keys = set()
-        for structure in session.structures:
-            for card, direction in structure.card_sides:
-                pos_x, pos_y = session.game_board.get_card_position(card)
-                if pos_x is not None and pos_y is not None:
-                    key = (pos_x, pos_y, direction)
-                    if key in seen_keys:
-                        logger.warning(
-                            f"Duplicate structure mapping detected during rebuild: {key}"
-                        )
-                    session.structure_map[key] = structure
-                    seen_keys.add(key)
+        session.structures = structures
         fig_lookup = {
             (f.card, f.position_on_card): f
             for f in session.placed_figures
@@ -1122,4 +1065,11 @@ class GameSession:
                 key = (fig.card, fig.position_on_card)
                 updated_figures.append(fig_lookup.get(key, fig))
             structure.set_figures(updated_figures)
+        session._recompute_meeple_hash()
+        expected_hash = data.get("state_hash")
+        if (expected_hash is not None
+                and expected_hash != session.get_state_hash()):
+            logger.warning(
+                "Deserialized game state does not match the sender's state hash"
+            )
         return session
@@ -0,0 +1,367 @@
+import logging
+import math
+import random
+import time
+import typing
+from collections import Counter
+
+from models.card import Card
+from models.move import Move
+from models.tile_definition import TileDefinition
+
+logger = logging.getLogger(__name__)
+
+
+def unfinished_value(structure: typing.Any) -> float:
+    """Points an incomplete structure would score at the end of the game."""
+    structure_type = structure.get_structure_type()
+    if structure_type == "City":
+        return structure.get_coat_count() + structure.get_card_count()
+    if structure_type == "Road":
+        return structure.get_card_count()
+    if structure_type == "Monastery":
+        return structure.get_neighborhood_count()
+    if structure_type == "Field":
+        return len(structure.get_adjacent_completed_cities()) * 3
+    return 0
+
+
+def is_legal_move(session: typing.Any, move: Move, player: typing.Any) -> bool:
+    """
+    Check a meeple move by applying it.
+
+    A structure completed by the placement has already returned its meeples
+    when it is inspected, so whether it was claimed before can only be told
+    by trying.
+
+    Args:
+        session: Session to try the move on, restored before returning
+        move: Move to check
+        player: Player making the move
+
+    Returns:
+        Whether ``apply_move`` accepts the move
+    """
+    try:
+        token = session.apply_move(move, player)
+    except ValueError:
+        return False
+    session.undo(token)
+    return True
+
+
+def legal_moves(session: typing.Any, definition: TileDefinition,
+                player: typing.Any) -> list[Move]:
+    """
+    List every legal turn for a tile.
+
+    Each placement appears once without a meeple and once for every
+    unclaimed structure on the placed tile the player could claim.
+
+    Args:
+        session: Session to list the moves on, restored before returning
+        definition: Tile to place
+        player: Player making the move
+
+    Returns:
+        List of legal moves
+    """
+    placements = sorted(session.get_game_board().get_matching_placements(
+        Card.from_definition(definition)))
+    moves = []
+    for x, y, rotation in placements:
+        move = Move(x, y, rotation, definition)
+        moves.append(move)
+        if not player.figures:
+            continue
+        token = session.apply_move(move, player)
+        sides = []
+        try:
+            seen = set()
+            terrains = definition.get_rotation(rotation // 90).terrains
+            for side, terrain in terrains.items():
+                if not terrain:
+                    continue
+                structure = session.structure_map.get((x, y, side))
+                if (structure is None or structure.get_figures()
+                        or id(structure) in seen):
+                    continue
+                seen.add(id(structure))
+                sides.append((side, structure.get_is_completed()))
+        finally:
+            session.undo(token)
+        for side, completed in sides:
+            meeple_move = move._replace(meeple=side)
+            if completed and not is_legal_move(session, meeple_move, player):
+                continue
+            moves.append(meeple_move)
+    return moves
+
+
+class _ChanceNode:
+    """
+    Edge of the tree for one action, followed by the draw of the next tile.
+
+    Holds the visit count and the summed rewards of every player, so the
+    parent can rate the action from the point of view of its mover.
+    """
+
+    __slots__ = ("move", "visits", "value_sums", "outcomes")
+
+    def __init__(self, move: typing.Optional[Move], player_count: int) -> None:
+        self.move = move
+        self.visits = 0
+        self.value_sums = [0.0] * player_count
+        self.outcomes: dict[int, _DecisionNode] = {}
+
+
+class _DecisionNode:
+    """A player to move holding a known tile."""
+
+    __slots__ = ("definition", "player_position", "untried", "children",
+                 "visits")
+
+    def __init__(self, definition: TileDefinition) -> None:
+        self.definition = definition
+        self.player_position: typing.Optional[int] = None
+        self.untried: typing.Optional[list] = None
+        self.children: list[_ChanceNode] = []
+        self.visits = 0
+
+
+class MCTSSearch:
+    """
+    Monte Carlo Tree Search over complete turns.
+
+    Actions are (placement, rotation, meeple) triples applied to a private
+    game session with ``GameSession.apply_move`` and reverted with ``undo``.
+    After each action a chance node samples the next tile from the
+    composition of the remaining deck. Leaves are estimated by a short
+    rollout with a random default policy, and the search stops when the
+    time budget or iteration limit is reached, whichever comes first.
+
+    The session is mutated during ``search`` and restored afterwards; pass
+    a snapshot rather than the session the UI is drawing.
+    """
+
+    EXPLORATION = 1.2
+    ROLLOUT_DEPTH = 6
+    ROLLOUT_MEEPLE_CHANCE = 0.3
+    REWARD_SCALE = 20.0
+
+    def __init__(self,
+                 game_session: typing.Any,
+                 rng: typing.Optional[random.Random] = None) -> None:
+        """
+        Initialize a search over a game session.
+
+        Args:
+            game_session: Session to search; its current player must hold
+                the current card
+            rng: Random generator, a new one is created when omitted
+        """
+        self._session = game_session
+        self._rng = rng or random.Random()
+        self._players = list(game_session.get_players())
+        self._positions = {
+            id(player): position
+            for position, player in enumerate(self._players)
+        }
+        self._remaining = Counter()
+        self._definitions: dict[int, TileDefinition] = {}
+        for card in game_session.get_cards_deck():
+            definition = card.get_definition()
+            self._remaining[definition.definition_id] += 1
+            self._definitions[definition.definition_id] = definition
+        self._remaining_total = sum(self._remaining.values())
+        self.iterations = 0
+
+    def search(self,
+               budget_ms: float,
+               max_iterations: typing.Optional[int] = None,
+               on_progress: typing.Optional[typing.Callable[[float], None]] = None,
+               should_stop: typing.Optional[typing.Callable[[], bool]] = None
+               ) -> typing.Optional[Move]:
+        """
+        Search for the best move of the current player.
+
+        Args:
+            budget_ms: Wall-clock budget in milliseconds
+            max_iterations: Optional cap on the number of iterations
+            on_progress: Called with the elapsed fraction of the budget
+            should_stop: Checked before every iteration; the search ends
+                early with its current best move when it returns True
+
+        Returns:
+            Most visited move, or None when the current card cannot be placed
+        """
+        card = self._session.get_current_card()
+        if card is None:
+            return None
+        root = _DecisionNode(card.get_definition())
+        self._expand(root)
+        if not root.untried:
+            return None
+        if len(root.untried) == 1:
+            return root.untried[0]
+
+        start = time.perf_counter()
+        deadline = start + budget_ms / 1000.0
+        while max_iterations is None or self.iterations < max_iterations:
+            now = time.perf_counter()
+            if now >= deadline or (should_stop is not None
+                                   and should_stop()):
+                break
+            self._iterate(root)
+            self.iterations += 1
+            if on_progress is not None and budget_ms > 0:
+                on_progress(min(1.0, (now - start) * 1000.0 / budget_ms))
+
+        best = max(root.children, key=lambda child: child.visits,
+                   default=None)
+        logger.debug(
+            f"MCTS finished {self.iterations} iterations, best move {best.move if best else None}"
+        )
+        if best is None:
+            return root.untried[-1]
+        return best.move
+
+    def _expand(self, node: _DecisionNode) -> None:
+        """List the legal moves at a decision node in random order."""
+        player = self._session.get_current_player()
+        node.player_position = self._positions.get(id(player), 0)
+        node.untried = self.get_legal_moves(node.definition, player)
+        self._rng.shuffle(node.untried)
+
+    def get_legal_moves(self, definition: TileDefinition,
+                        player: typing.Any) -> list[Move]:
+        """List every legal turn for a tile, see ``legal_moves``."""
+        return legal_moves(self._session, definition, player)
+
+    def _iterate(self, root: _DecisionNode) -> None:
+        """Run one selection, expansion, rollout and backpropagation pass."""
+        session = self._session
+        tokens = []
+        drawn = []
+        path = []
+        node = root
+        try:
+            while True:
+                if node.untried is None:
+                    self._expand(node)
+                expanded = False
+                if node.untried:
+                    child = _ChanceNode(node.untried.pop(), len(self._players))
+                    node.children.append(child)
+                    expanded = True
+                elif node.children:
+                    child = self._select(node)
+                else:
+                    child = _ChanceNode(None, len(self._players))
+                    node.children.append(child)
+                path.append((node, child))
+                if child.move is not None:
+                    tokens.append(session.apply_move(child.move))
+                if expanded or not self._remaining_total:
+                    break
+                definition = self._draw(drawn)
+                outcome = child.outcomes.get(definition.definition_id)
+                if outcome is None:
+                    outcome = _DecisionNode(definition)
+                    child.outcomes[definition.definition_id] = outcome
+                node = outcome
+
+            self._rollout(tokens, drawn)
+            rewards = self._rewards()
+        finally:
+            for token in reversed(tokens):
+                session.undo(token)
+            for definition_id in drawn:
+                self._remaining[definition_id] += 1
+            self._remaining_total += len(drawn)
+
+        for parent, child in path:
+            parent.visits += 1
+            child.visits += 1
+            for position, reward in enumerate(rewards):
+                child.value_sums[position] += reward
+
+    def _select(self, node: _DecisionNode) -> _ChanceNode:
+        """Pick the child with the highest UCT value for the node's player."""
+        log_visits = math.log(max(1, node.visits))
+        position = node.player_position
+        best = None
+        best_value = float("-inf")
+        for child in node.children:
+            value = (child.value_sums[position] / child.visits +
+                     self.EXPLORATION * math.sqrt(log_visits / child.visits))
+            if value > best_value:
+                best_value = value
+                best = child
+        return best
+
+    def _draw(self, drawn: list) -> TileDefinition:
+        """Sample the next tile from the remaining deck composition."""
+        pick = self._rng.randrange(self._remaining_total)
+        for definition_id, count in self._remaining.items():
+            if pick < count:
+                break
+            pick -= count
+        self._remaining[definition_id] -= 1
+        self._remaining_total -= 1
+        drawn.append(definition_id)
+        return self._definitions[definition_id]
+
+    def _rollout(self, tokens: list, drawn: list) -> None:
+        """Play a few random turns from the current state."""
+        session = self._session
+        rng = self._rng
+        for _ in range(self.ROLLOUT_DEPTH):
+            if not self._remaining_total:
+                return
+            definition = self._draw(drawn)
+            placements = session.get_game_board().get_matching_placements(
+                Card.from_definition(definition))
+            if not placements:
+                continue
+            x, y, rotation = rng.choice(tuple(placements))
+            move = Move(x, y, rotation, definition)
+            player = session.get_current_player()
+            if player.figures and rng.random() < self.ROLLOUT_MEEPLE_CHANCE:
+                terrains = definition.get_rotation(rotation // 90).terrains
+                sides = [side for side, terrain in terrains.items() if terrain]
+                try:
+                    tokens.append(
+                        session.apply_move(
+                            move._replace(meeple=rng.choice(sides))))
+                    continue
+                except ValueError:
+                    pass
+            tokens.append(session.apply_move(move))
+
+    def _rewards(self) -> list[float]:
+        """
+        Rate the current state for every player between 0 and 1.
+
+        A player's value is their score plus what their meeples would earn
+        if the game ended now; the reward is a squashed margin over the
+        best opponent.
+        """
+        values = [float(player.get_score()) for player in self._players]
+        for structure in self._session.structures:
+            if structure.get_is_completed() or not structure.get_figures():
+                continue
+            value = unfinished_value(structure)
+            for owner in structure.get_majority_owners():
+                position = self._positions.get(id(owner))
+                if position is not None:
+                    values[position] += value
+        rewards = []
+        for position, value in enumerate(values):
+            best_other = max(
+                (other for index, other in enumerate(values)
+                 if index != position),
+                default=0.0)
+            margin = (value - best_other) / self.REWARD_SCALE
+            rewards.append(0.5 + 0.5 * math.tanh(margin))
+        return rewards
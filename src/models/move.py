@@ -0,0 +1,66 @@
+import typing
+
+from models.tile_definition import TileDefinition
+
+
+class Move(typing.NamedTuple):
+    """
+    A complete turn action: where a tile goes, how it is turned and where
+    the player's meeple goes, if anywhere.
+    """
+    x: int
+    y: int
+    rotation: int
+    definition: TileDefinition
+    meeple: typing.Optional[str] = None
+
+
+class Placement(typing.NamedTuple):
+    """
+    A candidate tile placement without a meeple.
+
+    Used by the AI to enumerate and rate placements without creating a
+    ``Card`` per candidate: the rotated layout is read from the shared
+    definition.
+    """
+    x: int
+    y: int
+    rotation: int  # degrees
+    definition: TileDefinition
+
+    @property
+    def rotation_index(self) -> int:
+        """Number of 90° clockwise turns (0-3)."""
+        return self.rotation // 90
+
+    @property
+    def terrains(self) -> typing.Mapping[str, typing.Optional[str]]:
+        """Read-only terrains of the tile in this rotation."""
+        return self.definition.get_rotation(self.rotation // 90).terrains
+
+    def to_move(self, meeple: typing.Optional[str] = None) -> Move:
+        """Get the turn action that makes this placement."""
+        return Move(self.x, self.y, self.rotation, self.definition, meeple)
+
+
+class UndoToken:
+    """
+    Undo log returned by ``GameSession.apply_move``.
+
+    Holds the inverse of every mutation the move made, as
+    ``(function, args)`` entries that ``GameSession.undo`` replays in
+    reverse order.
+    """
+
+    __slots__ = ("move", "entries")
+
+    def __init__(self, move: Move, entries: list) -> None:
+        """
+        Initialize an undo token.
+
+        Args:
+            move: Move that was applied
+            entries: Inverse operations in the order they were recorded
+        """
+        self.move = move
+        self.entries = entries
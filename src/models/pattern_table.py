@@ -0,0 +1,146 @@
+"""Local placement patterns of tiles for the AI.
+
+Which neighboring structures a tile continues, and how many of its sides
+stay open, only depends on the tile, its rotation and the terrains facing
+the empty cell. ``neighbor_signature`` packs those facing terrains into one
+integer and ``PatternTable`` maps (tile definition, rotation, signature) to
+the static part of the placement, so scoring only looks up the structures
+at the stored keys instead of comparing terrains side by side.
+
+The table is filled on first use and shared by every card set: tiles are
+keyed by their registry id, and the signatures that actually occur in games
+are a tiny fraction of all possible ones, so the table is not generated
+ahead of time.
+"""
+
+import threading
+import typing
+
+from models.structure_tracker import ADJACENT_SIDES
+from models.tile_definition import (EDGE_SIGNATURE_SIDE_MASK, TileDefinition,
+                                    terrain_code)
+
+# Sides of neighboring cards that can touch a tile, 4 bits per slot in a
+# neighbor signature.
+NEIGHBOR_SLOTS = tuple(slot for slots in ADJACENT_SIDES.values()
+                       for slot in slots)
+NEIGHBOR_SLOT_SHIFTS = {
+    slot: index * 4
+    for index, slot in enumerate(NEIGHBOR_SLOTS)
+}
+NEIGHBOR_OFFSETS = tuple(sorted({(dx, dy) for dx, dy, _ in NEIGHBOR_SLOTS}))
+
+_CONTRIBUTIONS: dict[tuple[int, int], tuple[int, ...]] = {}
+
+
+class PlacementPattern(typing.NamedTuple):
+    """Static part of placing a tile in a local pattern."""
+    continued: tuple  # (dx, dy, side) of neighboring sides the tile continues
+    open_sides: int  # tile sides that continue no neighboring side
+
+
+def _contributions(definition: TileDefinition,
+                   rotation_index: int) -> tuple[int, ...]:
+    """
+    Get the signature bits a card adds to each cell around it.
+
+    Returns:
+        One partial signature per entry of ``NEIGHBOR_OFFSETS``, for the
+        empty cell the card is seen from at that offset
+    """
+    key = (definition.definition_id, rotation_index)
+    contributions = _CONTRIBUTIONS.get(key)
+    if contributions is None:
+        terrains = definition.get_rotation(rotation_index).terrains
+        contributions = tuple(
+            sum(
+                terrain_code(terrains.get(side)) << shift
+                for (dx, dy, side), shift in NEIGHBOR_SLOT_SHIFTS.items()
+                if (dx, dy) == offset) for offset in NEIGHBOR_OFFSETS)
+        _CONTRIBUTIONS[key] = contributions
+    return contributions
+
+
+def neighbor_signature(game_board: typing.Any, x: int, y: int) -> int:
+    """
+    Pack the terrains facing an empty cell into one integer.
+
+    Every slot of ``NEIGHBOR_SLOTS`` holds the ``terrain_code`` of that side
+    of the neighboring card, or 0 when there is no card.
+
+    Args:
+        game_board: Board holding the neighbors
+        x: X coordinate of the cell
+        y: Y coordinate of the cell
+
+    Returns:
+        Neighbor signature of the cell
+    """
+    signature = 0
+    for index, (dx, dy) in enumerate(NEIGHBOR_OFFSETS):
+        card = game_board.get_card(x + dx, y + dy)
+        if card is not None:
+            signature |= _contributions(
+                card.get_definition(), card.get_rotation_index())[index]
+    return signature
+
+
+class PatternTable:
+    """
+    Memoized ``PlacementPattern`` per (definition, rotation, signature).
+
+    Patterns are computed once and never change, so the table can be read
+    and filled from several threads without locking reads.
+    """
+
+    def __init__(self) -> None:
+        self._patterns: dict[tuple[int, int, int], PlacementPattern] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, definition: TileDefinition, rotation_index: int,
+               signature: int) -> PlacementPattern:
+        """
+        Get the pattern of a tile placed next to a neighbor signature.
+
+        Args:
+            definition: Tile to place
+            rotation_index: Number of 90° clockwise turns (0-3)
+            signature: ``neighbor_signature`` of the cell
+
+        Returns:
+            PlacementPattern of the placement
+        """
+        key = (definition.definition_id, rotation_index, signature)
+        pattern = self._patterns.get(key)
+        if pattern is None:
+            pattern = self._build(definition, rotation_index, signature)
+            with self._lock:
+                pattern = self._patterns.setdefault(key, pattern)
+        return pattern
+
+    @staticmethod
+    def _build(definition: TileDefinition, rotation_index: int,
+               signature: int) -> PlacementPattern:
+        """Compare the tile's sides with the facing terrains."""
+        continued = []
+        open_sides = 0
+        terrains = definition.get_rotation(rotation_index).terrains
+        for side, terrain in terrains.items():
+            if side == "C" or not terrain:
+                continue
+            code = terrain_code(terrain)
+            is_continued = False
+            for slot in ADJACENT_SIDES.get(side, ()):
+                shift = NEIGHBOR_SLOT_SHIFTS[slot]
+                if (signature >> shift) & EDGE_SIGNATURE_SIDE_MASK == code:
+                    continued.append(slot)
+                    is_continued = True
+            if not is_continued:
+                open_sides += 1
+        return PlacementPattern(tuple(continued), open_sides)
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+
+PATTERN_TABLE = PatternTable()
@@ -0,0 +1,486 @@
+"""Batch scoring of candidate tile placements for the AI.
+
+The strategic evaluation of a placement depends on the structures the tile
+would join: the open structures continued by its sides and the monasteries
+around the cell. ``extract_features`` reads the neighbors of every cell once
+per batch, finds the joined structures through ``models.pattern_table`` and
+produces
+
+* a candidates x features matrix of additive features, scored with one dot
+  product against weights taken from an ``AIPreset``, and
+* per-structure statistics (one column per joined structure) for the
+  threshold bonuses of the presets, which are evaluated as ``np.select``
+  ladders over all candidates at once.
+
+NumPy is optional. Without it the same features and ladders are evaluated
+in plain Python, so both backends give identical scores.
+
+``score_meeple_spots`` rates the unclaimed structures of placed candidate
+tiles as meeple spots, for the joint card and meeple search of the AI.
+"""
+
+import math
+import typing
+
+from models.pattern_table import PATTERN_TABLE, neighbor_signature
+from models.structure_stats import StructureStats
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BACKEND = "numpy" if np is not None else "python"
+
+STRUCTURE_TYPE_CODES = {"City": 1, "Road": 2, "Monastery": 3, "Field": 4}
+CITY, ROAD, MONASTERY, FIELD = 1, 2, 3, 4
+
+# Additive features of a candidate, in weight-vector order.
+LINEAR_FEATURES = (
+    "connections",  # structures joined by the tile
+    "completed",  # joined structures that are already complete
+    "unoccupied",  # joined structures without meeples
+    "open_sides",  # tile sides that do not continue any structure
+    "distance",  # Manhattan distance from the board center
+    "figure_ratio",  # completion ratio summed over claimable structures
+    "figure_completed",  # claimable structures that are complete
+    "field_cities",  # completed cities bordering claimable fields
+)
+
+# Statistics of each joined structure, one column per structure.
+SLOT_STATS = ("present", "completed", "unoccupied", "opponent", "size",
+              "ratio", "type", "cities", "neighborhood")
+
+MONASTERY_OFFSETS = tuple((dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+                          if dx or dy)
+
+
+class Ladder(typing.NamedTuple):
+    """
+    An if/elif threshold ladder of a preset.
+
+    The first threshold the statistic passes selects the bonus: with
+    ``above`` the test is ``value > threshold``, otherwise
+    ``value <= threshold``. The mask limits the ladder to certain
+    structures and is evaluated with the same operators on NumPy arrays and
+    plain numbers.
+    """
+    stat: str
+    above: bool
+    thresholds: tuple
+    values: tuple
+    mask: typing.Optional[typing.Callable[[dict], typing.Any]] = None
+
+
+class PlacementFeatures(typing.NamedTuple):
+    """Features of a batch of candidate placements."""
+    linear: list
+    slots: dict
+    distance: list
+
+
+def _present(stats: dict) -> typing.Any:
+    return stats["present"] > 0
+
+
+def _of_type(code: int) -> typing.Callable[[dict], typing.Any]:
+    return lambda stats: stats["type"] == code
+
+
+def _claimable_field(stats: dict) -> typing.Any:
+    return (stats["type"] == FIELD) & (stats["unoccupied"] > 0)
+
+
+def _contested(stats: dict) -> typing.Any:
+    return stats["opponent"] > 0
+
+
+def preset_weights(preset: dict, has_figures: bool) -> list[float]:
+    """
+    Build the weight vector matching ``LINEAR_FEATURES`` for a preset.
+
+    Args:
+        preset: AIPreset dictionary
+        has_figures: Whether the player still has meeples to place
+
+    Returns:
+        List of weights
+    """
+    return [
+        preset["structure_connection"],
+        preset["completion_bonus"],
+        preset["unoccupied_bonus"] + (40.0 if has_figures else 5.0),
+        10.0,
+        -preset["center_penalty"],
+        preset["figure_opportunity"],
+        preset["completion_bonus"] * 1.5,
+        8.0,
+    ]
+
+
+def preset_ladders(preset: dict, game_phase: str) -> tuple[list, list]:
+    """
+    Build the threshold ladders of a preset.
+
+    Args:
+        preset: AIPreset dictionary
+        game_phase: "early", "mid" or "late"
+
+    Returns:
+        Tuple of (structure ladders, candidate ladders); candidate ladders
+        read the ``distance`` statistic of the placement itself
+    """
+    blocking = preset["opponent_blocking"]
+    structure_ladders = [
+        Ladder("ratio", True, (0.9, 0.7, 0.5, 0.3),
+               tuple(reversed(preset["completion_ratio_bonuses"])), _present),
+        Ladder("size", True, (8, 6, 4),
+               tuple(reversed(preset["size_penalties"])), _present),
+        Ladder("ratio", True, (0.8, 0.6, 0.4),
+               tuple(reversed(preset["city_bonuses"])), _of_type(CITY)),
+        Ladder("size", False, (4, 6, 8), (60.0, 40.0, 25.0), _of_type(CITY)),
+        Ladder("ratio", True, (0.8, 0.6, 0.4),
+               tuple(reversed(preset["road_bonuses"])), _of_type(ROAD)),
+        Ladder("size", False, (3, 5, 7), (50.0, 35.0, 20.0), _of_type(ROAD)),
+        Ladder("neighborhood", True, (0.8, 0.6, 0.4),
+               tuple(reversed(preset["monastery_bonuses"])),
+               _of_type(MONASTERY)),
+        Ladder("size", True, (8, 6, 4),
+               tuple(reversed(preset["field_bonuses"])), _claimable_field),
+        Ladder("ratio", True, (0.8, 0.6, 0.4, -math.inf),
+               tuple(value * blocking for value in (120.0, 80.0, 50.0, 25.0)),
+               _contested),
+    ]
+    candidate_ladders = []
+    if game_phase == "early":
+        candidate_ladders.append(
+            Ladder("distance", False, (2, 4, 6), (35.0, 20.0, 10.0)))
+    elif game_phase == "mid":
+        structure_ladders.append(Ladder("size", True, (2, ), (25.0, ),
+                                        _present))
+    else:
+        structure_ladders.append(
+            Ladder("ratio", True, (0.8, 0.6), (70.0, 40.0), _present))
+    return structure_ladders, candidate_ladders
+
+
+def _slot_stats(structure_stat: typing.Any, player: typing.Any) -> tuple:
+    """Collect the ``SLOT_STATS`` of one structure."""
+    return (
+        1,
+        1 if structure_stat.completed else 0,
+        0 if structure_stat.occupied else 1,
+        1 if structure_stat.has_opponent(player) else 0,
+        structure_stat.size,
+        structure_stat.completion_ratio,
+        STRUCTURE_TYPE_CODES.get(structure_stat.structure_type, 0),
+        structure_stat.completed_cities,
+        structure_stat.neighborhood / 9,
+    )
+
+
+def joined_structures(game_session: typing.Any,
+                      x: int,
+                      y: int,
+                      definition: typing.Any,
+                      rotation_index: int,
+                      signature: typing.Optional[int] = None
+                      ) -> tuple[dict, int]:
+    """
+    Find the structures a tile at (x, y) would join.
+
+    The neighboring sides the tile continues come from ``PATTERN_TABLE``;
+    only the structures at those sides are looked up on the board.
+
+    Args:
+        game_session: Current game session
+        x: X coordinate of the empty cell
+        y: Y coordinate of the empty cell
+        definition: Tile to place
+        rotation_index: Number of 90° clockwise turns (0-3)
+        signature: ``neighbor_signature`` of the cell, computed when omitted
+
+    Returns:
+        Tuple of ({structure map key: structure} with one key per distinct
+        structure, number of tile sides that continue no structure)
+    """
+    if signature is None:
+        signature = neighbor_signature(game_session.get_game_board(), x, y)
+    pattern = PATTERN_TABLE.lookup(definition, rotation_index, signature)
+    structure_map = game_session.structure_map
+    joined = {}
+    seen = set()
+    for dx, dy, side in pattern.continued:
+        key = (x + dx, y + dy, side)
+        structure = structure_map.get(key)
+        if structure is not None and id(structure) not in seen:
+            seen.add(id(structure))
+            joined[key] = structure
+    for dx, dy in MONASTERY_OFFSETS:
+        key = (x + dx, y + dy, "C")
+        structure = structure_map.get(key)
+        if (structure is not None and id(structure) not in seen
+                and structure.get_structure_type() == "Monastery"):
+            seen.add(id(structure))
+            joined[key] = structure
+    return joined, pattern.open_sides
+
+
+def extract_features(
+        game_session: typing.Any,
+        player: typing.Any,
+        placements: typing.Sequence[tuple],
+        structure_stats: typing.Optional[StructureStats] = None
+) -> PlacementFeatures:
+    """
+    Extract the features of a batch of candidate placements.
+
+    Statistics of every structure are read once per batch, however many
+    candidates join it.
+
+    Args:
+        game_session: Current game session
+        player: Player the placements are scored for
+        placements: Sequence of (x, y, rotation, definition)
+        structure_stats: Statistics of the current board state, computed
+            when omitted
+
+    Returns:
+        PlacementFeatures with one row per placement
+    """
+    if structure_stats is None:
+        structure_stats = StructureStats.from_session(game_session)
+    board = game_session.get_game_board()
+    center = board.get_center()
+    signatures = {}
+    stats_cache = {}
+    linear = []
+    slot_rows = []
+    distances = []
+    for x, y, rotation, definition in placements:
+        signature = signatures.get((x, y))
+        if signature is None:
+            signature = neighbor_signature(board, x, y)
+            signatures[(x, y)] = signature
+        structures, open_sides = joined_structures(game_session, x, y,
+                                                   definition,
+                                                   (rotation // 90) % 4,
+                                                   signature)
+        row_stats = []
+        for structure in structures.values():
+            stats = stats_cache.get(id(structure))
+            if stats is None:
+                stats = _slot_stats(structure_stats.get(structure), player)
+                stats_cache[id(structure)] = stats
+            row_stats.append(stats)
+
+        distance = abs(x - center) + abs(y - center)
+        connections = completed = unoccupied = completed_claimable = 0
+        figure_ratio = field_cities = 0.0
+        for (_, is_completed, is_unoccupied, _, _, ratio, structure_type,
+             cities, _) in row_stats:
+            connections += 1
+            completed += is_completed
+            unoccupied += is_unoccupied
+            if is_unoccupied:
+                if is_completed:
+                    completed_claimable += 1
+                else:
+                    figure_ratio += ratio
+                if structure_type == FIELD:
+                    field_cities += cities
+        linear.append([
+            connections, completed, unoccupied, open_sides, distance,
+            figure_ratio, completed_claimable, field_cities
+        ])
+        slot_rows.append(row_stats)
+        distances.append(distance)
+
+    width = max((len(row) for row in slot_rows), default=0)
+    padding = (0, ) * len(SLOT_STATS)
+    slots = {name: [] for name in SLOT_STATS}
+    for row in slot_rows:
+        padded = row + [padding] * (width - len(row))
+        for column, name in enumerate(SLOT_STATS):
+            slots[name].append([stats[column] for stats in padded])
+    return PlacementFeatures(linear, slots, distances)
+
+
+def _ladder_value(ladder: Ladder, value: float) -> float:
+    """Evaluate a ladder on one statistic value."""
+    for threshold, bonus in zip(ladder.thresholds, ladder.values):
+        if (value > threshold) if ladder.above else (value <= threshold):
+            return bonus
+    return 0.0
+
+
+def _score_python(features: PlacementFeatures, weights: list,
+                  structure_ladders: list, candidate_ladders: list) -> list:
+    """Score features with plain Python loops."""
+    scores = []
+    for index, row in enumerate(features.linear):
+        score = sum(value * weight for value, weight in zip(row, weights))
+        columns = len(features.slots["present"][index])
+        for column in range(columns):
+            stats = {
+                name: features.slots[name][index][column]
+                for name in SLOT_STATS
+            }
+            if not stats["present"]:
+                continue
+            for ladder in structure_ladders:
+                if ladder.mask is None or ladder.mask(stats):
+                    score += _ladder_value(ladder, stats[ladder.stat])
+        for ladder in candidate_ladders:
+            score += _ladder_value(ladder, features.distance[index])
+        scores.append(float(score))
+    return scores
+
+
+def _select(ladder: Ladder, values: typing.Any) -> typing.Any:
+    """Evaluate a ladder on an array of statistic values."""
+    if ladder.above:
+        conditions = [values > threshold for threshold in ladder.thresholds]
+    else:
+        conditions = [values <= threshold for threshold in ladder.thresholds]
+    return np.select(conditions, ladder.values, 0.0)
+
+
+def _score_numpy(features: PlacementFeatures, weights: list,
+                 structure_ladders: list, candidate_ladders: list) -> list:
+    """Score features with one matrix product and vectorized ladders."""
+    scores = np.asarray(features.linear, dtype=float).reshape(
+        len(features.linear), len(LINEAR_FEATURES)) @ np.asarray(weights,
+                                                                 dtype=float)
+    if features.slots["present"] and features.slots["present"][0]:
+        stats = {
+            name: np.asarray(values, dtype=float)
+            for name, values in features.slots.items()
+        }
+        present = stats["present"] > 0
+        for ladder in structure_ladders:
+            bonus = _select(ladder, stats[ladder.stat])
+            mask = present if ladder.mask is None else (ladder.mask(stats)
+                                                        & present)
+            scores += np.where(mask, bonus, 0.0).sum(axis=1)
+    if candidate_ladders:
+        distance = np.asarray(features.distance, dtype=float)
+        for ladder in candidate_ladders:
+            scores += _select(ladder, distance)
+    return scores.tolist()
+
+
+# Meeple spot bonuses by structure size; the first matching step wins.
+_MEEPLE_SIZE_BONUSES = {
+    "City": ((4, 60.0), (6, 40.0), (8, 25.0)),
+    "Road": ((3, 50.0), (5, 35.0), (7, 20.0)),
+}
+_MEEPLE_FIELD_BONUSES = ((8, 50.0), (6, 35.0), (4, 25.0))
+_MEEPLE_NEIGHBORHOOD_BONUSES = ((0.6, 60.0), (0.4, 40.0), (0.2, 25.0))
+_MEEPLE_RATIO_BONUSES = ((0.8, 120.0), (0.6, 80.0), (0.4, 50.0), (0.2, 25.0))
+
+
+def _first_above(ladder: tuple, value: float) -> float:
+    for threshold, bonus in ladder:
+        if value > threshold:
+            return bonus
+    return 0.0
+
+
+def meeple_score_bound(preset: dict, completed_cities: int) -> float:
+    """
+    Get an upper bound of ``score_meeple_spots`` for any spot.
+
+    Args:
+        preset: AIPreset dictionary
+        completed_cities: Most completed cities any field could touch
+
+    Returns:
+        Score no meeple spot can exceed
+    """
+    claim = max(preset["completion_bonus"] * 3.0,
+                preset["figure_opportunity"])
+    kind = max(60.0, 8.0 * completed_cities + 50.0)
+    return claim + 30.0 + kind + _MEEPLE_RATIO_BONUSES[0][1]
+
+
+def score_meeple_spots(preset: dict, spots: typing.Sequence[typing.Any],
+                       conserve: bool) -> list[float]:
+    """
+    Score a batch of unclaimed structures as meeple spots.
+
+    Matches the meeple evaluation of ``AIPlayer`` for a placed tile, so
+    spots of different candidate placements can be rated in one pass.
+
+    Args:
+        preset: AIPreset dictionary
+        spots: ``StructureStat`` of every spot, read after the placement
+        conserve: Whether the player is saving its last meeples
+
+    Returns:
+        Score of every spot, in input order
+    """
+    completion_bonus = preset["completion_bonus"] * 1.5
+    scores = []
+    for stat in spots:
+        ratio = stat.completion_ratio
+        if stat.completed:
+            score = completion_bonus * 2.0
+        else:
+            score = ratio * preset["figure_opportunity"]
+        score += 30.0
+        if stat.structure_type in _MEEPLE_SIZE_BONUSES:
+            for size, bonus in _MEEPLE_SIZE_BONUSES[stat.structure_type]:
+                if stat.size <= size:
+                    score += bonus
+                    break
+        elif stat.structure_type == "Monastery":
+            score += _first_above(_MEEPLE_NEIGHBORHOOD_BONUSES,
+                                  stat.neighborhood / 9)
+        elif stat.structure_type == "Field":
+            score += stat.completed_cities * 8.0 + _first_above(
+                _MEEPLE_FIELD_BONUSES, stat.size)
+        score += _first_above(_MEEPLE_RATIO_BONUSES, ratio)
+        if conserve:
+            if not stat.completed and ratio < 0.5:
+                score *= 0.5
+            if stat.structure_type == "Field":
+                score *= 0.7
+        scores.append(score)
+    return scores
+
+
+def score_placements(
+        game_session: typing.Any,
+        player: typing.Any,
+        preset: dict,
+        game_phase: str,
+        placements: typing.Sequence[tuple],
+        structure_stats: typing.Optional[StructureStats] = None
+) -> list[float]:
+    """
+    Score a batch of candidate placements for a player.
+
+    Args:
+        game_session: Current game session
+        player: Player the placements are scored for
+        preset: AIPreset dictionary of the player
+        game_phase: "early", "mid" or "late"
+        placements: Sequence of (x, y, rotation, definition)
+        structure_stats: Statistics of the current board state, computed
+            when omitted
+
+    Returns:
+        Strategic score of every placement, in input order
+    """
+    if not placements:
+        return []
+    features = extract_features(game_session, player, placements,
+                                structure_stats)
+    weights = preset_weights(preset, bool(player.figures))
+    structure_ladders, candidate_ladders = preset_ladders(preset, game_phase)
+    if np is not None:
+        return _score_numpy(features, weights, structure_ladders,
+                            candidate_ladders)
+    return _score_python(features, weights, structure_ladders,
+                         candidate_ladders)
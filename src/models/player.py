@@ -1,8 +1,7 @@
-import pygame
 import logging
 import typing
 from models.figure import Figure
-import settings
+from utils.player_colors import PLAYER_COLOR_RGB
 
 logger = logging.getLogger(__name__)
 
@@ -58,19 +57,18 @@ class Player:
         """Get the color of the player's figures."""
         return self.color
 
-    def get_color_with_alpha(self, alpha: int = 150) -> pygame.Color:
+    def get_color_with_alpha(self, alpha: int = 150) -> tuple[int, int, int, int]:
         """
-        Get the player's color as a pygame.Color with the given alpha.
+        Get the player's color as an RGBA tuple with the given alpha.
         
         Args:
             alpha: Alpha value for the color
             
         Returns:
-            pygame.Color with specified alpha
+            RGBA tuple with specified alpha
         """
-        color = pygame.Color(self.color)
-        color.a = alpha
-        return color
+        red, green, blue = PLAYER_COLOR_RGB.get(self.color, (255, 255, 255))
+        return (red, green, blue, alpha)
 
     def get_figure(self) -> typing.Union['Figure', bool]:
         """
@@ -18,11 +18,40 @@ class Structure:
             structure_type: Type of the structure ('City', 'Road', 'Monastery', 'Field')
         """
         self.structure_type = structure_type
-        self.cards = []
+        self._cards = {}
         self.card_sides = set()
         self.figures = []
         self.is_completed = False
         self.color = (255, 255, 255, 150)
+        self.coat_count = 0
+        self.open_edges = 0
+        self.figure_counts = {}
+        self.neighborhood_count = 0
+        self.completed_cities = set()
+        self.version = 0
+
+    @property
+    def cards(self) -> list:
+        """Cards that have at least one side in the structure, in insertion order."""
+        return list(self._cards)
+
+    @cards.setter
+    def cards(self, cards: list) -> None:
+        self.version += 1
+        self._cards = {}
+        self.coat_count = 0
+        for card in cards:
+            self._add_card(card)
+
+    def _add_card(self, card: typing.Any) -> None:
+        """Register a card once and update the coat-of-arms count."""
+        if card in self._cards:
+            return
+        self._cards[card] = None
+        if self.structure_type == "City":
+            features = card.get_features()
+            if features and "coat" in features:
+                self.coat_count += 1
 
     def get_structure_type(self) -> str:
         """Get the structure type."""
@@ -40,6 +69,83 @@ class Structure:
         """Get the list of figures assigned to this structure."""
         return self.figures
 
+    def get_card_count(self) -> int:
+        """Get the number of distinct cards in the structure."""
+        return len(self._cards)
+
+    def get_coat_count(self) -> int:
+        """Get the number of coat-of-arms cards in a city."""
+        return self.coat_count
+
+    def get_version(self) -> int:
+        """
+        Get the change counter of the structure.
+        
+        Every change of sides, figures, edges or completion increases it, so
+        a cached evaluation is still valid while the version is unchanged.
+        """
+        return self.version
+
+    def mark_changed(self) -> None:
+        """Increase the version after changing the structure directly."""
+        self.version += 1
+
+    def get_open_edge_count(self) -> int:
+        """Get the number of N/E/S/W sides that still face an empty space."""
+        return self.open_edges
+
+    def add_open_edges(self, delta: int) -> None:
+        """
+        Adjust the open-edge counter.
+        
+        Args:
+            delta: Number of edges opened (positive) or closed (negative)
+        """
+        self.open_edges += delta
+        self.version += 1
+
+    def get_neighborhood_count(self) -> int:
+        """Get the number of occupied spaces around a monastery, itself included."""
+        return self.neighborhood_count
+
+    def set_neighborhood_count(self, count: int) -> None:
+        """
+        Set the monastery neighborhood count read from the game board.
+        
+        Args:
+            count: Occupied spaces in the 3x3 area around the monastery
+        """
+        self.neighborhood_count = count
+        self.version += 1
+
+    def get_adjacent_completed_cities(self) -> set:
+        """Get the completed cities that border this field."""
+        return self.completed_cities
+
+    def add_completed_city(self, city: 'Structure') -> None:
+        """
+        Record a completed city bordering this field.
+        
+        Args:
+            city: Completed city structure
+        """
+        self.completed_cities.add(city)
+        self.version += 1
+
+    def get_figure_counts(self) -> dict:
+        """Get the number of figures in the structure per owner."""
+        return self.figure_counts
+
+    def _count_figure(self, figure: typing.Any, delta: int) -> None:
+        """Update the per-owner figure count."""
+        self.version += 1
+        owner = figure.get_owner()
+        count = self.figure_counts.get(owner, 0) + delta
+        if count > 0:
+            self.figure_counts[owner] = count
+        else:
+            self.figure_counts.pop(owner, None)
+
     def set_color(self, color: tuple) -> None:
         """
         Set the color of the structure.
@@ -57,6 +163,10 @@ class Structure:
             figures: List of figures to set
         """
         self.figures = figures
+        self.figure_counts = {}
+        self.version += 1
+        for figure in figures:
+            self._count_figure(figure, 1)
 
     def add_card_side(self, card: typing.Any, direction: str) -> None:
         """
@@ -66,9 +176,32 @@ class Structure:
             card: Card to add
             direction: Direction on the card
         """
-        if not card in self.cards:
-            self.cards.append(card)
+        self._add_card(card)
         self.card_sides.add((card, direction))
+        self.version += 1
+
+    def has_card(self, card: typing.Any) -> bool:
+        """Check if the card has a side in this structure."""
+        return card in self._cards
+
+    def remove_card_side(self, card: typing.Any, direction: str,
+                         remove_card: bool) -> None:
+        """
+        Reverse ``add_card_side``.
+        
+        Args:
+            card: Card the side belongs to
+            direction: Direction on the card
+            remove_card: True when the side was the first of its card here
+        """
+        self.card_sides.discard((card, direction))
+        self.version += 1
+        if remove_card and card in self._cards:
+            del self._cards[card]
+            if self.structure_type == "City":
+                features = card.get_features()
+                if features and "coat" in features:
+                    self.coat_count -= 1
 
     def add_figure(self, figure: typing.Any) -> bool:
         """
@@ -82,6 +215,7 @@ class Structure:
         """
         if not self.figures:
             self.figures.append(figure)
+            self._count_figure(figure, 1)
             return True
         return False
 
@@ -95,52 +229,35 @@ class Structure:
         logger.debug(
             f"Removing figure {figure} belonging to {figure.get_owner()}")
         self.figures.remove(figure)
+        self._count_figure(figure, -1)
         figure.remove()
 
+    def restore_figure(self, figure: typing.Any, index: int) -> None:
+        """
+        Put a removed figure back at its previous list position.
+        
+        Args:
+            figure: Figure to restore
+            index: Position in the figure list before removal
+        """
+        self.figures.insert(index, figure)
+        self._count_figure(figure, 1)
+
     def check_completion(self) -> None:
         """Check if the structure is completed and update its status."""
-        if self.structure_type == "City":
-            self.is_completed = self._check_city_completion()
-        elif self.structure_type == "Road":
-            self.is_completed = self._check_road_completion()
+        was_completed = self.is_completed
+        if self.structure_type in ("City", "Road"):
+            self.is_completed = self.open_edges == 0
         elif self.structure_type == "Monastery":
             self.is_completed = self._check_monastery_completion()
         elif self.structure_type == "Field":
             self.is_completed = self._check_field_completion()
-
-    def _check_city_completion(self) -> bool:
-        """Check if the city structure is completed."""
-        for card, direction in self.card_sides:
-            if direction == "C":
-                continue
-            neighbor_card = card.get_neighbors().get(direction)
-            if not neighbor_card:
-                return False
-        return True
-
-    def _check_road_completion(self) -> bool:
-        """Check if the road structure is completed."""
-        for card, direction in self.card_sides:
-            if direction == "C":
-                continue
-            neighbor_card = card.get_neighbors().get(direction)
-            if not neighbor_card:
-                return False
-        return True
+        if self.is_completed != was_completed:
+            self.version += 1
 
     def _check_monastery_completion(self) -> bool:
         """Check if the monastery structure is completed."""
-        for card, direction in self.card_sides:
-            neighbors = card.get_neighbors()
-            for direction in neighbors:
-                if not neighbors[direction]:
-                    return False
-                if direction in [
-                        "N", "S"
-                ] and not (neighbors[direction].get_neighbor("W")
-                           and neighbors[direction].get_neighbor("E")):
-                    return False
-        return True
+        return self.neighborhood_count == 9
 
     def _check_field_completion(self) -> bool:
         """Check if the field structure is completed (always False)."""
@@ -149,20 +266,54 @@ class Structure:
     def get_majority_owners(self) -> list:
         """Get the player(s) with the most figures in this structure."""
         logger.debug("Retrieving structure owners...")
-        owner_counts = {}
-        for figure in self.figures:
-            owner = figure.get_owner()
-            logger.debug(f"Found figure with owner - {owner}")
-            owner_counts[owner] = owner_counts.get(owner, 0) + 1
-        if not owner_counts:
+        if not self.figure_counts:
             return []
-        max_count = max(owner_counts.values())
-        logger.debug(f"Retrieved owners: {owner_counts}")
+        max_count = max(self.figure_counts.values())
+        logger.debug(f"Retrieved owners: {self.figure_counts}")
         return [
-            owner for owner, count in owner_counts.items()
+            owner for owner, count in self.figure_counts.items()
             if count == max_count
         ]
 
+    def get_merge_undo_state(self, other_structure: 'Structure') -> tuple:
+        """
+        Capture what ``merge`` is about to add from another structure.
+        
+        The cost is proportional to the other structure, which is the
+        smaller side of a merge.
+        
+        Args:
+            other_structure: Structure about to be merged into this one
+            
+        Returns:
+            Opaque state for ``undo_merge``
+        """
+        return (other_structure.card_sides - self.card_sides,
+                len(self.figures), dict(self.figure_counts),
+                [card for card in other_structure._cards
+                 if card not in self._cards], self.coat_count,
+                self.open_edges,
+                other_structure.completed_cities - self.completed_cities)
+
+    def undo_merge(self, state: tuple) -> None:
+        """
+        Reverse a merge recorded with ``get_merge_undo_state``.
+        
+        Args:
+            state: State returned before the merge
+        """
+        (added_sides, figure_count, figure_counts, added_cards, coat_count,
+         open_edges, added_cities) = state
+        self.version += 1
+        self.card_sides.difference_update(added_sides)
+        del self.figures[figure_count:]
+        self.figure_counts = figure_counts
+        for card in added_cards:
+            del self._cards[card]
+        self.coat_count = coat_count
+        self.open_edges = open_edges
+        self.completed_cities.difference_update(added_cities)
+
     def merge(self, other_structure: 'Structure') -> None:
         """
         Merge another structure into this one.
@@ -170,12 +321,15 @@ class Structure:
         Args:
             other_structure: Structure to merge into this one
         """
+        self.version += 1
         self.card_sides.update(other_structure.card_sides)
         for figure in other_structure.figures:
             self.figures.append(figure)
-        for card in other_structure.cards:
-            if card not in self.cards:
-                self.cards.append(card)
+            self._count_figure(figure, 1)
+        for card in other_structure._cards:
+            self._add_card(card)
+        self.open_edges += other_structure.open_edges
+        self.completed_cities.update(other_structure.completed_cities)
 
     def get_score(self, game_session: typing.Any = None) -> int:
         """
@@ -191,47 +345,17 @@ class Structure:
         game_over = game_session.get_game_over()
         if self.structure_type == "City":
             if not game_over:
-                for card in self.cards:
-                    if card.get_features():
-                        score += 2 if "coat" in card.get_features() else 0
-                score += len(self.cards) * 2
+                score = (self.coat_count + len(self._cards)) * 2
             else:
-                for card in self.cards:
-                    if card.get_features():
-                        score += 1 if "coat" in card.get_features() else 0
-                score += len(self.cards)
+                score = self.coat_count + len(self._cards)
         elif self.structure_type == "Road":
-            score = len(self.cards)
+            score = len(self._cards)
         elif self.structure_type == "Monastery":
-            for card, direction in self.card_sides:
-                score += 1
-                neighbors = card.get_neighbors()
-                for direction in neighbors:
-                    if neighbors[direction]:
-                        score += 1
-                        if direction in ["N", "S"]:
-                            if neighbors[direction].get_neighbor("W"):
-                                score += 1
-                            if neighbors[direction].get_neighbor("E"):
-                                score += 1
+            score = self.neighborhood_count
         elif self.structure_type == "Field" and game_session:
             if settings.DEBUG:
                 self.is_completed = True
-            scored_cities = set()
-            completed_cities = [
-                s for s in game_session.structures
-                if s.get_structure_type() == "City" and s.get_is_completed()
-            ]
-            for card, _ in self.card_sides:
-                neighbors = card.get_neighbors().values()
-                touched_cards = set([card])
-                touched_cards.update([n for n in neighbors if n])
-                for city_structure in completed_cities:
-                    for city_card, _ in city_structure.card_sides:
-                        if city_card in touched_cards:
-                            scored_cities.add(city_structure)
-                            break
-            score = len(scored_cities) * 3
+            score = len(self.completed_cities) * 3
         return score
 
     def serialize(self) -> dict:
@@ -290,9 +414,7 @@ class Structure:
                 direction = str(side["direction"])
                 card = game_board.get_card(x, y)
                 if card:
-                    s.card_sides.add((card, direction))
-                    if card not in s.cards:
-                        s.cards.append(card)
+                    s.add_card_side(card, direction)
             except (KeyError, ValueError, TypeError) as e:
                 logger.warning(f"Skipping malformed cardSide: {side} - {e}")
         for f in data.get("figures", []):
@@ -314,6 +436,7 @@ class Structure:
                                 and fig.position_on_card == position), None)
                 if matched:
                     s.figures.append(matched)
+                    s._count_figure(matched, 1)
                 else:
                     logger.warning(
                         f"No matching figure found in placed_figures for: {f}")
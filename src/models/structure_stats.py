@@ -0,0 +1,133 @@
+"""Read-only statistics of the structures on the board.
+
+AI evaluators look at the same few numbers of a structure for every
+candidate placement and every tile side: its size, how close it is to
+completion and who occupies it. ``StructureStats`` computes them once for a
+board state and is then shared read-only, also by the AI worker thread, so
+evaluation cost does not grow with the size of the structures.
+"""
+
+import typing
+
+ORTHOGONAL_SIDES = ("N", "E", "S", "W")
+
+
+class StructureStat(typing.NamedTuple):
+    """Statistics of one structure."""
+    structure_type: str
+    size: int  # card sides in the structure
+    card_count: int
+    open_edges: int
+    completion_ratio: float
+    completed: bool
+    owners: frozenset
+    occupied: bool
+    contested: bool  # meeples of more than one player
+    neighborhood: int
+    completed_cities: int
+
+    def has_opponent(self, player: typing.Any) -> bool:
+        """Check whether a player other than ``player`` has a meeple here."""
+        return any(owner is not player for owner in self.owners)
+
+
+def completion_ratio(structure: typing.Any) -> float:
+    """
+    Estimate how close a structure is to completion.
+
+    Cities and roads use the share of their N/E/S/W edges that are already
+    closed by a neighboring tile, monasteries the occupied share of their
+    3x3 neighborhood. Fields never complete.
+
+    Args:
+        structure: Structure to rate
+
+    Returns:
+        Ratio between 0 and 1, 1 for completed structures
+    """
+    if structure.get_is_completed():
+        return 1.0
+    structure_type = structure.get_structure_type()
+    if structure_type == "Monastery":
+        return structure.get_neighborhood_count() / 9
+    if structure_type not in ("City", "Road"):
+        return 0.0
+    edges = sum(1 for _, direction in structure.card_sides
+                if direction in ORTHOGONAL_SIDES)
+    if not edges:
+        return 0.0
+    return max(edges - structure.get_open_edge_count(), 0) / edges
+
+
+def structure_stat(structure: typing.Any) -> StructureStat:
+    """Compute the statistics of one structure."""
+    owners = frozenset(structure.get_figure_counts())
+    return StructureStat(
+        structure_type=structure.get_structure_type(),
+        size=len(structure.card_sides),
+        card_count=structure.get_card_count(),
+        open_edges=structure.get_open_edge_count(),
+        completion_ratio=completion_ratio(structure),
+        completed=structure.get_is_completed(),
+        owners=owners,
+        occupied=bool(structure.get_figures()),
+        contested=len(owners) > 1,
+        neighborhood=structure.get_neighborhood_count(),
+        completed_cities=len(structure.get_adjacent_completed_cities()),
+    )
+
+
+class StructureStats:
+    """Immutable table of ``StructureStat`` for one board state."""
+
+    __slots__ = ("_stats", "state_key")
+
+    def __init__(self,
+                 structures: typing.Iterable[typing.Any],
+                 state_key: typing.Any = None,
+                 previous: typing.Optional['StructureStats'] = None) -> None:
+        """
+        Compute the statistics of a set of structures.
+
+        Args:
+            structures: Structures to include
+            state_key: Identifies the board state the table belongs to
+            previous: Table of an earlier board state; statistics of
+                structures whose version did not change are reused
+        """
+        previous_stats = previous._stats if previous is not None else {}
+        self._stats = {}
+        for structure in structures:
+            version = structure.get_version()
+            entry = previous_stats.get(id(structure))
+            if (entry is None or entry[0] is not structure
+                    or entry[1] != version):
+                entry = (structure, version, structure_stat(structure))
+            self._stats[id(structure)] = entry
+        self.state_key = state_key
+
+    @classmethod
+    def from_session(
+            cls,
+            game_session: typing.Any,
+            state_key: typing.Any = None,
+            previous: typing.Optional['StructureStats'] = None
+    ) -> 'StructureStats':
+        """Compute the statistics of every structure of a game session."""
+        return cls(game_session.structures, state_key, previous)
+
+    def get(self, structure: typing.Any) -> StructureStat:
+        """
+        Get the statistics of a structure.
+
+        Structures created or changed after the table was built are computed
+        on the fly and not stored, so the table stays unchanged.
+        """
+        entry = self._stats.get(id(structure))
+        if (entry is not None and entry[0] is structure
+                and entry[1] == structure.get_version()):
+            return entry[2]
+        return structure_stat(structure)
+
+    def __len__(self) -> int:
+        return len(self._stats)
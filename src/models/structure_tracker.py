@@ -0,0 +1,423 @@
+import logging
+import typing
+from collections.abc import Mapping
+
+from models.structure import Structure
+
+logger = logging.getLogger(__name__)
+
+# A structure node is one terrain segment of a placed card: (x, y, side).
+SideKey = tuple[int, int, str]
+
+ORTHOGONAL_OFFSETS = {
+    "N": (0, -1, "S"),
+    "E": (1, 0, "W"),
+    "S": (0, 1, "N"),
+    "W": (-1, 0, "E"),
+}
+
+# Sides on neighboring cards that continue a side of the card at (0, 0):
+# the facing edge for orthogonal sides, and for corner sides the touching
+# corner of the diagonal card plus the adjacent corners of both edge cards.
+ADJACENT_SIDES = {
+    "N": ((0, -1, "S"), ),
+    "E": ((1, 0, "W"), ),
+    "S": ((0, 1, "N"), ),
+    "W": ((-1, 0, "E"), ),
+    "NW": ((-1, -1, "SE"), (-1, 0, "NE"), (0, -1, "SW")),
+    "NE": ((1, -1, "SW"), (1, 0, "NW"), (0, -1, "SE")),
+    "SW": ((-1, 1, "NE"), (-1, 0, "SE"), (0, 1, "NW")),
+    "SE": ((1, 1, "NW"), (1, 0, "SW"), (0, 1, "NE")),
+}
+
+CARD_SIDES = ("N", "E", "S", "W", "NW", "NE", "SW", "SE", "C")
+
+# A field borders a city when one of its cards holds or touches a city card.
+FIELD_CITY_OFFSETS = ((0, 0), (0, -1), (1, 0), (0, 1), (-1, 0))
+
+
+class StructureMap(Mapping):
+    """Read-only mapping of (x, y, side) to the structure it belongs to."""
+
+    def __init__(self, tracker: 'StructureTracker') -> None:
+        self._tracker = tracker
+
+    def __getitem__(self, key: SideKey) -> Structure:
+        structure = self._tracker.get_structure(key)
+        if structure is None:
+            raise KeyError(key)
+        return structure
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._tracker._parent
+
+    def __iter__(self) -> typing.Iterator[SideKey]:
+        return iter(self._tracker._parent)
+
+    def __len__(self) -> int:
+        return len(self._tracker._parent)
+
+
+class StructureTracker:
+    """
+    Incremental structure detection using a disjoint-set forest.
+
+    Every terrain side of a placed card is a node keyed by (x, y, side).
+    Placing a card only unions its own sides with each other and with the
+    touching sides of its neighbors, so the cost of a placement does not
+    depend on how large the connected city, road or field has grown. The
+    root of each set owns the Structure holding the aggregated cards,
+    figures and open-edge count.
+
+    While a journal is attached, every mutation appends its inverse as a
+    ``(function, args)`` entry so a search can roll a placement back.
+    Path compression is suspended until every journaled placement has been
+    undone, so unions can be undone by restoring the few entries they
+    changed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty tracker."""
+        self._parent: dict[SideKey, SideKey] = {}
+        self._rank: dict[SideKey, int] = {}
+        self._root_structures: dict[SideKey, Structure] = {}
+        self._structures: list[Structure] = []
+        self._structure_index: dict[int, int] = {}
+        self._touched: list[Structure] = []
+        self._journal: typing.Optional[list] = None
+        self._pending_undos = 0
+        self.structure_map = StructureMap(self)
+
+    def begin_journal(self, journal: list) -> None:
+        """
+        Start recording inverse operations into ``journal``.
+
+        Args:
+            journal: List receiving ``(function, args)`` undo entries
+        """
+        self._journal = journal
+        self._pending_undos += 1
+        self._record(self._release_journal)
+
+    def end_journal(self) -> None:
+        """Stop recording inverse operations."""
+        self._journal = None
+
+    def _release_journal(self) -> None:
+        """Undo ``begin_journal`` once its entries have been replayed."""
+        self._pending_undos -= 1
+
+    def _record(self, function: typing.Callable, *args: typing.Any) -> None:
+        """Append an undo entry when a journal is attached."""
+        if self._journal is not None:
+            self._journal.append((function, args))
+
+    def get_structures(self) -> list:
+        """Get the list of live structures."""
+        return self._structures
+
+    def get_touched_structures(self) -> list:
+        """
+        Get the structures whose completion may have changed with the last
+        placement: those containing a side of the placed card, those whose
+        open edges it closed and monasteries in its 3x3 neighborhood.
+        """
+        return [
+            structure for structure in self._touched
+            if id(structure) in self._structure_index
+        ]
+
+    def find(self, key: SideKey) -> SideKey:
+        """
+        Find the root of a side with path compression.
+
+        Args:
+            key: Side key (x, y, side)
+
+        Returns:
+            Root side key of the set
+        """
+        parent = self._parent
+        root = key
+        while parent[root] != root:
+            root = parent[root]
+        if self._pending_undos:
+            return root
+        while parent[key] != root:
+            parent[key], key = root, parent[key]
+        return root
+
+    def get_structure(self, key: SideKey) -> typing.Optional[Structure]:
+        """
+        Get the structure a side belongs to.
+
+        Args:
+            key: Side key (x, y, side)
+
+        Returns:
+            Structure or None if the side is not tracked
+        """
+        if key not in self._parent:
+            return None
+        return self._root_structures.get(self.find(key))
+
+    def _cell_structures(self, x: int, y: int,
+                         structure_type: str) -> typing.Iterator[Structure]:
+        """Yield the structures of one type with a side on the card at (x, y)."""
+        seen = set()
+        for side in CARD_SIDES:
+            structure = self.get_structure((x, y, side))
+            if (structure is not None and id(structure) not in seen
+                    and structure.get_structure_type() == structure_type):
+                seen.add(id(structure))
+                yield structure
+
+    def register_completed_city(self, city: Structure,
+                                game_board: typing.Any) -> None:
+        """
+        Add a newly completed city to the index of every field it borders.
+
+        Args:
+            city: Completed city structure
+            game_board: Board the city's cards are placed on
+        """
+        for card in city.cards:
+            x, y = game_board.get_card_position(card)
+            if x is None or y is None:
+                continue
+            for dx, dy in FIELD_CITY_OFFSETS:
+                for field in self._cell_structures(x + dx, y + dy, "Field"):
+                    self._add_completed_city(field, city)
+
+    def _add_completed_city(self, field: Structure, city: Structure) -> None:
+        """Index a completed city on a field."""
+        if city in field.get_adjacent_completed_cities():
+            return
+        field.add_completed_city(city)
+        self._record(field.get_adjacent_completed_cities().discard, city)
+
+    def _append_structure(self, structure: Structure) -> None:
+        """Add a structure to the live list."""
+        self._structure_index[id(structure)] = len(self._structures)
+        self._structures.append(structure)
+        self._record(self._pop_structure, structure)
+
+    def _pop_structure(self, structure: Structure) -> None:
+        """Undo ``_append_structure`` of the last structure in the list."""
+        self._structures.pop()
+        del self._structure_index[id(structure)]
+
+    def _discard_structure(self, structure: Structure) -> None:
+        """Remove a structure from the live list in O(1) by swapping with the last."""
+        index = self._structure_index.pop(id(structure), None)
+        if index is None:
+            return
+        last = self._structures.pop()
+        if last is not structure:
+            self._structures[index] = last
+            self._structure_index[id(last)] = index
+        self._record(self._restore_structure, structure, index)
+
+    def _restore_structure(self, structure: Structure, index: int) -> None:
+        """Undo ``_discard_structure`` by reversing the swap-pop."""
+        if index < len(self._structures):
+            moved = self._structures[index]
+            self._structure_index[id(moved)] = len(self._structures)
+            self._structures.append(moved)
+            self._structures[index] = structure
+        else:
+            self._structures.append(structure)
+        self._structure_index[id(structure)] = index
+
+    def _make_set(self, key: SideKey) -> None:
+        """Register a new side as its own set."""
+        self._parent[key] = key
+        self._rank[key] = 0
+        self._record(self._forget_side, key)
+
+    def _forget_side(self, key: SideKey) -> None:
+        """Undo ``_make_set``."""
+        del self._parent[key]
+        del self._rank[key]
+
+    def _set_root_structure(self, root: SideKey,
+                            structure: typing.Optional[Structure]) -> None:
+        """Assign or clear the structure owned by a root."""
+        if structure is None:
+            self._root_structures.pop(root, None)
+        else:
+            self._root_structures[root] = structure
+
+    def _union(self, a: SideKey, b: SideKey) -> None:
+        """Union two sides by rank, merging the smaller structure into the larger."""
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return
+        if self._rank[root_a] < self._rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._record(self._parent.__setitem__, root_b, root_b)
+        if self._rank[root_a] == self._rank[root_b]:
+            self._rank[root_a] += 1
+            self._record(self._rank.__setitem__, root_a,
+                         self._rank[root_a] - 1)
+
+        structure_a = self._root_structures.pop(root_a, None)
+        structure_b = self._root_structures.pop(root_b, None)
+        self._record(self._set_root_structure, root_a, structure_a)
+        self._record(self._set_root_structure, root_b, structure_b)
+        if structure_a is None or structure_b is None:
+            survivor = structure_a or structure_b
+        else:
+            if len(structure_a.card_sides) < len(structure_b.card_sides):
+                structure_a, structure_b = structure_b, structure_a
+            if self._journal is not None:
+                self._record(structure_a.undo_merge,
+                             structure_a.get_merge_undo_state(structure_b))
+            structure_a.merge(structure_b)
+            self._discard_structure(structure_b)
+            survivor = structure_a
+        if survivor is not None:
+            self._root_structures[root_a] = survivor
+
+    def add_card(self, game_board: typing.Any, card: typing.Any, x: int,
+                 y: int) -> None:
+        """
+        Add the sides of a newly placed card and connect them to neighbors.
+
+        Args:
+            game_board: Board the card was placed on
+            card: Placed card
+            x: X coordinate of the card
+            y: Y coordinate of the card
+        """
+        terrains = card.get_terrains()
+        sides = [(direction, terrain)
+                 for direction, terrain in terrains.items() if terrain]
+        if not sides or (x, y, sides[0][0]) in self._parent:
+            return
+
+        for direction, _ in sides:
+            self._make_set((x, y, direction))
+
+        connections = card.get_connections() or {}
+        for direction, terrain in sides:
+            for connected in connections.get(direction, ()):
+                if connected != direction and terrains.get(
+                        connected) == terrain:
+                    self._union((x, y, direction), (x, y, connected))
+
+        for direction, terrain in sides:
+            for dx, dy, neighbor_side in ADJACENT_SIDES.get(direction, ()):
+                neighbor_key = (x + dx, y + dy, neighbor_side)
+                if neighbor_key not in self._parent:
+                    continue
+                neighbor = game_board.get_card(x + dx, y + dy)
+                if neighbor and neighbor.get_terrains().get(
+                        neighbor_side) == terrain:
+                    self._union((x, y, direction), neighbor_key)
+
+        for direction, terrain in sides:
+            key = (x, y, direction)
+            root = self.find(key)
+            structure = self._root_structures.get(root)
+            if structure is None:
+                structure = Structure(terrain.capitalize())
+                self._root_structures[root] = structure
+                self._record(self._set_root_structure, root, None)
+                self._append_structure(structure)
+            self._record(structure.remove_card_side, card, direction,
+                         not structure.has_card(card))
+            structure.add_card_side(card, direction)
+            if direction in ORTHOGONAL_OFFSETS:
+                dx, dy, _ = ORTHOGONAL_OFFSETS[direction]
+                if game_board.get_card(x + dx, y + dy) is None:
+                    structure.add_open_edges(1)
+                    self._record(structure.add_open_edges, -1)
+
+        for field in self._cell_structures(x, y, "Field"):
+            for dx, dy in FIELD_CITY_OFFSETS:
+                for city in self._cell_structures(x + dx, y + dy, "City"):
+                    if city.get_is_completed():
+                        self._add_completed_city(field, city)
+
+        touched = {}
+        for direction, _ in sides:
+            structure = self.get_structure((x, y, direction))
+            touched[id(structure)] = structure
+        for dx, dy, facing_side in ORTHOGONAL_OFFSETS.values():
+            neighbor_structure = self.get_structure(
+                (x + dx, y + dy, facing_side))
+            if neighbor_structure is not None:
+                neighbor_structure.add_open_edges(-1)
+                self._record(neighbor_structure.add_open_edges, 1)
+                touched[id(neighbor_structure)] = neighbor_structure
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                monastery = self.get_structure((x + dx, y + dy, "C"))
+                if (monastery is not None and
+                        monastery.get_structure_type() == "Monastery"):
+                    self._record(monastery.set_neighborhood_count,
+                                 monastery.get_neighborhood_count())
+                    monastery.set_neighborhood_count(
+                        game_board.get_monastery_neighborhood_count(
+                            x + dx, y + dy) or 0)
+                    touched[id(monastery)] = monastery
+        self._record(setattr, self, "_touched", self._touched)
+        self._touched = list(touched.values())
+
+    def rebuild(self, structures: list, game_board: typing.Any) -> None:
+        """
+        Replace the tracked state with existing structures.
+
+        Used after deserialization; the sides of each structure are joined
+        into one set and the open-edge counters are recomputed.
+
+        Args:
+            structures: Structures with populated card sides
+            game_board: Board the structures' cards are placed on
+        """
+        self._parent.clear()
+        self._rank.clear()
+        self._root_structures.clear()
+        self._structures = []
+        self._structure_index.clear()
+        for structure in structures:
+            self._append_structure(structure)
+            structure.open_edges = 0
+            root = None
+            for card, direction in structure.card_sides:
+                x, y = game_board.get_card_position(card)
+                if x is None or y is None:
+                    continue
+                key = (x, y, direction)
+                if key in self._parent:
+                    logger.warning(
+                        f"Duplicate structure mapping detected during rebuild: {key}"
+                    )
+                    continue
+                self._make_set(key)
+                if root is None:
+                    root = key
+                    self._rank[root] = 1
+                else:
+                    self._parent[key] = root
+                if direction in ORTHOGONAL_OFFSETS:
+                    dx, dy, _ = ORTHOGONAL_OFFSETS[direction]
+                    if game_board.get_card(x + dx, y + dy) is None:
+                        structure.add_open_edges(1)
+                elif structure.get_structure_type() == "Monastery":
+                    structure.set_neighborhood_count(
+                        game_board.get_monastery_neighborhood_count(x, y)
+                        or 0)
+            if root is not None:
+                self._root_structures[root] = structure
+        for structure in self._structures:
+            structure.completed_cities = set()
+            structure.mark_changed()
+        for structure in self._structures:
+            if (structure.get_structure_type() == "City"
+                    and structure.get_is_completed()):
+                self.register_completed_city(structure, game_board)
+        self._touched = list(self._structures)
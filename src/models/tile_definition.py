@@ -0,0 +1,242 @@
+import logging
+import threading
+import types
+import typing
+
+logger = logging.getLogger(__name__)
+
+# Mapping of every side/corner key to its position after a 90° clockwise turn.
+CLOCKWISE_DIRECTION_MAP = {
+    "N": "E",
+    "E": "S",
+    "S": "W",
+    "W": "N",
+    "NW": "NE",
+    "NE": "SE",
+    "SE": "SW",
+    "SW": "NW",
+    "C": "C",
+}
+
+# Bit offset of each side inside a packed edge signature (4 bits per side).
+EDGE_SIGNATURE_SHIFTS = {"N": 0, "E": 4, "S": 8, "W": 12}
+EDGE_SIGNATURE_SIDE_MASK = 0xF
+
+# Code of every edge terrain inside a signature. The codes are fixed, so
+# signatures are the same in every process whatever order tiles load in;
+# they start at 1 so that a zero nibble never matches a real edge.
+TERRAIN_CODES = types.MappingProxyType({
+    None: 1,
+    "field": 2,
+    "road": 3,
+    "city": 4,
+    "monastery": 5,
+})
+
+
+def rotate_layout(
+    terrains: dict,
+    connections: typing.Optional[dict],
+    steps: int = 1
+) -> tuple[dict, typing.Optional[dict]]:
+    """
+    Rotate terrain and connection dictionaries clockwise.
+
+    Args:
+        terrains: Terrain type for each side
+        connections: Internal connections for each side or None
+        steps: Number of 90° clockwise turns (negative turns counter-clockwise)
+
+    Returns:
+        Tuple of (terrains, connections) in the rotated orientation
+    """
+    for _ in range(steps % 4):
+        terrains = {
+            CLOCKWISE_DIRECTION_MAP.get(direction, direction): terrain
+            for direction, terrain in terrains.items()
+        }
+        if connections:
+            connections = {
+                CLOCKWISE_DIRECTION_MAP.get(direction, direction): [
+                    CLOCKWISE_DIRECTION_MAP.get(conn, conn)
+                    for conn in connected_list
+                ]
+                for direction, connected_list in connections.items()
+            }
+    return terrains, connections
+
+
+def terrain_code(terrain: typing.Optional[str]) -> int:
+    """
+    Get the small integer code of an edge terrain from ``TERRAIN_CODES``.
+
+    Args:
+        terrain: Terrain name of a card side or None
+
+    Returns:
+        Code between 1 and 15
+
+    Raises:
+        ValueError: If the terrain has no code
+    """
+    code = TERRAIN_CODES.get(terrain)
+    if code is None:
+        raise ValueError(f"Unknown edge terrain: {terrain!r}")
+    return code
+
+
+def edge_signature(terrains: typing.Mapping[str,
+                                            typing.Optional[str]]) -> int:
+    """Pack the N/E/S/W terrains of a layout into one integer."""
+    signature = 0
+    for direction, shift in EDGE_SIGNATURE_SHIFTS.items():
+        signature |= terrain_code(terrains.get(direction)) << shift
+    return signature
+
+
+class TileRotation(typing.NamedTuple):
+    """Read-only terrains and connections of a tile in one orientation."""
+    terrains: typing.Mapping[str, typing.Optional[str]]
+    connections: typing.Optional[typing.Mapping[str, tuple[str, ...]]]
+    edge_signature: int
+
+
+def _freeze_rotation(terrains: dict,
+                     connections: typing.Optional[dict]) -> TileRotation:
+    """Wrap a rotated layout into immutable mappings."""
+    frozen_connections = None
+    if connections is not None:
+        frozen_connections = types.MappingProxyType({
+            direction: tuple(connected)
+            for direction, connected in connections.items()
+        })
+    return TileRotation(types.MappingProxyType(dict(terrains)),
+                        frozen_connections, edge_signature(terrains))
+
+
+class TileDefinition:
+    """
+    Shared, read-only description of a tile type.
+
+    Every copy of a tile in the deck references the same definition, so the
+    geometry of a tile type is stored once and the UI can keep one set of
+    surfaces per image path instead of one per card. The layout of all four
+    orientations is computed when the definition is registered, so turning a
+    card only changes an index into ``rotations``.
+    """
+
+    __slots__ = ("image_path", "terrains", "connections", "features",
+                 "is_starting_card", "definition_id", "rotations",
+                 "edge_signatures")
+
+    def __init__(self, image_path: str, terrains: dict,
+                 connections: typing.Optional[dict], features: typing.Any,
+                 is_starting_card: bool, definition_id: int) -> None:
+        """
+        Initialize a tile definition. Use ``TileDefinition.get`` instead of
+        calling this directly so that identical tiles share one instance.
+
+        Args:
+            image_path: Path to the tile image
+            terrains: Terrain type for each side in the unrotated orientation
+            connections: Internal connections in the unrotated orientation
+            features: List of features on the tile
+            is_starting_card: True when the tile can start the game
+            definition_id: Registry index of the definition
+        """
+        self.image_path = image_path
+        self.terrains = terrains
+        self.connections = connections
+        self.features = features
+        self.is_starting_card = is_starting_card
+        self.definition_id = definition_id
+        self.rotations = tuple(
+            _freeze_rotation(*rotate_layout(terrains, connections, steps))
+            for steps in range(4))
+        self.edge_signatures = tuple(rotation.edge_signature
+                                     for rotation in self.rotations)
+
+    def __repr__(self) -> str:
+        return f"TileDefinition({self.definition_id}, {self.image_path!r})"
+
+    @staticmethod
+    def _registry_key(image_path: str, terrains: dict,
+                      connections: typing.Optional[dict], features: typing.Any,
+                      is_starting_card: bool) -> tuple:
+        """Build the hashable registry key for a tile layout."""
+        frozen_connections = None
+        if connections:
+            frozen_connections = tuple(
+                sorted((direction, tuple(connected))
+                       for direction, connected in connections.items()))
+        frozen_features = tuple(features) if features else None
+        return (image_path, tuple(sorted(terrains.items(), key=str)),
+                frozen_connections, frozen_features, bool(is_starting_card))
+
+    @staticmethod
+    def get(image_path: str,
+            terrains: dict,
+            connections: typing.Optional[dict],
+            features: typing.Any,
+            is_starting_card: bool = False) -> 'TileDefinition':
+        """
+        Return the shared definition for a tile layout, creating it once.
+
+        Definitions are keyed by image path together with the layout, so
+        ad-hoc tiles that reuse a placeholder image stay distinct.
+
+        Args:
+            image_path: Path to the tile image
+            terrains: Terrain type for each side in the unrotated orientation
+            connections: Internal connections in the unrotated orientation
+            features: List of features on the tile
+            is_starting_card: True when the tile can start the game
+
+        Returns:
+            Shared TileDefinition instance
+        """
+        key = TileDefinition._registry_key(image_path, terrains, connections,
+                                           features, is_starting_card)
+        definition = _DEFINITION_REGISTRY.get(key)
+        if definition is not None:
+            return definition
+        with _REGISTRY_LOCK:
+            definition = _DEFINITION_REGISTRY.get(key)
+            if definition is not None:
+                return definition
+            definition = TileDefinition(
+                image_path=image_path,
+                terrains=dict(terrains),
+                connections={
+                    direction: list(connected)
+                    for direction, connected in connections.items()
+                } if connections is not None else None,
+                features=list(features) if features else features,
+                is_starting_card=bool(is_starting_card),
+                definition_id=len(_DEFINITIONS))
+            _DEFINITIONS.append(definition)
+            _DEFINITION_REGISTRY[key] = definition
+        logger.debug(f"Registered tile definition {definition}")
+        return definition
+
+    def get_rotation(self, rotation_index: int) -> TileRotation:
+        """
+        Get the precomputed layout for an orientation.
+
+        Args:
+            rotation_index: Number of 90° clockwise turns (0-3)
+
+        Returns:
+            TileRotation with read-only terrains and connections
+        """
+        return self.rotations[rotation_index]
+
+    @staticmethod
+    def by_id(definition_id: int) -> 'TileDefinition':
+        """Return a registered definition by its registry index."""
+        return _DEFINITIONS[definition_id]
+
+
+_DEFINITION_REGISTRY: dict[tuple, TileDefinition] = {}
+_DEFINITIONS: list[TileDefinition] = []
+_REGISTRY_LOCK = threading.Lock()
@@ -0,0 +1,153 @@
+"""Cross-turn cache of AI evaluations.
+
+An evaluation of a placement only reads the tiles around its cell and the
+structures the tile would touch, so a move elsewhere on the board does not
+change it. ``TranspositionCache`` keys entries by the content hash of the
+3x3 area around the cell (``GameBoard.get_area_hash``) and stores the
+version of every structure the entry read. A lookup returns the entry only
+while all those structures are the same objects at the same versions, so
+only entries whose dependencies changed are dropped, and the frontier
+analyzed on consecutive turns turns into cache hits.
+
+Entries are kept per session object, so evaluations of a search snapshot
+never evict or invalidate those of the live session, and the entries of a
+snapshot are dropped with it. Structures are referenced weakly, so an
+entry never keeps a discarded board alive.
+
+Every session holds at most ``max_entries`` entries and evicts the least
+recently used one first.
+"""
+
+import threading
+import typing
+import weakref
+from collections import OrderedDict
+
+# Structure map key, weak reference to the structure and its version when
+# the entry was stored.
+Dependency = typing.Tuple[tuple, weakref.ref, int]
+
+
+def structure_dependencies(structure_map: dict,
+                           keys: typing.Iterable[tuple]) -> tuple:
+    """
+    Record the structures an evaluation read.
+
+    Args:
+        structure_map: Structure map of the session the evaluation read
+        keys: Structure map keys of the read structures
+
+    Returns:
+        Tuple of (key, weak reference, version), skipping keys without
+        structure
+    """
+    dependencies = []
+    for key in keys:
+        structure = structure_map.get(key)
+        if structure is not None:
+            dependencies.append(
+                (key, weakref.ref(structure), structure.get_version()))
+    return tuple(dependencies)
+
+
+class TranspositionCache:
+    """
+    LRU cache of evaluations validated against structure versions.
+
+    Safe to share between the worker threads of one player.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max(int(max_entries), 0)
+        self._scopes: "weakref.WeakKeyDictionary[typing.Any, OrderedDict]" = (
+            weakref.WeakKeyDictionary())
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def get(self, game_session: typing.Any,
+            key: tuple) -> typing.Optional[float]:
+        """
+        Look up an evaluation.
+
+        Args:
+            game_session: Session being evaluated
+            key: Cache key, including the area hash of the cell
+
+        Returns:
+            The cached value, or None when missing or when one of its
+            structures changed since it was stored
+        """
+        structure_map = game_session.structure_map
+        with self._lock:
+            entries = self._scopes.get(game_session)
+            entry = entries.get(key) if entries is not None else None
+            if entry is None:
+                self.misses += 1
+                return None
+            value, dependencies = entry
+            for structure_key, reference, version in dependencies:
+                structure = reference()
+                if (structure is None
+                        or structure_map.get(structure_key) is not structure
+                        or structure.get_version() != version):
+                    del entries[key]
+                    self.invalidations += 1
+                    self.misses += 1
+                    return None
+            entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, game_session: typing.Any, key: tuple, value: float,
+            dependencies: typing.Tuple[Dependency, ...]) -> None:
+        """
+        Store an evaluation.
+
+        Args:
+            game_session: Session the evaluation read
+            key: Cache key, including the area hash of the cell
+            value: Evaluation result
+            dependencies: ``structure_dependencies`` of the evaluation
+        """
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            entries = self._scopes.get(game_session)
+            if entries is None:
+                entries = self._scopes[game_session] = OrderedDict()
+            entries[key] = (value, dependencies)
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+                self.evictions += 1
+
+    def entries(self, game_session: typing.Any) -> dict:
+        """Get a copy of the entries of a session, {key: (value, dependencies)}."""
+        with self._lock:
+            return dict(self._scopes.get(game_session, {}))
+
+    def clear(self) -> None:
+        """Drop every entry, e.g. when the evaluation weights change."""
+        with self._lock:
+            self._scopes.clear()
+
+    def get_stats(self) -> dict:
+        """Get the size and the hit, miss, invalidation and eviction counts."""
+        with self._lock:
+            return {
+                "entries": self._size(),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+            }
+
+    def _size(self) -> int:
+        return sum(len(entries) for entries in self._scopes.values())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._size()
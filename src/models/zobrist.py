@@ -0,0 +1,155 @@
+"""64-bit Zobrist keys for incremental hashing of game state.
+
+Every element of the state (a tile in a cell, a meeple on a card side, the
+tile in hand, the player to move) has a fixed pseudo-random key, and a state
+hash is the XOR of the keys of everything present. Adding or removing an
+element is a single XOR, and the same position reached in any order has the
+same hash.
+
+Keys are derived with splitmix64 from a stable description of the element
+rather than drawn from a random generator, so they are identical in every
+process; a host and its clients can compare hashes directly.
+"""
+
+import typing
+import zlib
+
+from models.tile_definition import TileDefinition
+
+MASK_64 = (1 << 64) - 1
+
+# Domain constants keep keys of different element kinds apart.
+_TILE_DOMAIN = 0x54494C45
+_MEEPLE_DOMAIN = 0x4D454550
+_HAND_DOMAIN = 0x48414E44
+_PLAYER_DOMAIN = 0x504C4159
+
+_DEFINITION_KEYS: dict[int, int] = {}
+_KEY_CACHE: dict[tuple, int] = {}
+
+
+def splitmix64(value: int) -> int:
+    """Scramble a 64-bit integer with the splitmix64 finalizer."""
+    value = (value + 0x9E3779B97F4A7C15) & MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return value ^ (value >> 31)
+
+
+def _mix(*parts: int) -> int:
+    """Fold integer parts into one key."""
+    key = 0
+    for part in parts:
+        key = splitmix64(key ^ (part & MASK_64))
+    return key
+
+
+def definition_key(definition: TileDefinition) -> int:
+    """
+    Get a process-independent number identifying a tile definition.
+
+    ``definition_id`` depends on registration order, so the key is taken
+    from the image path and layout instead.
+
+    Args:
+        definition: Tile definition
+
+    Returns:
+        32-bit checksum of the definition's registry key
+    """
+    key = _DEFINITION_KEYS.get(definition.definition_id)
+    if key is None:
+        registry_key = TileDefinition._registry_key(
+            definition.image_path, definition.terrains,
+            definition.connections, definition.features,
+            definition.is_starting_card)
+        key = zlib.crc32(repr(registry_key).encode("utf-8"))
+        _DEFINITION_KEYS[definition.definition_id] = key
+    return key
+
+
+def _cached(cache_key: tuple, *parts: int) -> int:
+    """Return a memoized key for ``parts``."""
+    key = _KEY_CACHE.get(cache_key)
+    if key is None:
+        key = _mix(*parts)
+        _KEY_CACHE[cache_key] = key
+    return key
+
+
+def tile_key(x: int, y: int, definition: TileDefinition,
+             rotation_index: int) -> int:
+    """
+    Get the key of a tile placed in a cell.
+
+    Args:
+        x: X coordinate of the cell
+        y: Y coordinate of the cell
+        definition: Tile definition of the placed card
+        rotation_index: Number of 90° clockwise turns (0-3)
+
+    Returns:
+        64-bit key
+    """
+    return _cached((_TILE_DOMAIN, x, y, definition.definition_id,
+                    rotation_index), _TILE_DOMAIN, x, y,
+                   definition_key(definition), rotation_index)
+
+
+def meeple_key(x: int, y: int, side: str, owner_index: int) -> int:
+    """
+    Get the key of a meeple on a side of a placed card.
+
+    Args:
+        x: X coordinate of the card
+        y: Y coordinate of the card
+        side: Side or center of the card the meeple stands on
+        owner_index: Index of the owning player
+
+    Returns:
+        64-bit key
+    """
+    return _cached((_MEEPLE_DOMAIN, x, y, side, owner_index), _MEEPLE_DOMAIN,
+                   x, y, zlib.crc32(side.encode("utf-8")), owner_index)
+
+
+def hand_key(definition: TileDefinition, rotation_index: int) -> int:
+    """
+    Get the key of the tile in hand and its rotation.
+
+    Args:
+        definition: Tile definition of the current card
+        rotation_index: Number of 90° clockwise turns (0-3)
+
+    Returns:
+        64-bit key
+    """
+    return _cached((_HAND_DOMAIN, definition.definition_id, rotation_index),
+                   _HAND_DOMAIN, definition_key(definition), rotation_index)
+
+
+def player_key(player_index: int) -> int:
+    """Get the key of the player to move."""
+    return _cached((_PLAYER_DOMAIN, player_index), _PLAYER_DOMAIN,
+                   player_index)
+
+
+def figure_key(figure: typing.Any) -> int:
+    """
+    Get the meeple key of a placed figure.
+
+    Args:
+        figure: Figure standing on a placed card
+
+    Returns:
+        64-bit key, or 0 when the figure is not on the board
+    """
+    card = figure.card
+    if card is None or figure.position_on_card is None:
+        return 0
+    position = card.get_position()
+    x, y = position["X"], position["Y"]
+    if x is None or y is None:
+        return 0
+    return meeple_key(x, y, figure.position_on_card,
+                      figure.get_owner().get_index())
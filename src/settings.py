@@ -61,3 +61,18 @@ MAX_RETRY_ATTEMPTS = 3
 AI_USE_SIMULATION = True
 AI_STRATEGIC_CANDIDATES = 3
 AI_THINKING_SPEED = -1
+AI_MCTS_BUDGET_MS = 1000
+# Hard deadline of a searching AI turn; the best completed search depth is played
+AI_TURN_BUDGET_MS = 2000
+# Precompute AI evaluations for likely next tiles while other players move
+AI_PONDER = False
+# Processes scoring AI placements: 0 scores in a thread, -1 uses all cores but one
+AI_PROCESS_WORKERS = 0
+# AI evaluations kept across turns per player, least recently used dropped first
+AI_EVALUATION_CACHE_SIZE = 20000
+# Tiles left in the deck at which the AI searches the rest of the game exactly, -1 never.
+# With 1 tile left the solve takes ~0.2s (max ~0.6s); with 2 it does not finish in 20s,
+# so a larger value only spends AI_TURN_BUDGET_MS on a search that gives up.
+AI_ENDGAME_TILES = 1
+# JSON presets written by src/tuning.py, relative to src/, replacing the built-in presets it holds; "" never
+AI_TUNED_PRESETS = ""
@@ -0,0 +1,326 @@
+"""
+Headless self-play tournament between AI players.
+
+Plays games between AI line-ups without the pygame loop, one game per pool
+process, and streams one JSON line per finished game. When all games are
+done, win rates, Elo ratings and turn latency percentiles are printed per
+line-up entry.
+
+Usage:
+    python src/tournament.py --games 20 --lineup AI_EASY_ AI_EXPERT_ \\
+        --workers 4 --seed 1 --output results.jsonl
+
+Every game reseeds the random generator with ``seed + game number``, so a
+game deals the same deck and seats the same colors on every run. The moves
+themselves are only reproducible when no search is cut by the turn budget.
+"""
+
+import argparse
+import json
+import logging
+import math
+import multiprocessing
+import random
+import sys
+import time
+import typing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from models.game_session import GameSession
+from utils.settings_manager import settings_manager
+
+DIFFICULTY_PREFIXES = ("AI_EASY_", "AI_NORMAL_", "AI_HARD_", "AI_EXPERT_",
+                       "AI_MCTS_")
+ELO_START = 1500.0
+ELO_K = 16.0
+LATENCY_PERCENTILES = (50, 90, 99)
+# Turns after which a game is abandoned; a full base game has 72 tiles.
+MAX_TURNS = 500
+
+
+def _seat_slots(lineup: typing.Sequence[str], game: int) -> list[int]:
+    """Rotate the seats every game so that no entry always moves first."""
+    shift = game % len(lineup)
+    slots = list(range(len(lineup)))
+    return slots[shift:] + slots[:shift]
+
+
+def play_game(
+    game: int,
+    seed: int,
+    lineup: typing.Sequence[str],
+    settings: typing.Mapping[str, typing.Any],
+    presets: typing.Optional[typing.Mapping[int, dict]] = None
+) -> dict:
+    """
+    Play one headless game.
+
+    Args:
+        game: Game number, also used to rotate the seats
+        seed: Seed of the random generator for this game
+        lineup: Line-up entries, one player name prefix per seat
+        settings: Temporary settings applied during the game and restored
+            when it ends
+        presets: AIPreset dictionaries replacing the preset of the
+            difficulty, by line-up slot
+
+    Returns:
+        Result dictionary of the game
+    """
+    previous = {key: settings_manager.get(key) for key in settings}
+    for key, value in settings.items():
+        settings_manager.set(key, value, temporary=True)
+    try:
+        return _play_game(game, seed, lineup, presets)
+    finally:
+        for key, value in previous.items():
+            settings_manager.set(key, value, temporary=True)
+
+
+def _play_game(
+    game: int,
+    seed: int,
+    lineup: typing.Sequence[str],
+    presets: typing.Optional[typing.Mapping[int, dict]]
+) -> dict:
+    """Play one headless game with the settings already applied."""
+    random.seed(seed)
+    slots = _seat_slots(lineup, game)
+    session = GameSession(
+        [f"{lineup[slot]}{seat + 1}" for seat, slot in enumerate(slots)])
+    for seat, player in enumerate(session.get_players()):
+        if presets and slots[seat] in presets:
+            player.set_preset(presets[slots[seat]])
+    turn_times = {player.get_name(): [] for player in session.get_players()}
+    started = time.perf_counter()
+    turns = 0
+    while not session.get_game_over():
+        if turns >= MAX_TURNS:
+            raise RuntimeError(
+                f"Game {game} did not finish in {MAX_TURNS} turns")
+        player = session.get_current_player()
+        turn_started = time.perf_counter()
+        player.play_turn_blocking(session)
+        turn_times[player.get_name()].append(
+            (time.perf_counter() - turn_started) * 1000.0)
+        turns += 1
+
+    players = []
+    for seat, player in enumerate(session.get_players()):
+        player.stop()
+        players.append({
+            "entry": lineup[slots[seat]],
+            "slot": slots[seat],
+            "name": player.get_name(),
+            "score": player.get_score(),
+            "turn_ms": [round(ms, 3) for ms in turn_times[player.get_name()]],
+            "nodes": player.get_nodes_evaluated(),
+        })
+    return {
+        "game": game,
+        "seed": seed,
+        "turns": turns,
+        "duration_s": round(time.perf_counter() - started, 3),
+        "players": players,
+    }
+
+
+def silence_logging() -> None:
+    """Silence game logging in tournament processes."""
+    logging.disable(logging.CRITICAL)
+
+
+def run_tournament(
+    games: int,
+    lineup: typing.Sequence[str],
+    seed: int = 0,
+    workers: int = 1,
+    settings: typing.Optional[typing.Mapping[str, typing.Any]] = None
+) -> typing.Iterator[dict]:
+    """
+    Play a series of games and yield their results as they finish.
+
+    Args:
+        games: Number of games to play
+        lineup: Line-up entries, one player name prefix per seat
+        seed: Seed of the first game; game ``n`` uses ``seed + n``
+        workers: Number of processes; 1 plays the games in this process
+        settings: Temporary settings applied in every game
+
+    Yields:
+        Result dictionary of every game, in completion order
+    """
+    settings = dict(settings or {})
+    # Games already use every process, so evaluation stays in-thread.
+    settings["AI_PROCESS_WORKERS"] = 0
+    # Line-ups play the built-in presets unless a tuned file is asked for.
+    settings.setdefault("AI_TUNED_PRESETS", "")
+    if workers <= 1:
+        for game in range(games):
+            yield play_game(game, seed + game, lineup, settings)
+        return
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=silence_logging) as pool:
+        futures = [
+            pool.submit(play_game, game, seed + game, lineup, settings)
+            for game in range(games)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def percentile(values: typing.Sequence[float], rank: float) -> float:
+    """
+    Get a percentile of a list of values by linear interpolation.
+
+    Args:
+        values: Values to rank
+        rank: Percentile between 0 and 100
+
+    Returns:
+        The percentile, or 0.0 for an empty list
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * rank / 100.0
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position -
+                                                                  lower)
+
+
+def summarize(results: typing.Iterable[dict]) -> dict:
+    """
+    Aggregate game results per line-up entry.
+
+    Wins are shared between tied players. Elo ratings are updated for
+    every pair of different entries in a game, in game order.
+
+    Args:
+        results: Result dictionaries of ``play_game``
+
+    Returns:
+        Dictionary of entry to its games, wins, win rate, Elo rating,
+        evaluated nodes per turn and turn latency percentiles
+    """
+    summary = {}
+    ratings = {}
+    turn_times = {}
+    for result in sorted(results, key=lambda result: result["game"]):
+        players = result["players"]
+        best = max(player["score"] for player in players)
+        winners = [player for player in players if player["score"] == best]
+        for player in players:
+            entry = player["entry"]
+            stats = summary.setdefault(entry, {
+                "games": 0,
+                "wins": 0.0,
+                "nodes": 0,
+                "turns": 0
+            })
+            stats["games"] += 1
+            stats["nodes"] += player["nodes"]
+            stats["turns"] += len(player["turn_ms"])
+            if player in winners:
+                stats["wins"] += 1.0 / len(winners)
+            turn_times.setdefault(entry, []).extend(player["turn_ms"])
+            ratings.setdefault(entry, ELO_START)
+
+        updates = {}
+        for first in players:
+            for second in players:
+                if first["entry"] == second["entry"]:
+                    continue
+                expected = 1.0 / (1.0 + 10**(
+                    (ratings[second["entry"]] - ratings[first["entry"]]) /
+                    400.0))
+                actual = (1.0 if first["score"] > second["score"] else
+                          0.5 if first["score"] == second["score"] else 0.0)
+                updates[first["entry"]] = updates.get(
+                    first["entry"], 0.0) + ELO_K * (actual - expected)
+        for entry, update in updates.items():
+            ratings[entry] += update
+
+    for entry, stats in summary.items():
+        stats["win_rate"] = stats["wins"] / stats["games"]
+        stats["elo"] = ratings[entry]
+        stats["nodes_per_turn"] = stats["nodes"] / max(stats["turns"], 1)
+        times = turn_times[entry]
+        for rank in LATENCY_PERCENTILES:
+            stats[f"p{rank}_ms"] = percentile(times, rank)
+        stats["max_ms"] = max(times, default=0.0)
+    return summary
+
+
+def _parse_lineup_entry(entry: str) -> str:
+    """Check that a line-up entry names an AI difficulty."""
+    if not entry.endswith("_"):
+        entry += "_"
+    if entry not in DIFFICULTY_PREFIXES:
+        raise argparse.ArgumentTypeError(
+            f"unknown AI line-up entry {entry!r}, expected one of "
+            f"{', '.join(DIFFICULTY_PREFIXES)}")
+    return entry
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """Run a tournament from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Play headless games between AI players.")
+    parser.add_argument("--games", type=int, default=10,
+                        help="number of games to play")
+    parser.add_argument("--lineup", nargs="+", type=_parse_lineup_entry,
+                        default=["AI_NORMAL_", "AI_HARD_"],
+                        help="one AI prefix per seat, e.g. AI_EASY_ AI_EXPERT_")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the first game")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes to play games in")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="AI turn budget, overrides AI_TURN_BUDGET_MS")
+    parser.add_argument("--mcts-budget-ms", type=float, default=None,
+                        help="MCTS budget, overrides AI_MCTS_BUDGET_MS")
+    parser.add_argument("--output", default=None,
+                        help="JSONL file for per-game results (default: stdout)")
+    args = parser.parse_args(argv)
+    if len(args.lineup) < 2:
+        parser.error("a line-up needs at least two seats")
+
+    settings = {"AI_USE_SIMULATION": True, "AI_PONDER": False}
+    if args.budget_ms is not None:
+        settings["AI_TURN_BUDGET_MS"] = args.budget_ms
+    if args.mcts_budget_ms is not None:
+        settings["AI_MCTS_BUDGET_MS"] = args.mcts_budget_ms
+
+    silence_logging()
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    results = []
+    try:
+        for result in run_tournament(args.games, args.lineup, args.seed,
+                                     args.workers, settings):
+            results.append(result)
+            output.write(json.dumps(result) + "\n")
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    summary = summarize(results)
+    print(f"{'entry':<12}{'games':>6}{'win %':>8}{'elo':>8}"
+          f"{'nodes/turn':>12}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}"
+          f"{'max ms':>9}", file=sys.stderr)
+    for entry, stats in sorted(summary.items(),
+                               key=lambda item: -item[1]["elo"]):
+        print(f"{entry:<12}{stats['games']:>6}{stats['win_rate'] * 100:>8.1f}"
+              f"{stats['elo']:>8.0f}{stats['nodes_per_turn']:>12.1f}"
+              f"{stats['p50_ms']:>9.1f}{stats['p90_ms']:>9.1f}"
+              f"{stats['p99_ms']:>9.1f}{stats['max_ms']:>9.1f}",
+              file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,407 @@
+"""
+Tune the weights of an AIPreset by self-play.
+
+An evolution strategy with antithetic sampling searches the numeric values
+of one difficulty's preset. Every generation plays each candidate against
+the untuned preset in headless games (see ``tournament``), spread over a
+process pool. All candidates of a generation play the same seeds, so the
+ranking compares them on equal decks. Fitness is the mean score margin
+minus a penalty per millisecond of turn time, so that cheaper weights win
+over equally strong but slower ones.
+
+The state is checkpointed to JSON after every generation and a run resumes
+from its checkpoint. The tuned preset is written as JSON:
+
+    python src/tuning.py --difficulty HARD --generations 40 --workers 8 \\
+        --checkpoint hard.json
+
+The written file, ``src/tuned_presets.json`` by default, holds
+``{"note": ..., "presets": {"HARD": {...}}}``. AI players load it only when
+the AI_TUNED_PRESETS setting names it, e.g. ``"tuned_presets.json"``
+relative to ``src/``, and its presets replace the matching dictionaries of
+``AIPreset``.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import typing
+from concurrent.futures import ProcessPoolExecutor
+
+from models.ai_player import TUNED_PRESETS_DIR, AIPreset
+import tournament
+
+# Keys that change the search rather than its weights.
+FIXED_KEYS = ("search_depth", )
+TUNABLE_DIFFICULTIES = ("EASY", "NORMAL", "HARD", "EXPERT")
+
+
+class Parameter(typing.NamedTuple):
+    """One tunable number of a preset."""
+    key: str
+    index: typing.Optional[int]  # position in a list value, None for scalars
+    base: float
+    scale: float  # change of the value per unit of the search vector
+    integer: bool
+
+
+def preset_parameters(preset: dict) -> list[Parameter]:
+    """
+    List the tunable numbers of a preset in a fixed order.
+
+    Args:
+        preset: AIPreset dictionary
+
+    Returns:
+        One Parameter per scalar and per list element
+    """
+    parameters = []
+    for key in sorted(preset):
+        if key in FIXED_KEYS:
+            continue
+        value = preset[key]
+        values = value if isinstance(value, list) else [value]
+        for index, item in enumerate(values):
+            parameters.append(
+                Parameter(key, index if isinstance(value, list) else None,
+                          float(item), max(abs(float(item)), 1.0),
+                          isinstance(item, int)))
+    return parameters
+
+
+def build_preset(base: dict, parameters: typing.Sequence[Parameter],
+                 vector: typing.Sequence[float]) -> dict:
+    """
+    Build a preset from a search vector.
+
+    The vector holds relative changes, ``value = base + scale * x``.
+    Values keep the sign of their base value and integers stay integers.
+
+    Args:
+        base: Preset the parameters were taken from
+        parameters: Result of ``preset_parameters``
+        vector: One number per parameter
+
+    Returns:
+        New AIPreset dictionary
+    """
+    preset = {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in base.items()
+    }
+    for parameter, x in zip(parameters, vector):
+        value = parameter.base + parameter.scale * x
+        if parameter.base > 0:
+            value = max(value, 0.0)
+        elif parameter.base < 0:
+            value = min(value, 0.0)
+        value = int(round(value)) if parameter.integer else round(value, 3)
+        if parameter.index is None:
+            preset[parameter.key] = value
+        else:
+            preset[parameter.key][parameter.index] = value
+    return preset
+
+
+def _centered_ranks(values: typing.Sequence[float]) -> list[float]:
+    """Replace values by their rank, scaled to -0.5 ... 0.5."""
+    order = sorted(range(len(values)), key=lambda index: values[index])
+    ranks = [0.0] * len(values)
+    for rank, index in enumerate(order):
+        ranks[index] = rank / max(len(values) - 1, 1) - 0.5
+    return ranks
+
+
+def fitness(results: typing.Iterable[dict], ms_penalty: float) -> float:
+    """
+    Rate a candidate from the games it played in line-up slot 0.
+
+    Args:
+        results: Result dictionaries of ``tournament.play_game``
+        ms_penalty: Score points deducted per millisecond of mean turn time
+
+    Returns:
+        Mean margin over the best opponent minus the time penalty
+    """
+    margins = []
+    turn_times = []
+    for result in results:
+        candidate = next(player for player in result["players"]
+                         if player["slot"] == 0)
+        best_other = max(player["score"] for player in result["players"]
+                         if player is not candidate)
+        margins.append(candidate["score"] - best_other)
+        turn_times.extend(candidate["turn_ms"])
+    mean_ms = sum(turn_times) / len(turn_times) if turn_times else 0.0
+    return sum(margins) / max(len(margins), 1) - ms_penalty * mean_ms
+
+
+class PresetTuner:
+    """
+    Evolution strategy over the numbers of one preset.
+
+    Each generation samples ``pairs`` mirrored perturbations of the mean,
+    ranks the candidates by ``fitness`` and moves the mean along the
+    rank-weighted perturbations. The step width decays every generation.
+    """
+
+    def __init__(self,
+                 difficulty: str,
+                 pairs: int = 4,
+                 games: int = 8,
+                 sigma: float = 0.2,
+                 learning_rate: float = 0.5,
+                 sigma_decay: float = 0.97,
+                 min_sigma: float = 0.02,
+                 ms_penalty: float = 0.02,
+                 seed: int = 0,
+                 settings: typing.Optional[dict] = None) -> None:
+        """
+        Initialize a tuner for a difficulty.
+
+        Args:
+            difficulty: Preset to tune, one of ``TUNABLE_DIFFICULTIES``
+            pairs: Mirrored candidate pairs per generation
+            games: Games per candidate and generation
+            sigma: Initial perturbation width, relative to the base values
+            learning_rate: Step of the mean per generation
+            sigma_decay: Factor applied to sigma after every generation
+            min_sigma: Lower bound of sigma
+            ms_penalty: Points deducted per millisecond of turn time
+            seed: Seed of the perturbations and of the games
+            settings: Temporary settings applied in every game
+        """
+        if difficulty not in TUNABLE_DIFFICULTIES:
+            raise ValueError(f"Cannot tune preset {difficulty!r}")
+        self.difficulty = difficulty
+        self.base = getattr(AIPreset, difficulty)
+        self.parameters = preset_parameters(self.base)
+        self.pairs = pairs
+        self.games = games
+        self.sigma = sigma
+        self.learning_rate = learning_rate
+        self.sigma_decay = sigma_decay
+        self.min_sigma = min_sigma
+        self.ms_penalty = ms_penalty
+        self.seed = seed
+        self.settings = dict(settings or {})
+        self.settings.setdefault("AI_USE_SIMULATION", True)
+        self.settings["AI_PONDER"] = False
+        self.settings["AI_PROCESS_WORKERS"] = 0
+        # The opponent in slot 1 plays the built-in preset, not an earlier
+        # tuning result.
+        self.settings["AI_TUNED_PRESETS"] = ""
+        self.mean = [0.0] * len(self.parameters)
+        self.generation = 0
+        self.history: list[dict] = []
+
+    @property
+    def lineup(self) -> list[str]:
+        """Candidate in slot 0 against the untuned preset in slot 1."""
+        return [f"AI_{self.difficulty}_"] * 2
+
+    def preset(self) -> dict:
+        """Get the preset at the current mean."""
+        return build_preset(self.base, self.parameters, self.mean)
+
+    def sample(self) -> list[list[float]]:
+        """Draw one perturbation per candidate pair of the generation."""
+        rng = random.Random(self.seed * 1_000_003 + self.generation)
+        return [[rng.gauss(0.0, 1.0) for _ in self.parameters]
+                for _ in range(self.pairs)]
+
+    def step(self, pool: typing.Optional[ProcessPoolExecutor]) -> dict:
+        """
+        Play one generation and update the mean.
+
+        Args:
+            pool: Process pool to play the games in, or None to play them
+                in this process
+
+        Returns:
+            Summary of the generation
+        """
+        noises = self.sample()
+        candidates = [[
+            mean + sign * self.sigma * epsilon
+            for mean, epsilon in zip(self.mean, noise)
+        ] for noise in noises for sign in (1.0, -1.0)]
+        presets = [
+            build_preset(self.base, self.parameters, vector)
+            for vector in candidates
+        ]
+        first_seed = self.seed + self.generation * self.games
+        jobs = [(candidate, game) for candidate in range(len(presets))
+                for game in range(self.games)]
+        arguments = [(game, first_seed + game, self.lineup, self.settings, {
+            0: presets[candidate]
+        }) for candidate, game in jobs]
+        if pool is None:
+            outcomes = [tournament.play_game(*args) for args in arguments]
+        else:
+            outcomes = list(
+                pool.map(tournament.play_game, *zip(*arguments)))
+
+        results = [[] for _ in presets]
+        for (candidate, _), outcome in zip(jobs, outcomes):
+            results[candidate].append(outcome)
+        scores = [fitness(games, self.ms_penalty) for games in results]
+
+        ranks = _centered_ranks(scores)
+        for pair, noise in enumerate(noises):
+            weight = ranks[2 * pair] - ranks[2 * pair + 1]
+            self.mean = [
+                mean + self.learning_rate * self.sigma * weight * epsilon /
+                self.pairs for mean, epsilon in zip(self.mean, noise)
+            ]
+        best = max(range(len(scores)), key=lambda index: scores[index])
+        summary = {
+            "generation": self.generation,
+            "sigma": self.sigma,
+            "mean_fitness": sum(scores) / len(scores),
+            "best_fitness": scores[best],
+            "best_preset": presets[best],
+            "games": len(jobs),
+        }
+        self.history.append(summary)
+        self.generation += 1
+        self.sigma = max(self.sigma * self.sigma_decay, self.min_sigma)
+        return summary
+
+    def state(self) -> dict:
+        """Get the checkpoint state of the tuner."""
+        return {
+            "difficulty": self.difficulty,
+            "parameters": [parameter.key for parameter in self.parameters],
+            "mean": self.mean,
+            "sigma": self.sigma,
+            "generation": self.generation,
+            "seed": self.seed,
+            "history": self.history,
+        }
+
+    def load_state(self, state: dict) -> None:
+        """
+        Continue from a checkpoint state.
+
+        Raises:
+            ValueError: If the checkpoint belongs to another preset layout
+        """
+        if (state.get("difficulty") != self.difficulty or
+                state.get("parameters") !=
+            [parameter.key for parameter in self.parameters]):
+            raise ValueError(
+                "Checkpoint does not match the preset being tuned")
+        self.mean = [float(value) for value in state["mean"]]
+        self.sigma = float(state["sigma"])
+        self.generation = int(state["generation"])
+        self.seed = int(state.get("seed", self.seed))
+        self.history = list(state.get("history", []))
+
+
+def save_checkpoint(path: str, tuner: PresetTuner) -> None:
+    """Write the tuner state atomically, so an interrupted run can resume."""
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as file:
+        json.dump(tuner.state(), file, indent=2)
+    os.replace(temporary, path)
+
+
+def write_preset_file(path: str, presets: typing.Mapping[str, dict],
+                      note: str = "") -> None:
+    """
+    Write tuned presets as JSON for ``ai_player.load_tuned_presets``.
+
+    Args:
+        path: File to write
+        presets: Preset dictionaries by difficulty name
+        note: Description of the tuning run
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"note": note, "presets": dict(presets)}, file, indent=2)
+        file.write("\n")
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """Run the preset tuner from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Tune an AI preset with self-play games.")
+    parser.add_argument("--difficulty", default="HARD",
+                        choices=TUNABLE_DIFFICULTIES,
+                        help="preset to tune")
+    parser.add_argument("--generations", type=int, default=20,
+                        help="generations to run in total")
+    parser.add_argument("--pairs", type=int, default=4,
+                        help="mirrored candidate pairs per generation")
+    parser.add_argument("--games", type=int, default=8,
+                        help="games per candidate and generation")
+    parser.add_argument("--sigma", type=float, default=0.2,
+                        help="initial perturbation, relative to the values")
+    parser.add_argument("--learning-rate", type=float, default=0.5,
+                        help="step of the mean per generation")
+    parser.add_argument("--ms-penalty", type=float, default=0.02,
+                        help="points deducted per ms of mean turn time")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="AI turn budget, overrides AI_TURN_BUDGET_MS")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the perturbations and games")
+    parser.add_argument("--workers", type=int,
+                        default=max(1, (os.cpu_count() or 2) - 1),
+                        help="processes to play games in")
+    parser.add_argument("--checkpoint", default="tuning_checkpoint.json",
+                        help="JSON file to checkpoint to and resume from")
+    parser.add_argument("--output",
+                        default=os.path.join(TUNED_PRESETS_DIR,
+                                             "tuned_presets.json"),
+                        help="JSON preset file to write")
+    args = parser.parse_args(argv)
+
+    settings = {}
+    if args.budget_ms is not None:
+        settings["AI_TURN_BUDGET_MS"] = args.budget_ms
+    tuner = PresetTuner(args.difficulty,
+                        pairs=args.pairs,
+                        games=args.games,
+                        sigma=args.sigma,
+                        learning_rate=args.learning_rate,
+                        ms_penalty=args.ms_penalty,
+                        seed=args.seed,
+                        settings=settings)
+    if os.path.exists(args.checkpoint):
+        with open(args.checkpoint, encoding="utf-8") as file:
+            tuner.load_state(json.load(file))
+        print(f"Resuming at generation {tuner.generation}", file=sys.stderr)
+
+    tournament.silence_logging()
+    pool = None
+    if args.workers > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=args.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=tournament.silence_logging)
+    try:
+        while tuner.generation < args.generations:
+            summary = tuner.step(pool)
+            save_checkpoint(args.checkpoint, tuner)
+            print(f"generation {summary['generation']}: "
+                  f"mean fitness {summary['mean_fitness']:.2f}, "
+                  f"best {summary['best_fitness']:.2f}, "
+                  f"sigma {summary['sigma']:.3f}", file=sys.stderr)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    games = sum(entry["games"] for entry in tuner.history)
+    write_preset_file(
+        args.output, {args.difficulty: tuner.preset()},
+        f"{args.difficulty} after {tuner.generation} generations "
+        f"({games} games), seed {tuner.seed}.")
+    print(f"Wrote {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
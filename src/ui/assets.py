@@ -0,0 +1,71 @@
+"""On-demand image assets for tiles and meeples.
+
+The rules engine in ``models`` is headless and only stores asset paths and
+player colors. Scenes ask this module for surfaces when they draw, so images
+are decoded and scaled once per asset instead of once per model object.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import pygame
+
+import settings
+from utils.settings_manager import settings_manager
+
+logger = logging.getLogger(__name__)
+
+# Scaled tile surfaces for the four rotations (0°, 90°, 180°, 270°), keyed by
+# image path and tile size. Every card of a tile definition shares one entry.
+_TILE_SURFACES_CACHE: dict[tuple[str, int], tuple[pygame.Surface, ...]] = {}
+# Scaled meeple surfaces keyed by player color and figure size.
+_FIGURE_IMAGE_CACHE: dict[tuple[str, int], pygame.Surface] = {}
+
+
+def _load_scaled(image_path: str, size: int) -> pygame.Surface:
+    """Load an image from disk and scale it to a square of ``size`` pixels."""
+    try:
+        original_image = pygame.image.load(image_path)
+    except Exception as exc:
+        logger.error("Failed to load image from %s: %s", image_path, exc)
+        original_image = pygame.Surface((size, size), pygame.SRCALPHA)
+    return pygame.transform.scale(original_image, (size, size))
+
+
+def get_tile_surfaces(image_path: str) -> tuple[pygame.Surface, ...]:
+    """Return the scaled tile surfaces for all four rotations of an image."""
+    tile_size = int(settings_manager.get("TILE_SIZE", settings.TILE_SIZE))
+    cache_key = (image_path, tile_size)
+    surfaces = _TILE_SURFACES_CACHE.get(cache_key)
+    if surfaces is None:
+        base_image = _load_scaled(image_path, tile_size)
+        surfaces = (base_image, ) + tuple(
+            pygame.transform.rotate(base_image, -rotation)
+            for rotation in (90, 180, 270))
+        _TILE_SURFACES_CACHE[cache_key] = surfaces
+    return surfaces
+
+
+def get_card_image(card: object) -> pygame.Surface:
+    """Return the cached tile surface for ``card`` at its current rotation."""
+    return get_tile_surfaces(card.get_image_path())[(card.rotation // 90) % 4]
+
+
+def get_figure_image(color: str) -> pygame.Surface:
+    """Return the cached meeple surface for a player color."""
+    figure_size = int(
+        settings_manager.get("FIGURE_SIZE", settings.FIGURE_SIZE))
+    cache_key = (color, figure_size)
+    cached = _FIGURE_IMAGE_CACHE.get(cache_key)
+    if cached is None:
+        cached = _load_scaled(f"{settings.FIGURE_IMAGES_PATH}{color}.png",
+                              figure_size)
+        _FIGURE_IMAGE_CACHE[cache_key] = cached
+    return cached
+
+
+def clear_image_cache() -> None:
+    """Drop all cached tile and meeple surfaces."""
+    _TILE_SURFACES_CACHE.clear()
+    _FIGURE_IMAGE_CACHE.clear()
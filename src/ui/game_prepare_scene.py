@@ -76,6 +76,8 @@ class PlayerConfiguration:
                 self.name = self.name[8:]
             elif self.name.startswith("AI_EXPERT_"):
                 self.name = self.name[10:]
+            elif self.name.startswith("AI_MCTS_"):
+                self.name = self.name[8:]
             elif self.name.startswith("AI_NORMAL_"):
                 self.name = self.name[10:]
             elif self.name.startswith("AI_"):
@@ -161,7 +163,7 @@ class GamePrepareScene(Scene):
         self.ai_difficulty_dropdown = Dropdown(
             rect=(x_center, 0, 200, 40),
             font=self.dropdown_font,
-            options=["EASY", "NORMAL", "HARD", "EXPERT"],
+            options=["EASY", "NORMAL", "HARD", "EXPERT", "MCTS"],
             default_index=1,
             on_select=self._handle_ai_difficulty_change)
 
@@ -432,6 +434,8 @@ class GamePrepareScene(Scene):
                 base_name = base_name[8:]
             elif base_name.startswith("AI_EXPERT_"):
                 base_name = base_name[10:]
+            elif base_name.startswith("AI_MCTS_"):
+                base_name = base_name[8:]
             elif base_name.startswith("AI_NORMAL_"):
                 base_name = base_name[10:]
             elif base_name.startswith("AI_"):
@@ -451,6 +455,8 @@ class GamePrepareScene(Scene):
                     base_name = base_name[8:]
                 elif base_name.startswith("AI_EXPERT_"):
                     base_name = base_name[10:]
+                elif base_name.startswith("AI_MCTS_"):
+                    base_name = base_name[8:]
                 elif base_name.startswith("AI_NORMAL_"):
                     base_name = base_name[10:]
                 elif base_name.startswith("AI_"):
@@ -477,6 +483,8 @@ class GamePrepareScene(Scene):
                         base_name = base_name[8:]
                     elif base_name.startswith("AI_EXPERT_"):
                         base_name = base_name[10:]
+                    elif base_name.startswith("AI_MCTS_"):
+                        base_name = base_name[8:]
                     elif base_name.startswith("AI_NORMAL_"):
                         base_name = base_name[10:]
                     elif base_name.startswith("AI_"):
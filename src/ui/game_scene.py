@@ -11,6 +11,7 @@ from ui.components.button import Button
 from ui.components.progress_bar import ProgressBar
 from ui.utils.draw import draw_rect_alpha, draw_line_alpha
 from ui import theme
+from ui import assets
 
 logger = logging.getLogger(__name__)
 
@@ -80,6 +81,7 @@ class GameScene(Scene):
         self._valid_placements_version = 0
 
         self.last_ai_turn_time = 0
+        self._ponder_turn_id: int | None = None
         self.player_action_time = 0
         self.ai_turn_start_time = None
 
@@ -404,7 +406,7 @@ class GameScene(Scene):
             for x in range(game_board.grid_size):
                 card = game_board.get_card(x, y)
                 if card:
-                    image_to_draw = card.get_rotated_image()
+                    image_to_draw = assets.get_card_image(card)
                     self.screen.blit(image_to_draw,
                                      (x * tile_size - self.offset_x,
                                       y * tile_size - self.offset_y))
@@ -814,9 +816,11 @@ class GameScene(Scene):
                     else:
                         figure_x, figure_y = center_x, center_y
 
-                    img_w, img_h = figure.image.get_size()
+                    figure_image = assets.get_figure_image(
+                        figure.get_owner().get_color())
+                    img_w, img_h = figure_image.get_size()
 
-                    self.screen.blit(figure.image,
+                    self.screen.blit(figure_image,
                                      (figure_x - img_w / 2,
                                       figure_y - img_h / 2))
 
@@ -838,7 +842,7 @@ class GameScene(Scene):
         scrollable_content_start_y = current_y
 
         if selected_card:
-            image_to_draw = selected_card.get_rotated_image()
+            image_to_draw = assets.get_card_image(selected_card)
 
             card_rect = image_to_draw.get_rect()
             card_rect.centerx = sidebar_center_x
@@ -987,7 +991,10 @@ class GameScene(Scene):
                         fig_y = grid_start_y + row * (figure_size + figure_gap)
 
                         if fig_y + figure_size > scrollable_content_start_y and fig_y < window_height:
-                            self.screen.blit(figure.image, (fig_x, fig_y))
+                            self.screen.blit(
+                                assets.get_figure_image(
+                                    figure.get_owner().get_color()),
+                                (fig_x, fig_y))
 
                 current_y += grid_height + padding
 
@@ -1285,9 +1292,27 @@ class GameScene(Scene):
         Called when the game session is updated from network.
         """
         self.session = new_session
+        self._ponder_turn_id = None
         self._invalidate_valid_placements_cache()
         self._invalidate_render_cache()
 
+    def _start_pondering(self, current_player) -> None:
+        """
+        Hand the AI players that are not on turn one snapshot of the turn.
+
+        Runs once per turn, so the session is serialized at most once per
+        turn instead of on every frame the board changes.
+        """
+        if not settings_manager.get("AI_PONDER", False):
+            return
+        snapshot = None
+        for player in self.session.get_players():
+            if player is current_player or not hasattr(player, 'ponder'):
+                continue
+            if snapshot is None:
+                snapshot = self.session.serialize()
+            player.ponder(self.session, snapshot)
+
     def update(self) -> None:
         fps = settings_manager.get("FPS")
         if self.session.get_game_over():
@@ -1296,6 +1321,10 @@ class GameScene(Scene):
 
         current_player = self.session.get_current_player()
 
+        if self.session.turn_id != self._ponder_turn_id:
+            self._ponder_turn_id = self.session.turn_id
+            self._start_pondering(current_player)
+
         if self.session.get_is_first_round() or not current_player.get_is_ai():
             self.clock.tick(fps)
             return
@@ -222,6 +222,15 @@ class SettingsScene(Scene):
             not settings_manager.get("DEBUG"))
         current_y += (self.ai_simulation_checkbox.rect.height
                       + theme.THEME_LAYOUT_VERTICAL_GAP)
+
+        self.ai_ponder_checkbox = Checkbox(
+            rect=(x_center, current_y, 20, 20),
+            checked=settings_manager.get("AI_PONDER", False),
+            on_toggle=lambda value: self._handle_ai_ponder_toggle(value))
+        self.ai_ponder_checkbox.set_disabled(
+            not settings_manager.get("DEBUG"))
+        current_y += (self.ai_ponder_checkbox.rect.height
+                      + theme.THEME_LAYOUT_VERTICAL_GAP)
 
         self.ai_strategic_candidates_field = InputField(
             rect=(x_center, current_y, 80, 40),
@@ -249,6 +258,32 @@ class SettingsScene(Scene):
             not settings_manager.get("DEBUG"))
         current_y += (self.ai_thinking_speed_field.rect.height
                       + theme.THEME_LAYOUT_VERTICAL_GAP)
+
+        self.ai_mcts_budget_field = InputField(
+            rect=(x_center, current_y, 80, 40),
+            font=self.input_font,
+            initial_text=str(settings_manager.get("AI_MCTS_BUDGET_MS", 1000)),
+            on_text_change=None,
+            numeric=True,
+            min_value=50,
+            max_value=10000)
+        self.ai_mcts_budget_field.set_disabled(
+            not settings_manager.get("DEBUG"))
+        current_y += (self.ai_mcts_budget_field.rect.height
+                      + theme.THEME_LAYOUT_VERTICAL_GAP)
+
+        self.ai_turn_budget_field = InputField(
+            rect=(x_center, current_y, 80, 40),
+            font=self.input_font,
+            initial_text=str(settings_manager.get("AI_TURN_BUDGET_MS", 2000)),
+            on_text_change=None,
+            numeric=True,
+            min_value=50,
+            max_value=10000)
+        self.ai_turn_budget_field.set_disabled(
+            not settings_manager.get("DEBUG"))
+        current_y += (self.ai_turn_budget_field.rect.height
+                      + theme.THEME_LAYOUT_VERTICAL_GAP)
 
         apply_rect = pygame.Rect(0, 0, 0, 60)
         apply_rect.center = (button_center_x,
@@ -353,11 +388,17 @@ class SettingsScene(Scene):
 
             current_y = self._set_component_rect(
                 self.ai_simulation_checkbox, x_center, current_y, padding)
+            current_y = self._set_component_rect(
+                self.ai_ponder_checkbox, x_center, current_y, padding)
             current_y = self._set_component_rect(
                 self.ai_strategic_candidates_field, x_center, current_y,
                 padding)
             current_y = self._set_component_rect(
                 self.ai_thinking_speed_field, x_center, current_y, padding)
+            current_y = self._set_component_rect(
+                self.ai_mcts_budget_field, x_center, current_y, padding)
+            current_y = self._set_component_rect(
+                self.ai_turn_budget_field, x_center, current_y, padding)
         else:
             self.debug_label_y = None
             self.ai_label_y = None
@@ -396,8 +437,11 @@ class SettingsScene(Scene):
         self.game_log_max_entries_field.set_disabled(not new_value)
         self.max_retry_attempts_field.set_disabled(not new_value)
         self.ai_simulation_checkbox.set_disabled(not new_value)
+        self.ai_ponder_checkbox.set_disabled(not new_value)
         self.ai_strategic_candidates_field.set_disabled(not new_value)
         self.ai_thinking_speed_field.set_disabled(not new_value)
+        self.ai_mcts_budget_field.set_disabled(not new_value)
+        self.ai_turn_budget_field.set_disabled(not new_value)
         self.log_to_console_checkbox.set_disabled(not new_value)
 
         if not new_value:
@@ -428,6 +472,8 @@ class SettingsScene(Scene):
             if debug_enabled:
                 self.ai_simulation_checkbox.handle_event(
                     event, y_offset=self.scroll_offset)
+                self.ai_ponder_checkbox.handle_event(
+                    event, y_offset=self.scroll_offset)
                 fps_was_dragging = self.fps_slider.dragging
                 grid_was_dragging = self.grid_size_slider.dragging
                 tile_was_dragging = self.tile_size_slider.dragging
@@ -476,6 +522,10 @@ class SettingsScene(Scene):
                     event, y_offset=self.scroll_offset)
                 self.ai_thinking_speed_field.handle_event(
                     event, y_offset=self.scroll_offset)
+                self.ai_mcts_budget_field.handle_event(
+                    event, y_offset=self.scroll_offset)
+                self.ai_turn_budget_field.handle_event(
+                    event, y_offset=self.scroll_offset)
             if event.type in (pygame.MOUSEMOTION,
                               pygame.MOUSEBUTTONDOWN,
                               pygame.MOUSEBUTTONUP):
@@ -495,6 +545,9 @@ class SettingsScene(Scene):
     def _handle_ai_simulation_toggle(self, value):
         settings_manager.set("AI_USE_SIMULATION", value, temporary=True)
 
+    def _handle_ai_ponder_toggle(self, value):
+        settings_manager.set("AI_PONDER", value, temporary=True)
+
     def _handle_log_to_console_toggle(self, value):
         settings_manager.set("LOG_TO_CONSOLE", value, temporary=True)
 
@@ -525,6 +578,8 @@ class SettingsScene(Scene):
             changes[
                 "AI_USE_SIMULATION"] = self.ai_simulation_checkbox.is_checked(
                 )
+        if not self.ai_ponder_checkbox.is_disabled():
+            changes["AI_PONDER"] = self.ai_ponder_checkbox.is_checked()
 
         if not self.fps_slider.is_disabled():
             changes["FPS"] = self.fps_slider.get_value()
@@ -608,6 +663,38 @@ class SettingsScene(Scene):
                     Toast("Invalid AI thinking speed value", type="error"))
                 return
 
+        if not self.ai_mcts_budget_field.is_disabled():
+            try:
+                mcts_budget = int(self.ai_mcts_budget_field.get_text())
+                if 50 <= mcts_budget <= 10000:
+                    changes["AI_MCTS_BUDGET_MS"] = mcts_budget
+                else:
+                    self.add_toast(
+                        Toast(
+                            "AI MCTS budget must be between 50 and 10000 ms",
+                            type="error"))
+                    return
+            except ValueError:
+                self.add_toast(
+                    Toast("Invalid AI MCTS budget value", type="error"))
+                return
+
+        if not self.ai_turn_budget_field.is_disabled():
+            try:
+                turn_budget = int(self.ai_turn_budget_field.get_text())
+                if 50 <= turn_budget <= 10000:
+                    changes["AI_TURN_BUDGET_MS"] = turn_budget
+                else:
+                    self.add_toast(
+                        Toast(
+                            "AI turn budget must be between 50 and 10000 ms",
+                            type="error"))
+                    return
+            except ValueError:
+                self.add_toast(
+                    Toast("Invalid AI turn budget value", type="error"))
+                return
+
         success = True
         for key, value in changes.items():
             if not settings_manager.set(key, value, temporary=False):
@@ -819,6 +906,17 @@ class SettingsScene(Scene):
                 right=self.ai_simulation_checkbox.rect.left - 10,
                 centery=self.ai_simulation_checkbox.rect.centery + offset_y)
             self.screen.blit(ai_simulation_label, ai_simulation_label_rect)
+
+            label_color = (
+                theme.THEME_LABEL_DISABLED_COLOR
+                if self.ai_ponder_checkbox.is_disabled()
+                else theme.THEME_TEXT_COLOR_LIGHT)
+            ai_ponder_label = self._get_label_surface(
+                label_font, "AI pondering:", label_color)
+            ai_ponder_label_rect = ai_ponder_label.get_rect(
+                right=self.ai_ponder_checkbox.rect.left - 10,
+                centery=self.ai_ponder_checkbox.rect.centery + offset_y)
+            self.screen.blit(ai_ponder_label, ai_ponder_label_rect)
 
             label_color = (
                 theme.THEME_LABEL_DISABLED_COLOR
@@ -843,6 +941,28 @@ class SettingsScene(Scene):
                 right=self.ai_thinking_speed_field.rect.left - 10,
                 centery=self.ai_thinking_speed_field.rect.centery + offset_y)
             self.screen.blit(thinking_speed_label, thinking_speed_label_rect)
+
+            label_color = (
+                theme.THEME_LABEL_DISABLED_COLOR
+                if self.ai_mcts_budget_field.is_disabled()
+                else theme.THEME_TEXT_COLOR_LIGHT)
+            mcts_budget_label = self._get_label_surface(
+                label_font, "AI MCTS Budget (ms):", label_color)
+            mcts_budget_label_rect = mcts_budget_label.get_rect(
+                right=self.ai_mcts_budget_field.rect.left - 10,
+                centery=self.ai_mcts_budget_field.rect.centery + offset_y)
+            self.screen.blit(mcts_budget_label, mcts_budget_label_rect)
+
+            label_color = (
+                theme.THEME_LABEL_DISABLED_COLOR
+                if self.ai_turn_budget_field.is_disabled()
+                else theme.THEME_TEXT_COLOR_LIGHT)
+            turn_budget_label = self._get_label_surface(
+                label_font, "AI Turn Budget (ms):", label_color)
+            turn_budget_label_rect = turn_budget_label.get_rect(
+                right=self.ai_turn_budget_field.rect.left - 10,
+                centery=self.ai_turn_budget_field.rect.centery + offset_y)
+            self.screen.blit(turn_budget_label, turn_budget_label_rect)
 
         # Draw all UI components in logical order
         self.fullscreen_checkbox.draw(self.screen, y_offset=offset_y)
@@ -859,9 +979,12 @@ class SettingsScene(Scene):
             self.max_retry_attempts_field.draw(self.screen,
                                                y_offset=offset_y)
             self.ai_simulation_checkbox.draw(self.screen, y_offset=offset_y)
+            self.ai_ponder_checkbox.draw(self.screen, y_offset=offset_y)
             self.ai_strategic_candidates_field.draw(self.screen,
                                                     y_offset=offset_y)
             self.ai_thinking_speed_field.draw(self.screen, y_offset=offset_y)
+            self.ai_mcts_budget_field.draw(self.screen, y_offset=offset_y)
+            self.ai_turn_budget_field.draw(self.screen, y_offset=offset_y)
         self.apply_button.draw(self.screen, y_offset=offset_y)
         self.back_button.draw(self.screen, y_offset=offset_y)
 
@@ -904,6 +1027,7 @@ class SettingsScene(Scene):
             self.valid_placement_checkbox,
             self.log_to_console_checkbox,
             self.ai_simulation_checkbox,
+            self.ai_ponder_checkbox,
         ]
         for checkbox in checkboxes:
             checkbox.apply_theme()
@@ -924,6 +1048,8 @@ class SettingsScene(Scene):
             self.max_retry_attempts_field,
             self.ai_strategic_candidates_field,
             self.ai_thinking_speed_field,
+            self.ai_mcts_budget_field,
+            self.ai_turn_budget_field,
         ]
         for input_field in inputs:
             input_field.set_font(self.input_font)
@@ -8,6 +8,7 @@ import typing
 import pygame
 
 import settings
+from utils.player_colors import PLAYER_COLOR_RGB
 
 Color = tuple[int, int, int] | tuple[int, int, int, int]
 ColorA = tuple[int, int, int, int]
@@ -398,18 +399,19 @@ THEME_GAME_BACKGROUND_TINT_COLOR: ColorA | None = (0, 0, 0, 160)
 THEME_GAME_BACKGROUND_BLUR_RADIUS: float = 0.0
 
 # Player color palette
+# Defaults come from utils.player_colors, which the rules engine tints with.
 # Player "red" tint; RGB tuple (0-255 per channel).
-THEME_PLAYER_COLOR_RED: Color = (205, 81, 83)
+THEME_PLAYER_COLOR_RED: Color = PLAYER_COLOR_RGB["red"]
 # Player "blue" tint; RGB tuple (0-255 per channel).
-THEME_PLAYER_COLOR_BLUE: Color = (81, 104, 205)
+THEME_PLAYER_COLOR_BLUE: Color = PLAYER_COLOR_RGB["blue"]
 # Player "green" tint; RGB tuple (0-255 per channel).
-THEME_PLAYER_COLOR_GREEN: Color = (104, 205, 81)
+THEME_PLAYER_COLOR_GREEN: Color = PLAYER_COLOR_RGB["green"]
 # Player "yellow" tint; RGB tuple (0-255 per channel).
-THEME_PLAYER_COLOR_YELLOW: Color = (248, 224, 113)
+THEME_PLAYER_COLOR_YELLOW: Color = PLAYER_COLOR_RGB["yellow"]
 # Player "pink" tint; RGB tuple (0-255 per channel).
-THEME_PLAYER_COLOR_PINK: Color = (182, 81, 205)
+THEME_PLAYER_COLOR_PINK: Color = PLAYER_COLOR_RGB["pink"]
 # Player "black" tint (light gray fallback); RGB tuple (0-255 per channel).
-THEME_PLAYER_COLOR_BLACK: Color = (220, 220, 220)
+THEME_PLAYER_COLOR_BLACK: Color = PLAYER_COLOR_RGB["black"]
 
 # Cache for pygame font instances keyed by role, size, and font family.
 _FONT_CACHE: dict[tuple[str, int, str | None], pygame.font.Font] = {}
@@ -480,7 +482,6 @@ def clear_font_cache() -> None:
 def refresh_theme_state() -> None:
     """Refresh derived theme mappings after live updates."""
     global THEME_TOAST_COLORS
-    global THEME_PLAYER_COLOR_MAP
     THEME_TOAST_COLORS = {
         "info": (THEME_TOAST_INFO_TEXT_COLOR, THEME_TOAST_INFO_BG_COLOR),
         "success": (THEME_TOAST_SUCCESS_TEXT_COLOR,
@@ -489,14 +490,14 @@ def refresh_theme_state() -> None:
         "warning": (THEME_TOAST_WARNING_TEXT_COLOR,
                     THEME_TOAST_WARNING_BG_COLOR),
     }
-    THEME_PLAYER_COLOR_MAP = {
+    THEME_PLAYER_COLOR_MAP.update({
         "red": THEME_PLAYER_COLOR_RED,
         "blue": THEME_PLAYER_COLOR_BLUE,
         "green": THEME_PLAYER_COLOR_GREEN,
         "yellow": THEME_PLAYER_COLOR_YELLOW,
         "pink": THEME_PLAYER_COLOR_PINK,
         "black": THEME_PLAYER_COLOR_BLACK,
-    }
+    })
 
 
 # Toast color map for toast types (text color, background color); RGB tuples.
@@ -507,15 +508,9 @@ THEME_TOAST_COLORS: dict[str, tuple[Color, Color]] = {
     "warning": (THEME_TOAST_WARNING_TEXT_COLOR, THEME_TOAST_WARNING_BG_COLOR),
 }
 
-# Player color map used by the sidebar scoreboard; RGB tuples.
-THEME_PLAYER_COLOR_MAP: dict[str, Color] = {
-    "red": THEME_PLAYER_COLOR_RED,
-    "blue": THEME_PLAYER_COLOR_BLUE,
-    "green": THEME_PLAYER_COLOR_GREEN,
-    "yellow": THEME_PLAYER_COLOR_YELLOW,
-    "pink": THEME_PLAYER_COLOR_PINK,
-    "black": THEME_PLAYER_COLOR_BLACK,
-}
+# Player color map used by the sidebar scoreboard and the structure tints;
+# the shared utils.player_colors mapping, updated in place. RGB tuples.
+THEME_PLAYER_COLOR_MAP: dict[str, Color] = PLAYER_COLOR_RGB
 
 _TOAST_COLOR_UPDATE: dict[str, tuple[str, int]] = {
     "THEME_TOAST_INFO_TEXT_COLOR": ("info", 0),
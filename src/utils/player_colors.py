@@ -0,0 +1,13 @@
+"""Player colors shared by the rules engine and the UI theme, without pygame."""
+
+# RGB of every player color name. The UI theme edits this mapping in place,
+# so structure tints and the scoreboard always use the same palette.
+PLAYER_COLOR_RGB: dict[str, tuple[int, int, int]] = {
+    "red": (205, 81, 83),
+    "blue": (81, 104, 205),
+    "green": (104, 205, 81),
+    "yellow": (248, 224, 113),
+    "pink": (182, 81, 205),
+    # Light gray, so black figures stay visible on the dark board.
+    "black": (220, 220, 220),
+}
@@ -1,14 +1,32 @@
 """Unit tests for advanced AI simulation behavior."""
 
+import gc
+import json
 import os
+import random
 import sys
+import tempfile
+import time
 import unittest
+from concurrent.futures import Future
 from unittest.mock import MagicMock, patch
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from models.ai_player import AIPlayer
+from models import pattern_table, placement_scoring
+from models.ai_player import (AIPlayer, AIPreset, CancellationToken,
+                              _TurnSnapshot, get_worker_metrics,
+                              shutdown_process_pool, submit_worker)
+from models.card import Card
+from models.endgame import EndgameSolver
+from models.game_session import GameSession
+from models.mcts import MCTSSearch
+from models.move import Move, Placement
+import settings
+import tournament
+import tuning
+from utils.settings_manager import settings_manager
 
 
 class _RotatingCardStub:
@@ -17,8 +35,8 @@ class _RotatingCardStub:
     def __init__(self, rotation: int = 0):
         self.rotation = rotation
 
-    def rotate(self) -> None:
-        self.rotation = (self.rotation + 90) % 360
+    def set_rotation(self, degrees: int) -> None:
+        self.rotation = degrees % 360
 
 
 class _StructureStub:
@@ -38,6 +56,31 @@ class _StructureStub:
     def get_structure_type(self):
         return self._structure_type
 
+    def get_figure_counts(self):
+        return {}
+
+    def get_version(self):
+        return 0
+
+    def get_card_count(self):
+        return len(self.card_sides)
+
+    def get_open_edge_count(self):
+        return 0 if self._completed else 1
+
+    def get_neighborhood_count(self):
+        return 0
+
+    def get_adjacent_completed_cities(self):
+        return set()
+
+
+def _patch_settings(**values):
+    """Patch the settings the AI module reads with ``values``."""
+    return patch("models.ai_player.settings_manager.get",
+                 side_effect=lambda key, default=None: values.get(
+                     key, default))
+
 
 class AIPlayerAdvancedTests(unittest.TestCase):
     """Validate advanced AI decision pipeline for tiles and meeples."""
@@ -45,63 +88,89 @@ class AIPlayerAdvancedTests(unittest.TestCase):
     def setUp(self) -> None:
         self.ai = AIPlayer("AI_NORMAL_Test", 0, "blue", "NORMAL")
 
+    @staticmethod
+    def make_road() -> Card:
+        """Create a card with a road running from west to east."""
+        return Card("fake.png", {"N": "field", "E": "road", "S": "field",
+                                 "W": "road"}, {"E": ["W"], "W": ["E"]}, [])
+
+    @staticmethod
+    def make_session(ai: AIPlayer, opponent: bool = True) -> GameSession:
+        """Create an empty session with ``ai`` on turn and an EASY opponent."""
+        session = GameSession([], no_init=True)
+        session.players = [ai]
+        if opponent:
+            session.players.append(AIPlayer("AI_EASY_Other", 1, "red", "EASY"))
+        session.current_player = ai
+        return session
+
+    def make_started_session(self, ai: AIPlayer) -> GameSession:
+        """Create a session with a city and road start tile and a card to place."""
+        session = self.make_session(ai)
+        start = Card("fake.png", {"N": "city", "E": "road", "S": "field",
+                                  "W": "road"}, {"E": ["W"], "W": ["E"]}, [])
+        session.game_board.place_card(start, 5, 5)
+        session.last_placed_card = start
+        session.detect_structures()
+        session.current_card = Card("fake.png", {"N": "field", "E": "road",
+                                                 "S": "city", "W": "road"},
+                                    {"E": ["W"], "W": ["E"]}, [])
+        return session
+
     def test_get_multiple_valid_placements_uses_session_candidates(self):
-        """AI should receive all valid placements and align card rotations."""
+        """AI should receive all valid placements as records, not copies."""
         game_session = MagicMock()
-        original_card = MagicMock()
+        original_card = Card("fake.png", {"N": "city", "E": "road",
+                                          "S": "field", "W": "road"},
+                             {"E": ["W"], "W": ["E"]}, [])
         game_session.get_valid_placements.return_value = [(1, 2, 90), (3, 4, 180)]
 
-        first_copy = _RotatingCardStub(rotation=0)
-        second_copy = _RotatingCardStub(rotation=0)
-
-        with patch.object(
-                self.ai,
-                "_create_card_copy",
-                side_effect=[first_copy, second_copy]) as create_copy:
+        with patch.object(Card, "from_definition") as create_card:
             placements = self.ai._get_multiple_valid_placements(
                 game_session, original_card)
 
+        definition = original_card.get_definition()
         self.assertEqual(len(placements), 2)
         self.assertEqual(placements[0][:3], (1, 2, 90))
         self.assertEqual(placements[1][:3], (3, 4, 180))
-        self.assertEqual(first_copy.rotation, 90)
-        self.assertEqual(second_copy.rotation, 180)
-        self.assertEqual(create_copy.call_count, 2)
+        self.assertIs(placements[0].definition, definition)
+        self.assertIs(placements[0].terrains,
+                      definition.get_rotation(1).terrains)
+        self.assertEqual(placements[1].terrains["N"], "field")
+        self.assertEqual(placements[1].rotation_index, 2)
+        create_card.assert_not_called()
 
     def test_worker_selects_best_move_from_advanced_simulation_score(self):
         """Worker should choose move with highest simulated advanced score."""
         game_session = MagicMock()
         game_session.get_current_card.return_value = MagicMock()
+        game_session.get_cards_deck.return_value = [MagicMock()] * 30
 
         candidate_1 = (1, 1, 0, MagicMock())
         candidate_2 = (2, 2, 90, MagicMock())
 
         self.ai._worker_turn_token = 7
         self.ai._worker_running = True
+        self.ai.figures = []
 
         with patch.object(
                 self.ai,
                 "_get_multiple_valid_placements",
                 return_value=[candidate_1, candidate_2]), \
-                patch.object(self.ai, "_evaluate_card_placement_advanced",
-                             return_value=1.0), \
-                patch.object(self.ai, "_evaluate_figure_opportunity_advanced",
-                             return_value=1.0), \
-                patch.object(self.ai, "_evaluate_opponent_blocking",
-                             return_value=1.0), \
-                patch.object(self.ai, "_evaluate_multi_turn_potential",
-                             return_value=1.0), \
+                patch("models.ai_player.score_placements",
+                      return_value=[4.0, 4.0]), \
                 patch.object(
                     self.ai,
-                    "_simulate_card_copy_placement_advanced",
+                    "_simulate_placement_advanced",
                     side_effect=[20.0, 99.0]), \
-                patch("models.ai_player.settings_manager.get",
-                      return_value=5):
+                _patch_settings(AI_STRATEGIC_CANDIDATES=5):
             self.ai._compute_best_move_worker(game_session, 7, (1, 2, 3))
 
         self.assertIsNotNone(self.ai._worker_result)
         self.assertTrue(self.ai._worker_result["is_valid"])
-        self.assertEqual(self.ai._worker_result["best_move"], candidate_2)
+        self.assertEqual(self.ai._worker_result["best_move"][:3],
+                         candidate_2[:3])
+        self.assertIsNone(self.ai._worker_result["best_move"].meeple)
         self.assertEqual(self.ai._worker_progress, 1.0)
         self.assertFalse(self.ai._worker_running)
 
@@ -126,6 +195,22 @@ class AIPlayerAdvancedTests(unittest.TestCase):
         self.assertIsNone(self.ai._ai_thinking_state)
         self.assertIsNone(self.ai._ai_thinking_data)
 
+    def test_failed_placement_restores_the_card_rotation(self):
+        """Both move forms should turn the card back when placement fails."""
+        for best_move in ((5, 6, 270, MagicMock()),
+                          Move(5, 6, 270, MagicMock())):
+            current_card = _RotatingCardStub(rotation=90)
+            game_session = MagicMock()
+            game_session.get_current_card.return_value = current_card
+            game_session.play_card.return_value = False
+            self.ai._ai_thinking_data = {"best_move": best_move}
+
+            self.ai._execute_best_move(game_session)
+
+            self.assertEqual(current_card.rotation, 90)
+            game_session.play_card.assert_called_once_with(5, 6)
+            game_session.skip_current_action.assert_called_once_with()
+
     def test_handle_figure_placement_advanced_places_best_scored_meeple(self):
         """Advanced meeple logic should choose the highest-scoring open structure."""
         card = MagicMock()
@@ -164,6 +249,628 @@ class AIPlayerAdvancedTests(unittest.TestCase):
         game_session.next_turn.assert_called_once()
         game_session.skip_current_action.assert_not_called()
 
+    def test_execute_move_places_card_and_meeple(self):
+        """A searched move should be played as card, meeple and turn end."""
+        current_card = MagicMock()
+        game_session = MagicMock()
+        game_session.get_current_card.return_value = current_card
+        game_session.play_card.return_value = True
+        game_session.play_figure.return_value = True
+
+        with patch.object(self.ai, "_check_and_score_completed_structures"):
+            self.ai._execute_move(game_session,
+                                  Move(4, 5, 270, MagicMock(), "N"))
+
+        current_card.set_rotation.assert_called_once_with(270)
+        game_session.play_card.assert_called_once_with(4, 5)
+        game_session.set_turn_phase.assert_called_once_with(2)
+        game_session.play_figure.assert_called_once_with(self.ai, 4, 5, "N")
+        game_session.next_turn.assert_called_once()
+        game_session.skip_current_action.assert_not_called()
+
+    def test_joint_actions_pair_placements_with_best_meeple(self):
+        """Joint actions should add the best spot and skip hopeless ones."""
+        ai = AIPlayer("AI_NORMAL_Joint", 0, "blue", "NORMAL")
+        session = self.make_session(ai)
+        other = session.players[1]
+        session.current_player = other
+        road = self.make_road()
+        definition = road.get_definition()
+        for x in range(5, 9):
+            session.apply_move(Move(x, 5, 0, definition), other)
+        session.current_player = ai
+        session.current_card = Card.from_definition(definition)
+        state_hash = session.get_state_hash()
+        snapshot = _TurnSnapshot(session)
+
+        actions = ai._search_joint_actions(
+            session, snapshot, [(-1000.0, Placement(9, 5, 0, definition)),
+                                (100.0, Placement(4, 5, 0, definition))],
+            CancellationToken(), None)
+
+        (best_value, best), (_, pruned) = actions
+        self.assertEqual(best[:3], (4, 5, 0))
+        self.assertIn(best.meeple, ("N", "E", "S", "W"))
+        self.assertGreater(best_value, 100.0)
+        self.assertEqual(pruned[:3], (9, 5, 0))
+        self.assertIsNone(pruned.meeple)
+        self.assertEqual(session.get_state_hash(), state_hash)
+        self.assertEqual(snapshot.get().get_state_hash(), state_hash)
+
+    def test_simulation_rates_the_structures_a_placement_joins(self):
+        """Stage-2 evaluators should read the structures next to the cell."""
+        ai = AIPlayer("AI_NORMAL_Joined", 0, "blue", "NORMAL")
+        session = self.make_session(ai)
+        cap = Card("fake.png", {"N": "field", "E": "city", "S": "field",
+                                "W": "field"}, {}, [])
+        definition = cap.get_definition()
+        session.apply_move(Move(5, 5, 0, definition, "E"), ai)
+        session.current_player = ai
+
+        closing = Placement(6, 5, 180, definition)
+        joined, open_sides = placement_scoring.joined_structures(
+            session, 6, 5, definition, closing.rotation_index)
+        city = session.structure_map[(5, 5, "E")]
+
+        self.assertIn(city, joined.values())
+        self.assertEqual(open_sides, 3)
+        # Turning the city away joins nothing, which used to score the same.
+        self.assertGreater(
+            ai._simulate_placement_advanced(session, closing),
+            ai._simulate_placement_advanced(session,
+                                            Placement(6, 5, 90, definition)))
+
+    def test_process_pool_scores_match_thread_scores(self):
+        """Sharded scoring in pool processes should merge back in order."""
+        ai = AIPlayer("AI_HARD_Pool", 0, "blue", "HARD")
+        session = self.make_started_session(ai)
+        placements = ai._get_multiple_valid_placements(
+            session, session.current_card)
+        self.addCleanup(shutdown_process_pool)
+
+        in_thread = ai._score_placements(session, placements)
+        in_processes = ai._score_placements_in_processes(
+            session, placements, 2)
+
+        self.assertEqual(in_processes, in_thread)
+
+    def test_process_pool_scores_with_the_tuned_preset(self):
+        """Pool processes should score with a preset set by set_preset."""
+        ai = AIPlayer("AI_HARD_Tuned", 0, "blue", "HARD")
+        session = self.make_started_session(ai)
+        placements = ai._get_multiple_valid_placements(
+            session, session.current_card)
+        self.addCleanup(shutdown_process_pool)
+        default_scores = ai._score_placements(session, placements)
+        ai.set_preset(dict(AIPreset.HARD, center_penalty=20.0,
+                           structure_connection=100))
+
+        in_thread = ai._score_placements(session, placements)
+        in_processes = ai._score_placements_in_processes(
+            session, placements, 2)
+
+        self.assertNotEqual(in_thread, default_scores)
+        self.assertEqual(in_processes, in_thread)
+
+    def test_process_pool_gives_up_at_the_deadline(self):
+        """Unfinished shards should not hold the turn past its deadline."""
+        ai = AIPlayer("AI_HARD_Late", 0, "blue", "HARD")
+        session = self.make_started_session(ai)
+        placements = ai._get_multiple_valid_placements(
+            session, session.current_card)
+        pool = MagicMock()
+        pool.submit.side_effect = lambda *args: Future()
+        cancelled = CancellationToken()
+        cancelled.cancel("test")
+
+        started = time.perf_counter()
+        with patch("models.ai_player.get_process_pool", return_value=pool):
+            late = ai._score_placements_in_processes(
+                session, placements, 2, CancellationToken(), started + 0.05)
+            stopped = ai._score_placements_in_processes(
+                session, placements, 2, cancelled)
+
+        self.assertIsNone(late)
+        self.assertIsNone(stopped)
+        self.assertLess(time.perf_counter() - started, 1.0)
+
+    def test_process_pool_starts_when_the_setting_is_applied(self):
+        """Applying AI_PROCESS_WORKERS should spawn the pool ahead of a turn."""
+        previous = settings_manager.get("AI_PROCESS_WORKERS", 0)
+        with patch("models.ai_player.get_process_pool") as get_pool:
+            settings_manager.set("AI_PROCESS_WORKERS", 3, temporary=True)
+            settings_manager.set("AI_PROCESS_WORKERS", previous,
+                                 temporary=True)
+
+        get_pool.assert_called_once_with(3)
+        self.assertEqual(get_pool.return_value.submit.call_count, 3)
+
+    def test_batch_scoring_backends_agree(self):
+        """NumPy and pure-Python batch scoring should give the same scores."""
+        ai = AIPlayer("AI_HARD_Batch", 0, "blue", "HARD")
+        session = self.make_started_session(ai)
+        card = session.current_card
+        placements = [(x, y, rotation, card.get_definition())
+                      for x, y, rotation in sorted(
+                          session.game_board.get_matching_placements(card))]
+
+        features = placement_scoring.extract_features(session, ai, placements)
+        vectorized = placement_scoring.score_placements(
+            session, ai, ai._preset, "mid", placements)
+        with patch.object(placement_scoring, "np", None):
+            plain = placement_scoring.score_placements(
+                session, ai, ai._preset, "mid", placements)
+
+        self.assertTrue(all(row[0] > 0 for row in features.linear))
+        self.assertEqual(len(vectorized), len(placements))
+        for expected, actual in zip(plain, vectorized):
+            self.assertAlmostEqual(expected, actual)
+
+    def test_structure_stats_rate_roads_by_closed_edges(self):
+        """Structure statistics should be shared per board state."""
+        ai = AIPlayer("AI_HARD_Stats", 0, "blue", "HARD")
+        session = self.make_session(ai, opponent=False)
+        road = self.make_road()
+        session.apply_move(Move(5, 5, 0, road.get_definition()))
+
+        stats = ai._get_structure_stats(session)
+        road_structure = session.structure_map[(5, 5, "E")]
+        self.assertEqual(stats.get(road_structure).completion_ratio, 0.0)
+        self.assertIs(ai._get_structure_stats(session), stats)
+
+        session.apply_move(Move(6, 5, 0, road.get_definition()))
+        updated = ai._get_structure_stats(session)
+
+        self.assertIsNot(updated, stats)
+        self.assertEqual(updated.get(road_structure).completion_ratio, 0.5)
+        self.assertEqual(updated.get(road_structure).size, 4)
+
+    def test_pattern_table_matches_neighbor_terrains(self):
+        """Local patterns should only depend on the terrains around a cell."""
+        road = self.make_road()
+        city = Card("fake.png", {"N": "field", "E": "road", "S": "field",
+                                 "W": "city"}, None, [])
+        definition = road.get_definition()
+        sessions = []
+        for x in (5, 7):
+            session = GameSession([], no_init=True)
+            session.apply_move(Move(x, 5, 0, definition))
+            sessions.append(session)
+
+        signatures = [
+            pattern_table.neighbor_signature(session.get_game_board(), x + 1,
+                                             5)
+            for session, x in zip(sessions, (5, 7))
+        ]
+        pattern = pattern_table.PATTERN_TABLE.lookup(definition, 0,
+                                                     signatures[0])
+        joined, open_sides = placement_scoring.joined_structures(
+            sessions[0], 6, 5, definition, 0)
+
+        self.assertEqual(signatures[0], signatures[1])
+        self.assertIn((-1, 0, "E"), pattern.continued)
+        self.assertEqual(open_sides, pattern.open_sides)
+        self.assertEqual(open_sides, 3)
+        self.assertIs(joined[(5, 5, "E")], sessions[0].structure_map[(5, 5,
+                                                                       "E")])
+        self.assertNotEqual(
+            pattern_table.PATTERN_TABLE.lookup(city.get_definition(), 0,
+                                               signatures[0]).open_sides,
+            pattern.open_sides)
+
+    def test_anytime_search_publishes_deepest_completed_depth(self):
+        """The anytime search should deepen within budget and honor deadlines."""
+        ai = AIPlayer("AI_HARD_Anytime", 0, "blue", "HARD")
+        session = self.make_session(ai)
+        road = self.make_road()
+        session.apply_move(Move(5, 5, 0, road.get_definition()))
+        session.current_player = ai
+        session.current_card = Card.from_definition(road.get_definition())
+        session.cards_deck = [
+            Card.from_definition(road.get_definition()) for _ in range(3)
+        ]
+        state_hash = session.get_state_hash()
+
+        with patch.object(GameSession, "deserialize",
+                          wraps=GameSession.deserialize) as deserialize:
+            ai.start(session, 10000)
+            ai._worker_future.result(timeout=10)
+        result = ai.best_so_far()
+
+        # The joint action search and the deeper search share one snapshot.
+        self.assertEqual(deserialize.call_count, 1)
+        self.assertEqual(result["depth"], 2)
+        self.assertTrue(result["is_valid"])
+        self.assertEqual(session.get_state_hash(), state_hash)
+
+        ai.start(session, 0)
+        ai._worker_future.result(timeout=10)
+        result = ai.best_so_far()
+
+        self.assertEqual(result["depth"], 0)
+        self.assertIsNotNone(result["best_move"])
+
+    def test_search_skips_a_depth_it_cannot_finish_in_time(self):
+        """A depth projected past the deadline should not be started."""
+        ai = AIPlayer("AI_EXPERT_Deepen", 0, "blue", "EXPERT")
+        session = self.make_session(ai)
+        candidates = [(1.0, Move(1, 0, 0, None)), (0.0, Move(0, 1, 0, None))]
+
+        def search(snapshot, candidates, depth, cancel_token, deadline):
+            # Every depth searches 20 times the positions of the one before.
+            ai._count_nodes(len(candidates) * 20**(depth - 1))
+            time.sleep(0.02)
+            return candidates[depth % 2][1]
+
+        for budget_s, depth in ((0.2, 2), (30.0, 3)):
+            result = {"depth": 1}
+            with patch.object(ai, "_search_candidates",
+                              side_effect=search) as searched:
+                ai._deepen_search(_TurnSnapshot(session),
+                                  ai._worker_turn_token,
+                                  CancellationToken(),
+                                  time.perf_counter() + budget_s, candidates,
+                                  result)
+            self.assertEqual(searched.call_count, depth - 1)
+            self.assertEqual(result["depth"], depth)
+
+    def test_move_waits_for_stopped_worker_and_drops_its_evaluations(self):
+        """A stopped worker must leave the live session before the move."""
+        session = MagicMock()
+        session.get_turn_state_token.return_value = (1, 2, 0)
+        ai = AIPlayer("AI_HARD_Deadline", 0, "blue", "HARD")
+        future = Future()
+        ai._worker_future = future
+        ai._worker_result = {
+            "turn_token": ai._worker_turn_token,
+            "turn_state": (1, 2, 0),
+            "is_valid": True,
+            "best_move": Move(1, 1, 0, None),
+            "depth": 1
+        }
+
+        with _patch_settings(AI_USE_SIMULATION=True), \
+                patch.object(ai, "_execute_best_move") as execute:
+            ai.play_turn(session)
+            execute.assert_not_called()
+            future.set_result(None)
+            ai.play_turn(session)
+        execute.assert_called_once_with(session)
+
+        token = CancellationToken()
+        token.cancel("deadline")
+        ai._worker_cache_context.cancel_token = token
+        ai._store_transposition(session, ("key", ), 1.0, ())
+        self.assertEqual(len(ai._transpositions), 0)
+
+    def test_search_without_result_at_deadline_plays_a_simple_move(self):
+        """The deadline should hold even before the first depth publishes."""
+        session = MagicMock()
+        session.get_turn_state_token.return_value = (1, 2, 0)
+        ai = AIPlayer("AI_HARD_Late", 0, "blue", "HARD")
+        future = Future()
+        ai._worker_future = future
+        ai._worker_running = True
+        ai._search_turn_state = (1, 2, 0)
+        ai._search_deadline = time.perf_counter() - 1.0
+
+        with _patch_settings(AI_USE_SIMULATION=True), \
+                patch.object(ai, "_play_turn_simple") as play_simple, \
+                patch.object(ai, "start") as start:
+            ai.play_turn(session)
+            play_simple.assert_not_called()
+            self.assertTrue(ai._search_token.is_cancelled())
+            future.set_result(None)
+            ai.play_turn(session)
+        play_simple.assert_called_once_with(session)
+        start.assert_not_called()
+
+    def test_failed_search_falls_back_to_a_simple_move(self):
+        """A worker exception should be logged and end in a simple move."""
+        session = MagicMock()
+        session.get_turn_state_token.return_value = (1, 2, 0)
+        ai = AIPlayer("AI_HARD_Failing", 0, "blue", "HARD")
+
+        with patch.object(ai, "_get_structure_stats",
+                          side_effect=RuntimeError("broken")), \
+                self.assertLogs("models.ai_player", "ERROR"):
+            ai.start(session, 1000)
+            ai._worker_future.result(timeout=10)
+        self.assertFalse(ai.best_so_far()["is_valid"])
+
+        with _patch_settings(AI_USE_SIMULATION=True), \
+                patch.object(ai, "_play_turn_simple") as play_simple, \
+                patch.object(ai, "start") as start:
+            ai.play_turn(session)
+        play_simple.assert_called_once_with(session)
+        start.assert_not_called()
+        self.assertIsNone(ai.best_so_far())
+
+        before = get_worker_metrics()
+        with self.assertLogs("models.ai_player", "ERROR"):
+            submit_worker(CancellationToken(),
+                          MagicMock(side_effect=RuntimeError("broken"),
+                                    __name__="job")).result(timeout=10)
+        self.assertEqual(get_worker_metrics()["failed"], before["failed"] + 1)
+
+    def test_cancelled_search_stops_early_and_is_counted(self):
+        """Cancelling a search should end the pooled worker within budget."""
+        ai = AIPlayer("AI_MCTS_Cancel", 0, "blue", "MCTS")
+        session = self.make_session(ai)
+        road = self.make_road()
+        session.apply_move(Move(5, 5, 0, road.get_definition()))
+        session.current_player = ai
+        session.current_card = Card.from_definition(road.get_definition())
+        session.cards_deck = [
+            Card.from_definition(road.get_definition()) for _ in range(5)
+        ]
+        before = get_worker_metrics()
+
+        ai.start(session, 60000)
+        future = ai._worker_future
+        time.sleep(0.05)
+        started = time.perf_counter()
+        ai.cancel_work("session replaced")
+        future.result(timeout=10)
+        metrics = get_worker_metrics()
+
+        self.assertLess(time.perf_counter() - started, 5.0)
+        self.assertIsNone(ai.best_so_far())
+        self.assertFalse(ai.is_thinking())
+        self.assertEqual(metrics["cancelled"], before["cancelled"] + 1)
+        self.assertEqual(
+            metrics["reasons"].get("session replaced", 0),
+            before["reasons"].get("session replaced", 0) + 1)
+        self.assertGreater(metrics["cancelled_ms"], before["cancelled_ms"])
+
+    def test_mcts_search_follows_the_seeded_random_generator(self):
+        """Reseeding the global generator should reseed the MCTS tree."""
+        ai = AIPlayer("AI_MCTS_Seeded", 0, "blue", "MCTS")
+        session = self.make_session(ai)
+        road = self.make_road()
+        session.apply_move(Move(5, 5, 0, road.get_definition()))
+        session.current_player = ai
+        session.current_card = Card.from_definition(road.get_definition())
+
+        draws = []
+        for seed in (7, 7, 8):
+            random.seed(seed)
+            with patch("models.ai_player.MCTSSearch") as search:
+                search.return_value.iterations = 0
+                ai.start(session, 1000)
+                ai._worker_future.result(timeout=10)
+            draws.append(search.call_args.args[1].random())
+
+        self.assertEqual(draws[0], draws[1])
+        self.assertNotEqual(draws[0], draws[2])
+
+    def test_evaluations_survive_moves_that_do_not_touch_them(self):
+        """Cached evaluations should be dropped only when they changed."""
+        ai = AIPlayer("AI_NORMAL_Cache", 0, "blue", "NORMAL")
+        session = self.make_session(ai)
+        other = session.players[1]
+        session.current_player = other
+        road = self.make_road()
+        definition = road.get_definition()
+        for x in range(5, 9):
+            session.apply_move(Move(x, 5, 0, definition), other)
+        placement = Placement(4, 5, 0, definition)
+        score = ai._simulate_placement_advanced(session, placement)
+        (_, dependencies), = ai._transpositions.entries(session).values()
+        self.assertEqual([key for key, _, _ in dependencies], [(5, 5, "W")])
+
+        session.apply_move(Move(8, 4, 0, definition), other)
+        ai.invalidate_evaluation_cache()
+        self.assertEqual(ai._simulate_placement_advanced(session, placement),
+                         score)
+        self.assertEqual(ai.get_evaluation_cache_stats()["hits"], 1)
+
+        session.apply_move(Move(9, 5, 0, definition), other)
+        ai.invalidate_evaluation_cache()
+        ai._simulate_placement_advanced(session, placement)
+        stats = ai.get_evaluation_cache_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["invalidations"], 1)
+        self.assertEqual(stats["entries"], 1)
+
+        # A snapshot keeps its own entries, which go away with it.
+        snapshot = GameSession.deserialize(session.serialize())
+        ai.invalidate_evaluation_cache()
+        ai._simulate_placement_advanced(snapshot, placement)
+        self.assertEqual(ai.get_evaluation_cache_stats()["entries"], 2)
+        del snapshot
+        gc.collect()
+        ai.invalidate_evaluation_cache()
+        ai._simulate_placement_advanced(session, placement)
+        stats = ai.get_evaluation_cache_stats()
+        self.assertEqual(stats["entries"], 1)
+        self.assertEqual(stats["hits"], 2)
+
+    def test_pondered_placements_survive_unrelated_moves(self):
+        """Pondering should be reused only where the board did not change."""
+        ai = AIPlayer("AI_NORMAL_Ponder", 0, "blue", "NORMAL")
+        session = self.make_session(ai)
+        other = session.players[1]
+        session.current_player = other
+        road = self.make_road()
+        for x in range(5, 9):
+            session.apply_move(Move(x, 5, 0, road.get_definition()), other)
+        session.current_player = other
+        session.cards_deck = [Card.from_definition(road.get_definition())]
+        ai.set_preset(dict(AIPreset.NORMAL, completion_bonus=400,
+                           structure_connection=60))
+
+        ai._ponder_worker(GameSession, session.serialize(), {
+            id(structure): (structure, structure.get_version())
+            for structure in session.structures
+        }, CancellationToken())
+        session.apply_move(Move(9, 5, 0, road.get_definition()), other)
+        card = Card.from_definition(road.get_definition())
+        pondered = ai._take_pondered(session, card)
+
+        self.assertTrue(pondered)
+        self.assertIn((5, 4, 0), pondered)
+        self.assertNotIn((9, 5, 0), pondered)
+        self.assertNotIn((8, 4, 0), pondered)
+        for placement in ai._get_multiple_valid_placements(session, card):
+            if placement[:3] in pondered:
+                ai._invalidate_evaluation_cache()
+                self.assertEqual(
+                    pondered[placement[:3]].simulated_score,
+                    ai._simulate_placement_advanced(session, placement))
+
+
+class MCTSSearchTests(unittest.TestCase):
+    """Validate the Monte Carlo tree search on small boards."""
+
+    @staticmethod
+    def _city_cap() -> Card:
+        return Card("fake.png", {
+            "N": "field",
+            "E": "city",
+            "S": "field",
+            "W": "field"
+        }, {}, [])
+
+    def test_search_prefers_completing_own_city_and_restores_session(self):
+        """The last tile should close the searching player's city."""
+        session = GameSession([], no_init=True)
+        alice = AIPlayer("AI_MCTS_Alice", 0, "blue", "MCTS")
+        bob = AIPlayer("AI_MCTS_Bob", 1, "red", "MCTS")
+        session.players = [alice, bob]
+        session.current_player = alice
+        start = self._city_cap()
+        session.game_board.place_card(start, 2, 2)
+        session.last_placed_card = start
+        session.detect_structures()
+        self.assertTrue(session.play_figure(alice, 2, 2, "E"))
+        session.current_card = self._city_cap()
+        before = (session.get_state_hash(), len(session.structures))
+
+        search = MCTSSearch(session, random.Random(3))
+        move = search.search(budget_ms=60000, max_iterations=300)
+
+        self.assertEqual((move.x, move.y, move.rotation), (3, 2, 180))
+        self.assertEqual(search.iterations, 300)
+        self.assertEqual((session.get_state_hash(), len(session.structures)),
+                         before)
+        self.assertEqual(alice.get_score(), 0)
+
+
+class EndgameSolverTests(unittest.TestCase):
+    """Validate the exact search of the last tiles."""
+
+    def test_solver_finds_optimal_last_turns_and_restores_session(self):
+        """Closing the own city and claiming its field should be optimal."""
+        session = GameSession([], no_init=True)
+        alice = AIPlayer("AI_HARD_Alice", 0, "blue", "HARD")
+        bob = AIPlayer("AI_HARD_Bob", 1, "red", "HARD")
+        session.players = [alice, bob]
+        session.current_player = alice
+        start = MCTSSearchTests._city_cap()
+        session.game_board.place_card(start, 2, 2)
+        session.last_placed_card = start
+        session.detect_structures()
+        self.assertTrue(session.play_figure(alice, 2, 2, "E"))
+        session.current_card = MCTSSearchTests._city_cap()
+        session.cards_deck = [MCTSSearchTests._city_cap()]
+        before = (session.get_state_hash(), len(session.structures))
+
+        self.assertIsNone(EndgameSolver(session, alice).solve(budget_ms=0))
+        result = EndgameSolver(session, alice).solve(budget_ms=60000)
+
+        self.assertEqual(result.move[:3] + (result.move.meeple, ),
+                         (3, 2, 180, "S"))
+        # 4 for the city and 3 for its field; Bob can only claim the
+        # other field next to the completed city.
+        self.assertEqual(result.expected_scores, (7.0, 3.0))
+        self.assertEqual(result.margin, 4.0)
+        self.assertEqual((session.get_state_hash(), len(session.structures)),
+                         before)
+        self.assertEqual(alice.get_score(), 0)
+
+
+class TournamentTests(unittest.TestCase):
+    """Tests for the headless self-play runner."""
+
+    def test_headless_game_finishes_and_summarizes(self):
+        """A seeded game should finish without the UI and be rated."""
+        budget = settings_manager.get("AI_TURN_BUDGET_MS")
+        with patch.object(tournament, "MAX_TURNS", 200):
+            result = tournament.play_game(1, 11, ["AI_EASY_", "AI_NORMAL_"],
+                                          {"AI_USE_SIMULATION": True,
+                                           "AI_TURN_BUDGET_MS": 50})
+        summary = tournament.summarize([result])
+
+        self.assertEqual(settings_manager.get("AI_TURN_BUDGET_MS"), budget)
+
+        self.assertEqual([player["entry"] for player in result["players"]],
+                         ["AI_NORMAL_", "AI_EASY_"])
+        self.assertTrue(all(player["nodes"] > 0
+                            for player in result["players"]))
+        self.assertEqual(
+            result["turns"],
+            sum(len(player["turn_ms"]) for player in result["players"]))
+        self.assertAlmostEqual(
+            sum(stats["win_rate"] for stats in summary.values()), 1.0)
+        winner = max(result["players"], key=lambda player: player["score"])
+        loser = min(result["players"], key=lambda player: player["score"])
+        if winner["score"] != loser["score"]:
+            self.assertGreater(summary[winner["entry"]]["elo"],
+                               summary[loser["entry"]]["elo"])
+        self.assertLessEqual(summary["AI_EASY_"]["p50_ms"],
+                             summary["AI_EASY_"]["max_ms"])
+
+    def test_preset_tuner_steps_and_resumes(self):
+        """A tuning generation should move the mean and survive a restart."""
+        tuner = tuning.PresetTuner("EASY", pairs=1, games=1, seed=5,
+                                   settings={"AI_TURN_BUDGET_MS": 50})
+        summary = tuner.step(None)
+        resumed = tuning.PresetTuner("EASY", seed=5)
+        resumed.load_state(json.loads(json.dumps(tuner.state())))
+
+        self.assertEqual(summary["games"], 2)
+        self.assertEqual(resumed.generation, 1)
+        self.assertEqual(resumed.preset(), tuner.preset())
+        self.assertEqual(sorted(tuner.preset()), sorted(AIPreset.EASY))
+        extreme = tuning.build_preset(AIPreset.EASY, tuner.parameters,
+                                      [-10.0] * len(tuner.parameters))
+        self.assertEqual(extreme["completion_bonus"], 0)
+        self.assertIsInstance(extreme["conservation_threshold"], int)
+        self.assertEqual(extreme["search_depth"],
+                         AIPreset.EASY["search_depth"])
+        with self.assertRaises(ValueError):
+            tuning.PresetTuner("NORMAL").load_state(tuner.state())
+
+    def test_players_load_the_written_preset_file(self):
+        """A preset file written by the tuner should replace the preset."""
+        tuned = dict(AIPreset.HARD, completion_bonus=321)
+        broken = dict(AIPreset.EASY)
+        del broken["size_bonus"]
+        with tempfile.TemporaryDirectory() as directory:
+            tuning.write_preset_file(
+                os.path.join(directory, "tuned_presets.json"),
+                {"HARD": tuned, "EASY": broken})
+            # Relative paths resolve against the fixed directory, not the
+            # working directory.
+            with patch("models.ai_player.TUNED_PRESETS_DIR", directory), \
+                    _patch_settings(AI_TUNED_PRESETS="tuned_presets.json"), \
+                    self.assertLogs("models.ai_player", "WARNING"):
+                hard = AIPlayer("AI_HARD_Tuned", 0, "blue", "HARD")
+                easy = AIPlayer("AI_EASY_Untuned", 1, "red", "EASY")
+
+        self.assertEqual(hard._preset, tuned)
+        self.assertIs(easy._preset, AIPreset.EASY)
+        self.assertEqual(
+            tuning.PresetTuner("HARD").settings["AI_TUNED_PRESETS"], "")
+
+    def test_tuned_presets_are_opt_in(self):
+        """Games and tournaments should play the built-in presets by default."""
+        self.assertEqual(settings.AI_TUNED_PRESETS, "")
+        with patch("tournament.play_game", return_value={}) as play_game:
+            list(tournament.run_tournament(1, ["AI_EASY_", "AI_HARD_"]))
+        self.assertEqual(play_game.call_args.args[3]["AI_TUNED_PRESETS"], "")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,6 +6,7 @@ structures, and game state serialization/deserialization.
 """
 
 import os
+import subprocess
 import sys
 import unittest
 from unittest.mock import patch
@@ -17,8 +18,11 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 from models.card import Card
 from models.game_board import GameBoard
 from models.game_session import GameSession
+from models.move import Move
 from models.player import Player
 from models.structure import Structure
+from models.tile_definition import edge_signature
+from utils.player_colors import PLAYER_COLOR_RGB
 
 
 EDGE_TERRAINS = ["field", "road", "city"]
@@ -86,20 +90,6 @@ class DummyCityCard:
 class GameLogicTests(unittest.TestCase):
     """Test suite for placement, structures, scoring, and persistence."""
 
-    @classmethod
-    def setUpClass(cls):
-        """Patch pygame image loading/scaling for headless deterministic testing."""
-        cls.load_patcher = patch("pygame.image.load", return_value=object())
-        cls.scale_patcher = patch("pygame.transform.scale", side_effect=lambda img, size: img)
-        cls.load_patcher.start()
-        cls.scale_patcher.start()
-
-    @classmethod
-    def tearDownClass(cls):
-        """Stop pygame patches created in setUpClass."""
-        cls.load_patcher.stop()
-        cls.scale_patcher.stop()
-
     def make_card(self, terrains, connections=None, features=None, is_starting_card=False):
         """Create a test card with deterministic fake image path."""
         return Card(
@@ -116,6 +106,57 @@ class GameLogicTests(unittest.TestCase):
         session.last_placed_card = card
         session.detect_structures()
 
+    def make_session(self, player_count=1):
+        """Create an empty session with Alice (and Bob) seated and Alice on turn."""
+        players = [Player("Alice", "blue", 0), Player("Bob", "red", 1)][:player_count]
+        session = GameSession([], no_init=True)
+        session.players = players
+        session.current_player = players[0]
+        return session
+
+    def make_road_ends(self):
+        """Create the west and east end of a road that closes in two cards."""
+        left_end = self.make_card({"N": "field", "E": "road", "S": "field", "W": "field"}, {"E": ["E"]})
+        right_end = self.make_card({"N": "field", "E": "field", "S": "field", "W": "road"}, {"W": ["W"]})
+        return left_end, right_end
+
+    def make_straight_road(self, north="field"):
+        """Create a card with a road running from west to east and ``north`` above it."""
+        return self.make_card(
+            {"N": north, "E": "road", "S": "field", "W": "road"},
+            {"E": ["W"], "W": ["E"]},
+        )
+
+
+    def test_models_run_headless_without_pygame(self):
+        """The rules engine must import and play without pygame available."""
+        src_path = os.path.join(os.path.dirname(__file__), "..", "src")
+        script = (
+            "import sys\n"
+            "sys.modules['pygame'] = None\n"
+            "from models.card import Card\n"
+            "from models.game_session import GameSession\n"
+            "from models.player import Player\n"
+            "session = GameSession([], no_init=True)\n"
+            "session.players = [Player('Alice', 'blue', 0)]\n"
+            "card = Card('fake.png', {'N': 'field', 'E': 'field', 'S': 'field', 'W': 'field'}, {}, [])\n"
+            "session.game_board.place_card(card, 2, 2)\n"
+            "session.last_placed_card = card\n"
+            "session.detect_structures()\n"
+            "assert session.play_figure(session.players[0], 2, 2, 'N')\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script],
+                                cwd=src_path,
+                                capture_output=True,
+                                text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_player_tint_uses_the_shared_palette(self):
+        """Structure tints should follow edits of the palette the theme shares."""
+        with patch.dict(PLAYER_COLOR_RGB, {"blue": (1, 2, 3)}):
+            self.assertEqual(
+                Player("Alice", "blue", 0).get_color_with_alpha(99),
+                (1, 2, 3, 99))
 
     def test_card_serialization_preserves_starting_card_flag(self):
         """Card serialization/deserialization should preserve starting-card metadata."""
@@ -128,6 +169,44 @@ class GameLogicTests(unittest.TestCase):
 
         self.assertTrue(restored.get_is_starting_card())
 
+    def test_deck_copies_share_one_tile_definition(self):
+        """Every copy of a tile type should reference the same definition."""
+        session = GameSession([], no_init=True)
+        deck = session._generate_cards_deck()
+
+        by_image = {}
+        for card in deck:
+            by_image.setdefault(card.image_path, set()).add(id(card.get_definition()))
+
+        self.assertGreater(len(deck), len(by_image))
+        self.assertTrue(all(len(ids) == 1 for ids in by_image.values()))
+
+    def test_rotated_card_round_trip_keeps_definition_and_terrains(self):
+        """Deserializing a rotated card restores its orientation on the shared definition."""
+        card = self.make_straight_road(north="city")
+        card.rotate()
+
+        restored = Card.deserialize(card.serialize())
+
+        self.assertIs(restored.get_definition(), card.get_definition())
+        self.assertEqual(restored.rotation, 90)
+        self.assertEqual(restored.get_terrains(), card.get_terrains())
+
+    def test_rotation_reuses_precomputed_layouts(self):
+        """Rotating a card should switch between the definition's shared layouts."""
+        card = self.make_straight_road(north="city")
+        definition = card.get_definition()
+
+        card.set_rotation(270)
+        self.assertIs(card.get_terrains(), definition.rotations[3].terrains)
+        self.assertEqual(card.get_terrains()["W"], "city")
+
+        card.rotate()
+        self.assertEqual(card.rotation, 0)
+        self.assertIs(card.get_terrains(), definition.rotations[0].terrains)
+        with self.assertRaises(TypeError):
+            card.get_terrains()["N"] = "road"
+
     def test_shuffle_places_starting_card_on_top(self):
         """Deck shuffle should keep a starting card at the top for initial placement."""
         session = GameSession([], no_init=True)
@@ -150,6 +229,69 @@ class GameLogicTests(unittest.TestCase):
         card = self.make_card({"N": "field", "E": "field", "S": "field", "W": "field"})
         self.assertFalse(board.validate_card_placement(card, 2, 2))
 
+    def test_board_frontier_tracks_empty_neighbors_of_placed_cards(self):
+        """Frontier should hold exactly the empty in-bounds cells next to placed cards."""
+        board = GameBoard(grid_size=5)
+        field = {"N": "field", "E": "field", "S": "field", "W": "field"}
+        board.place_card(self.make_card(field), 0, 0)
+        self.assertEqual(board.get_frontier(), {(1, 0), (0, 1)})
+
+        board.place_card(self.make_card(field), 1, 0)
+        self.assertEqual(board.get_frontier(), {(0, 1), (1, 1), (2, 0)})
+        self.assertEqual(board.get_placed_card_count(), 2)
+
+    def test_board_replacing_a_card_keeps_derived_state(self):
+        """Placing over an occupied cell should behave like removing the old card first."""
+        board = GameBoard(grid_size=5)
+        field = {"N": "field", "E": "field", "S": "field", "W": "field"}
+        board.place_card(self.make_card(dict(field, C="monastery")), 2, 2)
+        board.place_card(self.make_card(field), 3, 2)
+        expected_hash = board.get_zobrist_hash()
+
+        replacement = self.make_card(field)
+        board.place_card(replacement, 3, 2)
+
+        self.assertEqual(board.get_monastery_neighborhood_count(2, 2), 2)
+        self.assertEqual(board.get_placed_card_count(), 2)
+        self.assertIs(board.get_card(2, 2).neighbors["E"], replacement)
+        self.assertEqual(board.get_zobrist_hash(), expected_hash)
+
+        board.place_card(self.make_card(field), 2, 2)
+        self.assertIsNone(board.get_monastery_neighborhood_count(2, 2))
+
+    def test_matching_placements_agree_with_side_by_side_comparison(self):
+        """Edge-signature matching should accept exactly the placements whose touching sides agree."""
+        board = GameBoard(grid_size=5)
+        board.place_card(self.make_card({"N": "city", "E": "road", "S": "field", "W": "road"}), 2, 2)
+        board.place_card(self.make_card({"N": "field", "E": "field", "S": "road", "W": "road"}), 3, 2)
+        card = self.make_card({"N": "road", "E": "city", "S": "road", "W": "field"})
+
+        expected = set()
+        for x, y in board.get_frontier():
+            for rotation in (0, 90, 180, 270):
+                card.set_rotation(rotation)
+                neighbors = {"N": (x, y - 1), "E": (x + 1, y), "S": (x, y + 1), "W": (x - 1, y)}
+                if all(
+                    board.get_card(nx, ny) is None
+                    or board.get_card(nx, ny).get_terrains()[board.get_opposite_direction(d)]
+                    == card.get_terrains()[d]
+                    for d, (nx, ny) in neighbors.items()
+                ):
+                    expected.add((x, y, rotation))
+
+        self.assertTrue(expected)
+        self.assertEqual(board.get_matching_placements(card), expected)
+        self.assertTrue(board.has_matching_placement(card))
+        self.assertEqual(set(board.iter_frontier()), board.get_frontier())
+
+    def test_edge_signatures_do_not_depend_on_load_order(self):
+        """Terrain codes are fixed, so signatures agree between processes."""
+        self.assertEqual(
+            edge_signature({"N": "city", "E": "road", "S": "field", "W": None}),
+            0x1234)
+        with self.assertRaises(ValueError):
+            edge_signature({"N": "river", "E": "road", "S": "field", "W": None})
+
     def test_validate_card_placement_rejects_all_mismatched_terrain_combinations(self):
         """Placement must fail for every distinct touching terrain mismatch pair."""
         for anchor_terrain in EDGE_TERRAINS:
@@ -219,6 +361,27 @@ class GameLogicTests(unittest.TestCase):
         structure.check_completion()
         self.assertTrue(structure.get_is_completed())
 
+    def test_score_completed_structures_only_checks_last_placement(self):
+        """End-of-turn scoring should only consider structures touched by the last card."""
+        session = GameSession([], no_init=True)
+        left_end, right_end = self.make_road_ends()
+        distant_city = self.make_card({"N": "field", "E": "field", "S": "city", "W": "field"}, {"S": ["S"]})
+
+        self.place_and_detect(session, distant_city, 0, 0)
+        self.place_and_detect(session, left_end, 2, 2)
+        owner = DummyOwner("RoadOwner")
+        session.structure_map[(2, 2, "E")].set_figures([DummyFigure(owner)])
+        self.assertEqual(session.structure_map[(2, 2, "E")].get_open_edge_count(), 1)
+
+        self.place_and_detect(session, right_end, 3, 2)
+        with patch.object(Structure, "check_completion", autospec=True,
+                          side_effect=Structure.check_completion) as check:
+            session.score_completed_structures()
+
+        checked_types = {call.args[0].get_structure_type() for call in check.call_args_list}
+        self.assertNotIn("City", checked_types)
+        self.assertEqual(owner.score, 2)
+
     def test_structure_detection_and_completion_city(self):
         """City becomes complete once all exposed city edges are connected."""
         session = GameSession([], no_init=True)
@@ -293,6 +456,45 @@ class GameLogicTests(unittest.TestCase):
         monastery_structure.check_completion()
         self.assertTrue(monastery_structure.get_is_completed())
 
+    def test_monastery_score_counts_every_occupied_neighbor(self):
+        """Monastery score should count diagonal tiles even without the orthogonal tile between them."""
+        session = GameSession([], no_init=True)
+        field = {"N": "field", "E": "field", "S": "field", "W": "field"}
+        monastery = self.make_card({**field, "C": "monastery"})
+
+        self.place_and_detect(session, monastery, 2, 2)
+        self.place_and_detect(session, self.make_card(field), 1, 2)
+        self.place_and_detect(session, self.make_card(field), 1, 1)
+
+        structure = session.structure_map[(2, 2, "C")]
+        self.assertEqual(session.game_board.get_monastery_neighborhood_count(2, 2), 3)
+        self.assertEqual(structure.get_score(game_session=session), 3)
+
+    def test_field_indexes_completed_cities_it_borders(self):
+        """Completing a city should register it with every field touching its cards."""
+        session = GameSession([], no_init=True)
+        north_city = self.make_card(
+            {"N": "field", "E": "field", "S": "city", "W": "field"},
+            {"N": ["E", "W"], "E": ["N", "W"], "W": ["N", "E"]},
+        )
+        south_city = self.make_card(
+            {"N": "city", "E": "field", "S": "field", "W": "field"},
+            {"E": ["S", "W"], "S": ["E", "W"], "W": ["E", "S"]},
+        )
+
+        self.place_and_detect(session, north_city, 2, 1)
+        field = session.structure_map[(2, 1, "N")]
+        self.assertEqual(field.get_adjacent_completed_cities(), set())
+
+        self.place_and_detect(session, south_city, 2, 2)
+        session.score_completed_structures()
+
+        city = session.structure_map[(2, 2, "N")]
+        self.assertTrue(city.get_is_completed())
+        self.assertEqual(field.get_adjacent_completed_cities(), {city})
+        self.assertEqual(session.structure_map[(2, 2, "S")].get_adjacent_completed_cities(), {city})
+        self.assertEqual(field.get_score(game_session=session), 3)
+
     def test_structure_detection_field_is_never_completed(self):
         """Even a fully enclosed field is never considered completed."""
         session = GameSession([], no_init=True)
@@ -352,6 +554,32 @@ class GameLogicTests(unittest.TestCase):
         self.assertEqual(len(merged_w.get_figures()), 2)
         self.assertCountEqual(merged_w.get_figures(), [left_figure, right_figure])
 
+    def test_structure_tracker_keeps_aggregates_across_merges(self):
+        """Merged structures should sum card, open-edge and per-owner figure counts."""
+        session = GameSession([], no_init=True)
+        bridge = {"N": "field", "E": "city", "S": "field", "W": "city"}
+
+        self.place_and_detect(session, self.make_card(bridge, {"E": ["W"], "W": ["E"]}, ["coat"]), 1, 2)
+        self.place_and_detect(session, self.make_card(bridge, {"E": ["W"], "W": ["E"]}), 3, 2)
+        owner = DummyOwner("CityOwner")
+        session.structure_map[(1, 2, "E")].set_figures([DummyFigure(owner)])
+        session.structure_map[(3, 2, "W")].set_figures([DummyFigure(owner)])
+
+        self.place_and_detect(session, self.make_card(bridge, {"E": ["W"], "W": ["E"]}), 2, 2)
+
+        city = session.structure_map[(2, 2, "E")]
+        self.assertEqual(city.get_card_count(), 3)
+        self.assertEqual(city.get_coat_count(), 1)
+        self.assertEqual(city.get_open_edge_count(), 2)
+        self.assertEqual(city.get_figure_counts(), {owner: 2})
+        self.assertEqual(
+            len([s for s in session.structures if s.get_structure_type() == "City"]), 1
+        )
+
+        city.set_figures([])
+        restored = GameSession.deserialize(session.serialize())
+        self.assertEqual(restored.structure_map[(1, 2, "W")].get_open_edge_count(), 2)
+
     def test_structure_detection_merges_road_and_merge_can_complete_and_score(self):
         """Merging two road fragments can complete the road and award points."""
         session = GameSession([], no_init=True)
@@ -632,6 +860,122 @@ class GameLogicTests(unittest.TestCase):
         self.assertEqual(owner.score, 3)
         self.assertEqual(session.placed_figures, [])
 
+    def test_apply_move_and_undo_restore_session_state(self):
+        """A scoring move should be fully reverted by undo, including meeples and score."""
+        session = self.make_session(2)
+        alice, bob = session.players
+        left_end, right_end = self.make_road_ends()
+        self.place_and_detect(session, left_end, 2, 2)
+        before = (
+            session.game_board.get_frontier(),
+            len(session.structures),
+            session.structure_map[(2, 2, "E")].get_open_edge_count(),
+            len(alice.get_figures()),
+        )
+
+        token = session.apply_move(Move(3, 2, 0, right_end.get_definition(), "W"))
+
+        road = session.structure_map[(3, 2, "W")]
+        self.assertIs(road, session.structure_map[(2, 2, "E")])
+        self.assertTrue(road.get_is_completed())
+        self.assertEqual(alice.get_score(), 2)
+        self.assertEqual(len(alice.get_figures()), before[3])
+        self.assertIs(session.current_player, bob)
+
+        session.undo(token)
+
+        self.assertIsNone(session.game_board.get_card(3, 2))
+        self.assertNotIn((3, 2, "W"), session.structure_map)
+        self.assertEqual(
+            (
+                session.game_board.get_frontier(),
+                len(session.structures),
+                session.structure_map[(2, 2, "E")].get_open_edge_count(),
+                len(alice.get_figures()),
+            ),
+            before,
+        )
+        self.assertFalse(session.structure_map[(2, 2, "E")].get_is_completed())
+        self.assertEqual(alice.get_score(), 0)
+        self.assertIs(session.current_player, alice)
+
+    def test_undo_of_consecutive_moves_restores_structures(self):
+        """Lookups while moves are still to be undone must not compress paths."""
+        session = self.make_session()
+        self.place_and_detect(session, self.make_straight_road(), 2, 2)
+        definition = self.make_straight_road().get_definition()
+        start_road = session.structure_map[(2, 2, "E")]
+
+        sides = [(x, 2, side) for x in (2, 3) for side in ("E", "W")]
+        first = session.apply_move(Move(3, 2, 0, definition))
+        second = session.apply_move(Move(4, 2, 0, definition))
+        for key in sides:
+            session.structure_map.get(key)
+        session.undo(second)
+        session.undo(first)
+
+        self.assertIs(session.structure_map[(2, 2, "E")], start_road)
+        self.assertIs(session.structure_map[(2, 2, "W")], start_road)
+        self.assertEqual(start_road.get_card_count(), 1)
+        self.assertIn(start_road, session.structures)
+
+    def test_scored_meeples_leave_placed_figures(self):
+        """A meeple returned by scoring must not stay listed as placed, even after undo."""
+        session = self.make_session()
+        alice = session.players[0]
+        left_end, right_end = self.make_road_ends()
+        self.place_and_detect(session, left_end, 2, 2)
+        self.assertTrue(session.play_figure(alice, 2, 2, "E"))
+        placed = list(session.placed_figures)
+
+        token = session.apply_move(Move(3, 2, 0, right_end.get_definition()))
+        self.assertEqual(session.placed_figures, [])
+        session.undo(token)
+        self.assertEqual(session.placed_figures, placed)
+
+        self.place_and_detect(session, right_end, 3, 2)
+        session.score_completed_structures()
+        self.assertEqual(alice.get_score(), 2)
+        self.assertEqual(session.placed_figures, [])
+
+    def test_apply_move_rejects_claimed_meeple_position_without_side_effects(self):
+        """An illegal meeple move should raise and leave the board untouched."""
+        session = self.make_session()
+        alice = session.players[0]
+        self.place_and_detect(session, self.make_straight_road(), 2, 2)
+        self.assertTrue(session.play_figure(alice, 2, 2, "E"))
+        definition = self.make_straight_road().get_definition()
+
+        with self.assertRaises(ValueError):
+            session.apply_move(Move(3, 2, 0, definition, "W"))
+
+        self.assertIsNone(session.game_board.get_card(3, 2))
+        self.assertEqual(session.game_board.get_placed_card_count(), 1)
+        self.assertEqual(len(session.structures), 3)
+
+    def test_state_hash_ignores_move_order_and_is_restored_by_undo(self):
+        """Zobrist hashes should depend on the position, not on how it was reached."""
+        definition = self.make_straight_road().get_definition()
+        hashes = []
+        for order in (((1, 2), (3, 2)), ((3, 2), (1, 2))):
+            session = self.make_session()
+            self.place_and_detect(session, Card.from_definition(definition), 2, 2)
+            initial = session.get_state_hash()
+            tokens = [session.apply_move(Move(x, y, 0, definition)) for x, y in order]
+            hashes.append(session.get_state_hash())
+            self.assertNotEqual(hashes[-1], initial)
+            with_meeple = session.apply_move(Move(4, 2, 0, definition, "E"))
+            self.assertNotEqual(session.get_board_hash(), session.game_board.get_zobrist_hash())
+            session.undo(with_meeple)
+            self.assertEqual(session.get_state_hash(), hashes[-1])
+            restored = GameSession.deserialize(session.serialize())
+            self.assertEqual(restored.get_state_hash(), hashes[-1])
+            for token in reversed(tokens):
+                session.undo(token)
+            self.assertEqual(session.get_state_hash(), initial)
+
+        self.assertEqual(hashes[0], hashes[1])
+
     def test_game_session_serialization_deserialization_round_trip(self):
         """Serialized session should deserialize with equivalent core state (network-safe)."""
         session = GameSession([], no_init=True, lobby_completed=False, network_mode="remote")